@@ -1,177 +1,2871 @@
 import os
 import re
 import csv
+import glob
 import json
 import argparse
+import bisect
+import calendar
 import configparser
+import fnmatch
+import cProfile
+import functools
+import hashlib
+import io
+import mmap
+import posixpath
+import pstats
+import sqlite3
+import sys
+import tarfile
+import threading
+import time
+import tracemalloc
+import unicodedata
+import zipfile
+import zlib
 import requests
+import requests.adapters
+from array import array
 from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 from urllib.parse import urlparse
 import xml.etree.ElementTree as ET
 
+
+class Metrics:
+    """Instrumentarea unei rulări: timpii fazelor, contoare, latențe HTTP și erori.
+    
+    Metodele pot fi apelate din mai multe fire (clientul GitHub, modul batch).
+    Erorile per fișier sunt afișate ca înainte și păstrate ca evenimente structurate,
+    numărate pe categorii; rezultatul complet se scrie ca trace JSON.
+    """
+
+    # Limitele superioare (secunde) ale intervalelor histogramei de latență HTTP
+    LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+    # Numărul maxim de evenimente păstrate; contoarele rămân exacte
+    MAX_EVENTS = 1000
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.started = time.time()
+        self.phases = {}
+        self.counters = defaultdict(int)
+        self.timers = defaultdict(float)
+        self.latency_histogram = [0] * (len(self.LATENCY_BUCKETS) + 1)
+        self.http_status = defaultdict(int)
+        self.error_counts = defaultdict(int)
+        self.events = []
+        self.profile = None
+
+    @contextmanager
+    def phase(self, name):
+        """Măsoară timpul real și timpul CPU al firului care rulează o fază.
+        
+        Apelurile repetate se adună; în modul batch fazele proiectelor rulează pe fire
+        diferite, deci timpul real este cumulat, iar CPU-ul fiecărui fir e numărat o dată.
+        Timpul CPU al proceselor de scanare se adaugă separat, cu `add_worker_cpu`.
+        """
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - wall_start
+            cpu = time.thread_time() - cpu_start
+            with self.lock:
+                stats = self._phase_stats(name)
+                stats["wall"] += wall
+                stats["cpu"] += cpu
+                stats["calls"] += 1
+
+    def _phase_stats(self, name):
+        return self.phases.setdefault(name, {"wall": 0.0, "cpu": 0.0, "worker_cpu": 0.0, "calls": 0})
+
+    def add_worker_cpu(self, name, seconds):
+        """Adaugă la o fază timpul CPU consumat în procesele din pool."""
+        with self.lock:
+            self._phase_stats(name)["worker_cpu"] += seconds
+
+    def count(self, name, value=1):
+        with self.lock:
+            self.counters[name] += value
+
+    def add_time(self, name, seconds):
+        with self.lock:
+            self.timers[name] += seconds
+
+    def observe_http(self, seconds, status, size):
+        """Înregistrează o cerere HTTP: latență, cod de stare și octeți primiți."""
+        bucket = bisect.bisect_left(self.LATENCY_BUCKETS, seconds)
+        with self.lock:
+            self.counters["http_requests"] += 1
+            self.counters["http_bytes"] += size
+            self.timers["http"] += seconds
+            self.latency_histogram[bucket] += 1
+            self.http_status[status] += 1
+
+    def record_error(self, kind, message, path=None):
+        """Păstrează o eroare ca eveniment structurat, fără a o afișa."""
+        with self.lock:
+            self.error_counts[kind] += 1
+            if len(self.events) < self.MAX_EVENTS:
+                self.events.append({
+                    "kind": kind,
+                    "path": path,
+                    "message": message,
+                    "time": round(time.time() - self.started, 3),
+                })
+
+    def error(self, kind, message, path=None):
+        """Afișează mesajul de eroare și îl înregistrează ca eveniment."""
+        print(message)
+        self.record_error(kind, message, path)
+
+    def record_github(self, github_client):
+        """Preia contoarele clientului GitHub: pauzele de rate-limit și cache-ul HTTP."""
+        limiter = github_client.rate_limiter
+        with self.lock:
+            self.counters["rate_limit_waits"] = limiter.waits
+            self.timers["rate_limit_wait"] = limiter.wait_time
+            cache = github_client.http_cache
+            if cache is not None:
+                self.counters["http_cache_hits"] = cache.hits
+                self.counters["http_cache_revalidated"] = cache.revalidated
+                self.counters["http_cache_misses"] = cache.misses
+                self.counters["http_cache_evictions"] = cache.evictions
+
+    def to_dict(self):
+        """Conținutul trace-ului JSON."""
+        with self.lock:
+            histogram = [
+                {"le": bound, "count": count}
+                for bound, count in zip(self.LATENCY_BUCKETS + (None,), self.latency_histogram)
+            ]
+            trace = {
+                "started": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(self.started)),
+                "duration": round(time.time() - self.started, 6),
+                "phases": {name: dict(stats) for name, stats in self.phases.items()},
+                "counters": dict(self.counters),
+                "timers": dict(self.timers),
+                "http": {
+                    "latency_histogram": histogram,
+                    "status": {str(status): n for status, n in sorted(self.http_status.items())},
+                },
+                "errors": {"counts": dict(self.error_counts), "events": list(self.events)},
+            }
+        if self.profile is not None:
+            trace["profile"] = self.profile
+        return trace
+
+    def write_trace(self, output_file):
+        try:
+            with open(output_file, "w", encoding="utf-8") as f:
+                json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+            print(f"Trace-ul a fost scris în {output_file}")
+        except Exception as e:
+            print(f"Eroare la scrierea în fișierul {output_file}: {e}")
+
+    def summary(self):
+        """Rezumatul lizibil al rulării."""
+        # Copie, pentru ca citirea contoarelor lipsă să nu le adauge în trace
+        counters = defaultdict(int, self.counters)
+        lines = ["Faze (timp real / CPU fir / CPU procese pool):"]
+        for name, stats in self.phases.items():
+            lines.append(f"  {name:<20}{stats['wall']:>9.3f} s {stats['cpu']:>9.3f} s "
+                         f"{stats['worker_cpu']:>9.3f} s")
+        archives = f", {counters['archives_visited']} arhive" if counters["archives_visited"] else ""
+        lines.append(
+            f"Fișiere: {counters['files_visited']} vizitate{archives}, {counters['files_scanned']} scanate, "
+            f"{counters['bytes_read'] / 1024 / 1024:.1f} MB citiți; "
+            f"timp regex {self.timers['regex']:.3f} s"
+        )
+        if counters["scan_cache_hits"] or counters["scan_cache_misses"]:
+            lines.append(f"Cache scanare: {counters['scan_cache_hits']} hit-uri, "
+                         f"{counters['scan_cache_misses']} miss-uri")
+        if counters["http_requests"]:
+            average = self.timers["http"] / counters["http_requests"]
+            lines.append(f"HTTP: {counters['http_requests']} cereri, "
+                         f"{counters['http_bytes'] / 1024:.1f} KB, latență medie {average * 1000:.0f} ms, "
+                         f"{counters['rate_limit_waits']} pauze de rate-limit")
+        if self.error_counts:
+            details = ", ".join(f"{kind}: {n}" for kind, n in sorted(self.error_counts.items()))
+            lines.append(f"Erori: {sum(self.error_counts.values())} ({details})")
+        return "\n".join(lines)
+
+
+# Directoare care nu conțin niciodată surse sau manifeste utile (sintaxă .gitignore)
+DEFAULT_PRUNE_PATTERNS = [
+    ".git/",
+    ".svn/",
+    ".hg/",
+    "node_modules/",
+    "__pycache__/",
+    ".pio/build/",
+    ".vscode/",
+    ".idea/",
+]
+
+
+class IgnoreRules:
+    """Reguli de ignorare în stilul .gitignore, evaluate pe căi relative la rădăcina proiectului."""
+
+    def __init__(self, patterns=None):
+        # Fiecare regulă: (director de bază, regex compilat, negare, doar directoare)
+        self.rules = []
+        if patterns:
+            self.add_patterns(patterns)
+
+    @staticmethod
+    def _translate(pattern):
+        """Transformă un șablon .gitignore într-o expresie regulată."""
+        anchored = "/" in pattern
+        pattern = pattern.lstrip("/")
+        regex = ""
+        i = 0
+        while i < len(pattern):
+            c = pattern[i]
+            if c == "*":
+                if pattern[i:i + 3] == "**/":
+                    regex += "(?:.*/)?"
+                    i += 3
+                    continue
+                if pattern[i:i + 2] == "**":
+                    regex += ".*"
+                    i += 2
+                    continue
+                regex += "[^/]*"
+            elif c == "?":
+                regex += "[^/]"
+            elif c == "[":
+                end = pattern.find("]", i + 1)
+                if end == -1:
+                    regex += re.escape(c)
+                else:
+                    regex += "[" + pattern[i + 1:end].replace("!", "^", 1) + "]"
+                    i = end
+            else:
+                regex += re.escape(c)
+            i += 1
+        if not anchored:
+            regex = "(?:.*/)?" + regex
+        return re.compile(regex + "(?:/.*)?$")
+
+    def add_patterns(self, patterns, base=""):
+        """Adaugă șabloane; `base` este directorul (relativ) în care au fost definite."""
+        for line in patterns:
+            line = line.rstrip("\n\r")
+            if not line.strip() or line.startswith("#"):
+                continue
+            line = line.strip()
+            negate = line.startswith("!")
+            if negate:
+                line = line[1:]
+            dir_only = line.endswith("/")
+            line = line.rstrip("/")
+            if not line:
+                continue
+            self.rules.append((base, self._translate(line), negate, dir_only))
+
+    def add_gitignore(self, gitignore_path, base=""):
+        """Încarcă un fișier .gitignore aflat în directorul relativ `base`; ridică OSError la eșec."""
+        with open(gitignore_path, "r", encoding="utf-8", errors="replace") as f:
+            self.add_patterns(f.readlines(), base)
+
+    def is_ignored(self, rel_path, is_dir):
+        """Verifică dacă o cale relativă (separată prin '/') trebuie ignorată."""
+        ignored = False
+        for base, regex, negate, dir_only in self.rules:
+            if dir_only and not is_dir:
+                continue
+            if base:
+                if not rel_path.startswith(base + "/"):
+                    continue
+                path = rel_path[len(base) + 1:]
+            else:
+                path = rel_path
+            if regex.match(path):
+                ignored = not negate
+        return ignored
+
+
+ARCHIVE_EXTENSIONS = ('.zip', '.tar', '.tar.gz', '.tgz', '.tar.bz2', '.tbz2', '.tar.xz', '.txz')
+# Erorile de format ale arhivelor; sunt raportate ca OSError, la fel ca erorile de citire
+ARCHIVE_ERRORS = (zipfile.BadZipFile, tarfile.TarError, EOFError, zlib.error)
+
+
+def is_archive(path):
+    """True dacă numele fișierului are extensia unei arhive zip/tar."""
+    return path.lower().endswith(ARCHIVE_EXTENSIONS)
+
+
+def strip_archive_extension(name):
+    """Numele fără extensia de arhivă (de ex. "WLED-0.14.tar.gz" → "WLED-0.14")."""
+    lower = name.lower()
+    for extension in ARCHIVE_EXTENSIONS:
+        if lower.endswith(extension):
+            return name[:-len(extension)]
+    return name
+
+
+def _is_archive_file(path):
+    """True pentru o arhivă de pe disc sau pentru un membru-arhivă al altei arhive."""
+    if not is_archive(path):
+        return False
+    if os.path.isfile(path):
+        return True
+    container = _archive_containing(os.path.dirname(path))
+    if container is None:
+        return False
+    try:
+        return path[len(container) + 1:].replace(os.sep, "/") in ArchiveReader.open(container).members()
+    except OSError:
+        return False
+
+
+@functools.lru_cache(maxsize=4096)
+def _archive_containing(directory):
+    """Arhiva care conține directorul (virtual) `directory` sau None.
+    
+    Poate fi și o arhivă aflată în altă arhivă (`proiect.zip/.pio/libdeps/env/Bar.zip`).
+    """
+    current = directory
+    while current:
+        if _is_archive_file(current):
+            return current
+        parent = os.path.dirname(current)
+        if parent == current:
+            break
+        current = parent
+    return None
+
+
+def split_archive_path(path):
+    """Împarte o cale virtuală `arhivă.zip/membru` în (arhivă, membru cu "/").
+    
+    Returnează None pentru fișierele obișnuite; pentru arhiva însăși membrul este "".
+    """
+    if _is_archive_file(path):
+        return path, ""
+    archive_path = _archive_containing(os.path.dirname(path))
+    if archive_path is None:
+        return None
+    return archive_path, path[len(archive_path) + 1:].replace(os.sep, "/")
+
+
+@dataclass(frozen=True, slots=True)
+class MemberStat:
+    """Echivalentul lui os.stat_result pentru un membru de arhivă (câmpurile folosite de cache)."""
+
+    st_size: int
+    st_mtime_ns: int
+
+
+class ArchiveReader:
+    """Acces la membrii unei arhive zip/tar, fără extragere pe disc.
+    
+    Arhivele zip au un director central: listarea nu decomprimă nimic, iar membrii
+    sunt citiți individual, la cerere. Arhivele tar (de obicei comprimate) se pot
+    citi doar secvențial, așa că membrii relevanți (`keep`) sunt păstrați în
+    memorie chiar în trecerea de listare, până la `release`.
+    
+    O arhivă aflată în altă arhivă (de ex. `.pio/libdeps/<env>/*.zip` dintr-un
+    proiect arhivat) este citită din memorie, prin `io.BytesIO`, cu octeții
+    membrului primiți de la cititorul arhivei care o conține.
+    """
+
+    # Arhivele deschise în procesul curent, în ordinea folosirii (LRU):
+    # cale → ((mtime_ns, dimensiune), cititor)
+    _open = {}
+    _open_lock = threading.Lock()
+    MAX_OPEN = 64
+
+    def __init__(self, path, keep=None, container=None):
+        self.path = path
+        self.keep = keep
+        # (arhiva care o conține, membru) pentru arhivele aflate în altă arhivă
+        self.container = container
+        self.is_zip = path.lower().endswith(".zip")
+        self.pid = os.getpid()
+        self._members = None
+        self._data = {}
+        self._zip = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def open(cls, path):
+        """Cititorul unei arhive, refolosit cât timp fișierul (sau membrul) nu se schimbă."""
+        container = None
+        if not os.path.isfile(path):
+            outer = _archive_containing(os.path.dirname(path))
+            if outer is not None:
+                container = (outer, path[len(outer) + 1:].replace(os.sep, "/"))
+        st = cls.open(container[0]).stat(container[1]) if container else os.stat(path)
+        key = (st.st_mtime_ns, st.st_size)
+        with cls._open_lock:
+            entry = cls._open.get(path)
+            # După fork, fișierul deschis de părinte nu poate fi folosit (poziția de citire e comună)
+            if entry is not None and entry[0] == key and entry[1].pid == os.getpid():
+                cls._open[path] = cls._open.pop(path)
+                return entry[1]
+            if entry is not None:
+                cls._open.pop(path)[1].close()
+            # Arhivele din tar sunt păstrate la listare, ca să nu fie căutate cu încă o trecere
+            reader = cls(path, keep=lambda name: ProjectInventory.is_relevant(name) or is_archive(name),
+                         container=container)
+            cls._open[path] = (key, reader)
+            while len(cls._open) > cls.MAX_OPEN:
+                cls._open.pop(next(iter(cls._open)))[1].close()
+        return reader
+
+    @classmethod
+    def release(cls, paths):
+        """Eliberează conținutul păstrat și fișierele deschise ale arhivelor din `paths`.
+        
+        Lista membrilor rămâne în cache (modul watch o refolosește); citirile ulterioare
+        redeschid arhiva la nevoie.
+        """
+        with cls._open_lock:
+            readers = [cls._open[path][1] for path in paths if path in cls._open]
+        for reader in readers:
+            reader.close()
+
+    def close(self):
+        """Închide arhiva zip și renunță la membrii tar păstrați în memorie."""
+        with self._lock:
+            self._data = {}
+            if self._zip is not None:
+                self._zip.close()
+                self._zip = None
+
+    @staticmethod
+    def _tar_name(name):
+        return name[2:] if name.startswith("./") else name
+
+    def _source(self):
+        """Calea arhivei de pe disc sau conținutul ei în memorie, pentru zipfile/tarfile."""
+        if self.container is None:
+            return self.path
+        outer, member = self.container
+        return io.BytesIO(ArchiveReader.open(outer).read(member))
+
+    def _open_tar(self):
+        source = self._source()
+        if isinstance(source, str):
+            return tarfile.open(source, mode="r|*")
+        return tarfile.open(fileobj=source, mode="r|*")
+
+    def members(self):
+        """Fișierele obișnuite din arhivă: nume (cu "/") → MemberStat."""
+        with self._lock:
+            if self._members is None:
+                try:
+                    self._members = self._list_zip() if self.is_zip else self._list_tar()
+                except ARCHIVE_ERRORS as e:
+                    raise OSError(f"arhivă invalidă: {e}") from e
+        return self._members
+
+    def _list_zip(self):
+        self._zip = zipfile.ZipFile(self._source())
+        members = {}
+        for info in self._zip.infolist():
+            if not info.is_dir():
+                mtime = calendar.timegm(info.date_time)
+                members[info.filename] = MemberStat(info.file_size, mtime * 1_000_000_000)
+        return members
+
+    def _list_tar(self):
+        members = {}
+        with self._open_tar() as tar:
+            for info in tar:
+                if not info.isfile():
+                    continue
+                name = self._tar_name(info.name)
+                members[name] = MemberStat(info.size, int(info.mtime) * 1_000_000_000)
+                if self.keep is not None and self.keep(name.rpartition("/")[2]):
+                    self._data[name] = tar.extractfile(info).read()
+        return members
+
+    def stat(self, member):
+        try:
+            return self.members()[member]
+        except KeyError:
+            raise FileNotFoundError(f"{member} nu există în {self.path}") from None
+
+    def preloaded(self, member):
+        """Conținutul unui membru tar citit deja la listare (None pentru membrii zip)."""
+        return self._data.get(member)
+
+    def read(self, member):
+        """Conținutul unui membru, ca octeți."""
+        self.stat(member)
+        data = self._data.get(member)
+        if data is not None:
+            return data
+        try:
+            if self.is_zip:
+                with self._lock:
+                    if self._zip is None:
+                        self._zip = zipfile.ZipFile(self._source())
+                    return self._zip.read(member)
+            # Membru tar nepăstrat la listare: încă o trecere secvențială
+            with self._open_tar() as tar:
+                for info in tar:
+                    if info.isfile() and self._tar_name(info.name) == member:
+                        return tar.extractfile(info).read()
+        except ARCHIVE_ERRORS as e:
+            raise OSError(f"membru invalid {member}: {e}") from e
+        raise FileNotFoundError(f"{member} nu există în {self.path}")
+
+
+def read_file_bytes(file_path):
+    """Conținutul unui fișier de pe disc sau al unui membru de arhivă (cale `arhivă.zip/membru`)."""
+    location = split_archive_path(file_path)
+    if location is None:
+        with open(file_path, "rb") as f:
+            return f.read()
+    archive_path, member = location
+    return ArchiveReader.open(archive_path).read(member)
+
+
+def file_stat(file_path):
+    """os.stat pentru fișierele de pe disc, MemberStat pentru membrii arhivelor."""
+    location = split_archive_path(file_path)
+    if location is None:
+        return os.stat(file_path)
+    archive_path, member = location
+    return ArchiveReader.open(archive_path).stat(member)
+
+
+def preloaded_member(file_path):
+    """Conținutul deja citit al unui membru tar, de trimis proceselor de scanare (altfel None)."""
+    location = split_archive_path(file_path)
+    if location is None:
+        return None
+    archive_path, member = location
+    return ArchiveReader.open(archive_path).preloaded(member)
+
+
+def archive_project_root(path):
+    """Rădăcina unui proiect arhivat: directorul unic de pe primul nivel, dacă există.
+    
+    Arhivele de release conțin de obicei tot proiectul într-un singur director
+    (`WLED-main/...`); căile raportate sunt atunci aceleași ca pentru proiectul extras.
+    """
+    if not (is_archive(path) and os.path.isfile(path)):
+        return path
+    try:
+        members = ArchiveReader.open(path).members()
+    except OSError:
+        return path
+    tops = {name.partition("/")[0] if "/" in name else None for name in members}
+    if len(tops) == 1 and None not in tops:
+        return os.path.join(path, tops.pop())
+    return path
+
+
+class ProjectInventory:
+    """Inventarul fișierelor unui proiect, clasificat într-o singură parcurgere a arborelui."""
+
+    SOURCE_EXTENSIONS = ('.cpp', '.h', '.ino')
+    MANIFEST_NAMES = ('library.properties', 'library.json', 'package_index.json')
+
+    def __init__(self, root):
+        self.root = root
+        self.sources = []
+        # Perechi (nume manifest, cale), în ordinea parcurgerii
+        self.manifests = []
+        self.platformio_ini = None
+        self.platformio_metadata = []
+        self.dirs_visited = 0
+        self.dirs_pruned = 0
+        self.files_visited = 0
+        self.archives_visited = 0
+        # Arhivele citite (de eliberat după scanare, vezi `ArchiveReader.release`)
+        self.archives = []
+        # Tupluri (categorie, cale, mesaj) pentru directoarele, arhivele și fișierele
+        # .gitignore care nu au putut fi citite
+        self.errors = []
+        # (mtime_ns, dimensiune) pentru fișierele clasificate, doar cu `with_stats`
+        self.stats = {}
+
+    @staticmethod
+    def is_relevant(filename):
+        """True pentru fișierele pe care analiza le citește (surse, manifeste, platformio.ini)."""
+        return (filename.endswith(ProjectInventory.SOURCE_EXTENSIONS)
+                or filename in ProjectInventory.MANIFEST_NAMES
+                or filename == "platformio.ini"
+                or (filename.startswith("lib_deps_") and filename.endswith(".json")))
+
+    @classmethod
+    def build(cls, root, prune_patterns=None, respect_gitignore=False, with_stats=False,
+              scan_archives=True):
+        """Parcurge arborele o singură dată cu os.scandir și sortează fișierele pe categorii.
+        
+        Cu `with_stats` se păstrează și amprenta (mtime, dimensiune) a fiecărui fișier
+        relevant, folosită de modul watch pentru a detecta modificările. Rădăcina poate
+        fi și o arhivă (sau un director din ea); cu `scan_archives` sunt citite și
+        arhivele din arbore (de ex. din `.pio/libdeps` sau din cache-ul de pachete).
+        """
+        inventory = cls(root)
+        rules = IgnoreRules(DEFAULT_PRUNE_PATTERNS if prune_patterns is None else prune_patterns)
+        
+        location = split_archive_path(root)
+        if location is not None:
+            inventory._add_archive(location[0], "", rules, with_stats, scan_archives, member_root=location[1])
+            return inventory
+
+        # Stivă de (cale absolută, cale relativă); intrările sunt sortate pentru o ordine deterministă
+        stack = [(root, "")]
+        while stack:
+            dir_path, rel_dir = stack.pop()
+            inventory.dirs_visited += 1
+            try:
+                with os.scandir(dir_path) as it:
+                    entries = sorted(it, key=lambda e: e.name)
+            except OSError as e:
+                message = f"Eroare la citirea directorului {dir_path}: {e}"
+                print(message)
+                inventory.errors.append(("walk", dir_path, message))
+                continue
+
+            if respect_gitignore and any(e.name == ".gitignore" for e in entries):
+                gitignore_path = os.path.join(dir_path, ".gitignore")
+                try:
+                    rules.add_gitignore(gitignore_path, rel_dir)
+                except OSError as e:
+                    message = f"Eroare la citirea {gitignore_path}: {e}"
+                    print(message)
+                    inventory.errors.append(("read", gitignore_path, message))
+
+            subdirs = []
+            dir_manifests = []
+            for entry in entries:
+                rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if rules.is_ignored(rel_path, True):
+                            inventory.dirs_pruned += 1
+                        else:
+                            subdirs.append((entry.path, rel_path))
+                        continue
+                    if not entry.is_file():
+                        continue
+                except OSError:
+                    continue
+                inventory.files_visited += 1
+                if rules.rules and rules.is_ignored(rel_path, False):
+                    continue
+                if scan_archives and is_archive(entry.name):
+                    inventory._add_archive(entry.path, rel_path, rules, with_stats, scan_archives)
+                    continue
+                if entry.name in cls.MANIFEST_NAMES:
+                    dir_manifests.append((entry.name, entry.path))
+                elif not inventory._classify(entry.name, entry.path, rel_path):
+                    continue
+                if with_stats:
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    inventory.stats[entry.path] = (st.st_mtime_ns, st.st_size)
+
+            # În cadrul unui director, manifestele sunt procesate într-o ordine fixă
+            dir_manifests.sort(key=lambda m: cls.MANIFEST_NAMES.index(m[0]))
+            inventory.manifests.extend(dir_manifests)
+
+            # Inversăm pentru ca directoarele să fie vizitate în ordine alfabetică
+            stack.extend(reversed(subdirs))
+        return inventory
+
+    def _add_archive(self, archive_path, rel_prefix, rules, with_stats, scan_archives, member_root=""):
+        """Adaugă membrii relevanți ai unei arhive, cu căi virtuale `arhivă/membru`.
+        
+        `rel_prefix` este calea arhivei relativ la rădăcina inventarului, iar
+        `member_root` directorul din arhivă considerat rădăcină (pentru proiectele arhivate).
+        Cu `scan_archives` sunt citite și arhivele din arhivă, ca pe disc.
+        """
+        try:
+            reader = ArchiveReader.open(archive_path)
+            members = reader.members()
+        except OSError as e:
+            message = f"Eroare la citirea arhivei {archive_path}: {e}"
+            print(message)
+            self.errors.append(("walk", archive_path, message))
+            return
+        self.archives_visited += 1
+        self.archives.append(archive_path)
+        
+        prefix = member_root + "/" if member_root else ""
+        pruned_dirs = {}
+        dir_manifests = []
+        for name in sorted(members):
+            if not name.startswith(prefix):
+                continue
+            inner = name[len(prefix):]
+            directory, _, filename = inner.rpartition("/")
+            rel_path = f"{rel_prefix}/{inner}" if rel_prefix else inner
+            self.files_visited += 1
+            if rules.rules and (self._archive_dir_ignored(rules, rel_prefix, directory, pruned_dirs)
+                                or rules.is_ignored(rel_path, False)):
+                continue
+            path = os.path.join(archive_path, *name.split("/"))
+            if scan_archives and is_archive(filename):
+                self._add_archive(path, rel_path, rules, with_stats, scan_archives)
+                continue
+            if filename in self.MANIFEST_NAMES:
+                dir_manifests.append((directory.split("/"), self.MANIFEST_NAMES.index(filename), filename, path))
+            elif not self._classify(filename, path, rel_path):
+                continue
+            if with_stats:
+                st = members[name]
+                self.stats[path] = (st.st_mtime_ns, st.st_size)
+        
+        # Aceeași ordine ca la parcurgerea unui director: în adâncime, alfabetic, manifestele ordonate
+        dir_manifests.sort(key=lambda m: m[:2])
+        self.manifests.extend((filename, path) for _, _, filename, path in dir_manifests)
+
+    def _archive_dir_ignored(self, rules, rel_prefix, directory, memo):
+        """True dacă un director din arhivă (sau unul dintre părinții lui) este ignorat."""
+        if not directory:
+            return False
+        if directory not in memo:
+            parent = directory.rpartition("/")[0]
+            rel_dir = f"{rel_prefix}/{directory}" if rel_prefix else directory
+            parent_ignored = self._archive_dir_ignored(rules, rel_prefix, parent, memo)
+            ignored = parent_ignored or rules.is_ignored(rel_dir, True)
+            if ignored and not parent_ignored:
+                self.dirs_pruned += 1
+            memo[directory] = ignored
+        return memo[directory]
+
+    def _classify(self, filename, path, rel_path):
+        """Plasează un fișier în categoria corespunzătoare; False dacă nu are una."""
+        if filename.endswith(self.SOURCE_EXTENSIONS):
+            self.sources.append(path)
+        elif filename == "platformio.ini" and rel_path == "platformio.ini":
+            self.platformio_ini = path
+        elif (filename.startswith("lib_deps_") and filename.endswith(".json")
+              and rel_path.startswith(".platformio/")):
+            self.platformio_metadata.append(path)
+        else:
+            return False
+        return True
+
+
+# Un singur șablon combinat pentru surse: comentarii, literali și directive de preprocesor.
+# Lookahead-ul inițial permite motorului să sară rapid peste octeții irelevanți.
+SOURCE_TOKEN_PATTERN = re.compile(
+    rb'(?=[/"\'#])(?:'
+    rb'(?P<block>/\*.*?(?:\*/|\Z))'
+    rb'|(?P<line>//[^\n]*)'
+    rb'|(?P<string>"(?:\\.|[^"\\\n])*")'
+    rb"|(?P<char>'(?:\\.|[^'\\\n])*')"
+    # Argumentele unei directive se opresc la un comentariu (`/*`, `//`) din afara
+    # șirurilor, pentru ca ramura de comentariu să consume restul
+    rb'|#[ \t]*(?P<directive>[a-z]+)(?P<args>(?:"(?:\\.|[^"\\\n])*"?|[^\n/"]|/(?![*/]))*))',
+    re.DOTALL,
+)
+INCLUDE_ARGS_PATTERN = re.compile(rb'\s*[<"]([^>"]+)[>"]')
+VERSION_ARGS_PATTERN = re.compile(rb'\s+(\w+_VERSION|VERSION_\w+)\s+["\']?([0-9\.]+)["\']?')
+FALSE_CONDITION_PATTERN = re.compile(rb'\s*(?:0|false)\b')
+TRUE_CONDITION_PATTERN = re.compile(rb'\s*(?:1|true)\b')
+GITHUB_PATTERN = re.compile(rb'(?:https?://)?(?:www\.)?github\.com/([a-zA-Z0-9_-]+/[a-zA-Z0-9_-]+)')
+AUTHOR_PATTERN = re.compile(rb'@author\s+([^\n]+)')
+DESC_PATTERN = re.compile(rb'/\*\*\s*\n\s*\*\s*([^\n]+)')
+
+# Peste această dimensiune fișierele sursă sunt citite prin mmap
+MMAP_THRESHOLD = 4 * 1024 * 1024
+
+# Numărul maxim de fișiere trimise deodată unui proces din pool
+MAX_SCAN_CHUNK = 64
+
+# Stările unui bloc #if: ramura curentă e inactivă (#if 0), activă sigur (#if 1) sau necunoscută
+_COND_SKIP, _COND_DEAD, _COND_LIVE, _COND_OPEN = range(4)
+
+
+def _decode_bytes(data):
+    """Decodează tolerant un fragment: UTF-8, apoi Latin-1 (care nu eșuează niciodată)."""
+    try:
+        return data.decode("utf-8")
+    except UnicodeDecodeError:
+        return data.decode("latin-1")
+
+
+def scan_source_bytes(data):
+    r"""Scanează conținutul unui fișier sursă într-o singură trecere.
+    
+    Returnează include-urile și metadatele găsite (definiri de versiune, link GitHub,
+    autor, descriere). Comentariile și blocurile `#if 0` nu produc include-uri,
+    nici cele deschise pe linia unei directive:
+    
+    >>> scan_source_bytes(b'#include <a.h> /* start\n#include <b.h>\n*/\n#include <c.h>')["includes"]
+    ['a.h', 'c.h']
+    >>> scan_source_bytes(b'#define LIB_URL "https://github.com/o/r" // link\n')["github"]
+    'o/r'
+    """
+    result = {"includes": [], "versions": [], "github": "", "author": "", "description": ""}
+    conditions = []
+    skipping = False
+    
+    for match in SOURCE_TOKEN_PATTERN.finditer(data):
+        kind = match.lastgroup
+        if kind == "args":
+            # Directivele sunt valide doar la început de linie (după spații)
+            start = match.start()
+            if data[data.rfind(b"\n", 0, start) + 1:start].strip():
+                continue
+            directive = match.group("directive")
+            args = match.group("args")
+            
+            # Urmărim blocurile condiționale pentru a sări peste `#if 0`
+            if directive in (b"if", b"ifdef", b"ifndef"):
+                if skipping:
+                    conditions.append(_COND_DEAD)
+                elif directive == b"if" and FALSE_CONDITION_PATTERN.match(args):
+                    conditions.append(_COND_SKIP)
+                elif directive == b"if" and TRUE_CONDITION_PATTERN.match(args):
+                    conditions.append(_COND_LIVE)
+                else:
+                    conditions.append(_COND_OPEN)
+            elif directive in (b"elif", b"else"):
+                if conditions and conditions[-1] == _COND_SKIP:
+                    conditions[-1] = _COND_OPEN
+                elif conditions and conditions[-1] == _COND_LIVE:
+                    conditions[-1] = _COND_DEAD
+            elif directive == b"endif":
+                if conditions:
+                    conditions.pop()
+            skipping = bool(conditions) and conditions[-1] in (_COND_SKIP, _COND_DEAD)
+            if skipping:
+                continue
+            
+            if directive == b"include":
+                inc = INCLUDE_ARGS_PATTERN.match(args)
+                if inc:
+                    result["includes"].append(_decode_bytes(inc.group(1)))
+            elif directive == b"define":
+                version = VERSION_ARGS_PATTERN.match(args)
+                if version:
+                    result["versions"].append(
+                        (_decode_bytes(version.group(1)), _decode_bytes(version.group(2)))
+                    )
+            text = args
+        elif skipping or kind == "char":
+            continue
+        else:
+            text = match.group(kind)
+            if kind == "block":
+                if not result["description"]:
+                    desc = DESC_PATTERN.match(text)
+                    if desc:
+                        result["description"] = _decode_bytes(desc.group(1)).strip()
+                if not result["author"]:
+                    author = AUTHOR_PATTERN.search(text)
+                    if author:
+                        result["author"] = _decode_bytes(author.group(1)).strip().rstrip("*/").strip()
+            elif kind == "line" and not result["author"]:
+                author = AUTHOR_PATTERN.search(text)
+                if author:
+                    result["author"] = _decode_bytes(author.group(1)).strip()
+        
+        # Link-urile GitHub pot apărea în comentarii, șiruri sau directive
+        if not result["github"] and b"github.com" in text:
+            github = GITHUB_PATTERN.search(text)
+            if github:
+                result["github"] = _decode_bytes(github.group(1))
+    
+    return result
+
+
+def content_digest(data):
+    """Amprenta conținutului unui fișier, folosită de cache-ul de scanare."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def scan_source_file(file_path, known_digest=None, stats=None, data=None):
+    """Citește un fișier sursă ca octeți și îl scanează cu `scan_source_bytes`.
+    
+    Fișierele mari (de ex. header-e generate cu tablouri de octeți) sunt mapate în
+    memorie cu mmap, fără a fi copiate integral într-un obiect Python. Membrii
+    arhivelor sunt citiți direct din arhivă, dacă `data` nu conține deja octeții lor.
+    Returnează (rezultat, amprentă); dacă amprenta coincide cu `known_digest`,
+    conținutul nu s-a schimbat și rezultatul este None. Dacă `stats` este un
+    dicționar, în el se notează octeții citiți și timpul petrecut în regex.
+    """
+    if data is None and split_archive_path(file_path) is not None:
+        data = read_file_bytes(file_path)
+    if data is not None:
+        if stats is not None:
+            stats["bytes"] = len(data)
+        digest = content_digest(data)
+        if digest == known_digest:
+            return None, digest
+        return _timed_scan(data, stats), digest
+    
+    with open(file_path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if stats is not None:
+            stats["bytes"] = size
+        if size >= MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                digest = content_digest(data)
+                if digest == known_digest:
+                    return None, digest
+                return _timed_scan(data, stats), digest
+        data = f.read()
+    digest = content_digest(data)
+    if digest == known_digest:
+        return None, digest
+    return _timed_scan(data, stats), digest
+
+
+def _timed_scan(data, stats):
+    if stats is None:
+        return scan_source_bytes(data)
+    start = time.perf_counter()
+    result = scan_source_bytes(data)
+    stats["regex_time"] = time.perf_counter() - start
+    return result
+
+
+def _scan_source_worker(file_path, known_digest=None, data=None):
+    """Punct de intrare pentru procesele din pool; erorile sunt returnate, nu ridicate.
+    
+    `stats["cpu_time"]` este timpul CPU al procesului care a scanat fișierul.
+    """
+    stats = {}
+    cpu_start = time.process_time()
+    try:
+        result, digest = scan_source_file(file_path, known_digest, stats, data)
+        return result, digest, None, stats
+    except OSError as e:
+        return None, None, str(e), stats
+    finally:
+        stats["cpu_time"] = time.process_time() - cpu_start
+
+
+def read_library_properties(file_path):
+    """Citește câmpurile unui fișier library.properties (fără secțiuni)."""
+    config = configparser.ConfigParser()
+    # Adaugă o secțiune implicită (library.properties nu are secțiuni)
+    content = '[global]\n' + read_file_bytes(file_path).decode('utf-8')
+    config.read_string(content)
+    return dict(config["global"])
+
+
+def read_json_manifest(file_path):
+    """Citește un manifest JSON (library.json, lib_deps_*.json)."""
+    return json.loads(read_file_bytes(file_path).decode('utf-8'))
+
+
+def read_package_index(file_path):
+    """Extrage perechile (nume, versiune) ale uneltelor dintr-un package_index.json."""
+    data = json.loads(read_file_bytes(file_path).decode('utf-8'))
+    tools = []
+    for package in data.get("packages", []):
+        for platform in package.get("platforms", []):
+            for tool_dep in platform.get("toolsDependencies", []):
+                tools.append([tool_dep.get("name", ""), tool_dep.get("version", "")])
+    return tools
+
+
+def default_cache_dir():
+    """Directorul implicit pentru cache-urile persistente ale analizorului."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.environ.get("LOCALAPPDATA")
+    if not base:
+        base = os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "libscan")
+
+
+def _code_fingerprint(code, digest):
+    """Adaugă la `digest` bytecode-ul, constantele și numele folosite de `code`."""
+    digest.update(code.co_code)
+    digest.update(" ".join(code.co_names).encode())
+    for const in code.co_consts:
+        if hasattr(const, "co_code"):
+            # Funcțiile imbricate au propriul obiect de cod; repr-ul lor conține adrese
+            _code_fingerprint(const, digest)
+        else:
+            digest.update(repr(const).encode())
+
+
+@functools.lru_cache(maxsize=None)
+def parser_fingerprint():
+    """Amprenta codului de extragere: tiparele regex și funcțiile de scanare/citire.
+
+    Orice modificare a lor (inclusiv trecerea la altă versiune de Python, care schimbă
+    bytecode-ul) produce o amprentă nouă și invalidează cache-ul de rezultate.
+    """
+    digest = hashlib.sha1()
+    for pattern in (SOURCE_TOKEN_PATTERN, INCLUDE_ARGS_PATTERN, VERSION_ARGS_PATTERN,
+                    FALSE_CONDITION_PATTERN, TRUE_CONDITION_PATTERN, GITHUB_PATTERN,
+                    AUTHOR_PATTERN, DESC_PATTERN):
+        digest.update(pattern.pattern)
+        digest.update(str(pattern.flags).encode())
+    for func in (_decode_bytes, scan_source_bytes, read_library_properties,
+                 read_json_manifest, read_package_index):
+        _code_fingerprint(func.__code__, digest)
+    return digest.hexdigest()[:16]
+
+
+class ScanCache:
+    """Cache persistent (SQLite) cu rezultatele extragerii pentru fiecare fișier.
+    
+    O intrare este validă cât timp dimensiunea și mtime-ul fișierului coincid; altfel
+    conținutul este comparat după amprentă, iar fișierul e reanalizat doar dacă s-a
+    schimbat efectiv. Versiunea cache-ului combină `SCHEMA_VERSION` cu amprenta
+    codului de extragere (`parser_fingerprint`), deci orice modificare a scanerului
+    invalidează automat tot cache-ul.
+    """
+
+    SCHEMA_VERSION = 1
+
+    def __init__(self, db_path, project_dir):
+        self.db_path = db_path
+        self.project_dir = project_dir
+        self.hits = 0
+        self.misses = 0
+        self.seen = set()
+        # Scrierile sunt grupate și aplicate într-o singură tranzacție la închidere,
+        # pentru ca mai multe analize simultane să nu se blocheze reciproc
+        self.pending_updates = []
+        self.pending_stores = []
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self.conn = sqlite3.connect(db_path, timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self._init_schema()
+
+    def _init_schema(self):
+        """Creează tabelele și golește cache-ul dacă versiunea parserului diferă."""
+        version = f"{self.SCHEMA_VERSION}.{parser_fingerprint()}"
+        with self.conn:
+            self.conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+            row = self.conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+            if row is None or row[0] != version:
+                self.conn.execute("DROP TABLE IF EXISTS files")
+                self.conn.execute("INSERT OR REPLACE INTO meta VALUES ('version', ?)", (version,))
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS files ("
+                " project TEXT, path TEXT, kind TEXT, size INTEGER, mtime_ns INTEGER,"
+                " digest TEXT, result TEXT, PRIMARY KEY (project, path, kind))"
+            )
+
+    def lookup(self, rel_path, kind, st):
+        """Returnează (rezultat, amprentă) pentru un fișier.
+        
+        Rezultatul e None dacă fișierul a fost modificat de la ultima scanare; amprenta
+        stocată poate fi folosită apoi pentru a verifica dacă și conținutul s-a schimbat.
+        """
+        self.seen.add((rel_path, kind))
+        row = self.conn.execute(
+            "SELECT size, mtime_ns, digest, result FROM files WHERE project = ? AND path = ? AND kind = ?",
+            (self.project_dir, rel_path, kind),
+        ).fetchone()
+        if row is None:
+            return None, None
+        size, mtime_ns, digest, result = row
+        if size == st.st_size and mtime_ns == st.st_mtime_ns:
+            self.hits += 1
+            return json.loads(result), digest
+        return None, digest
+
+    def revalidate(self, rel_path, kind, st):
+        """Marchează ca valid un fișier atins dar nemodificat și returnează rezultatul stocat."""
+        self.hits += 1
+        self.pending_updates.append((st.st_size, st.st_mtime_ns, self.project_dir, rel_path, kind))
+        row = self.conn.execute(
+            "SELECT result FROM files WHERE project = ? AND path = ? AND kind = ?",
+            (self.project_dir, rel_path, kind),
+        ).fetchone()
+        return json.loads(row[0])
+
+    def store(self, rel_path, kind, st, digest, result):
+        """Salvează rezultatul extragerii pentru un fișier."""
+        self.misses += 1
+        self.pending_stores.append(
+            (self.project_dir, rel_path, kind, st.st_size, st.st_mtime_ns, digest, json.dumps(result))
+        )
+
+    def close(self):
+        """Elimină intrările fișierelor care nu mai există și salvează modificările."""
+        stale = [
+            (path, kind)
+            for path, kind in self.conn.execute(
+                "SELECT path, kind FROM files WHERE project = ?", (self.project_dir,)
+            )
+            if (path, kind) not in self.seen
+        ]
+        with self.conn:
+            self.conn.executemany(
+                "DELETE FROM files WHERE project = ? AND path = ? AND kind = ?",
+                [(self.project_dir, path, kind) for path, kind in stale],
+            )
+            self.conn.executemany(
+                "UPDATE files SET size = ?, mtime_ns = ? WHERE project = ? AND path = ? AND kind = ?",
+                self.pending_updates,
+            )
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?, ?)", self.pending_stores
+            )
+        self.conn.close()
+
+
+GITHUB_API_URL = "https://api.github.com"
+GITHUB_REPO_PATTERN = re.compile(
+    r'github\.com[/:]+([A-Za-z0-9_.-]+)/([A-Za-z0-9_.-]+?)(?:\.git)?(?:[/#?].*)?$'
+)
+
+
+def github_repo_key(url):
+    """Returnează cheia canonică `owner/repo` (litere mici) pentru un URL GitHub, sau None.
+    
+    Formele `https://...`, `git+https://...`, `git@github.com:...`, cu sau fără `.git`
+    și cu sufixe precum `/tree/master` duc la aceeași cheie.
+    """
+    match = GITHUB_REPO_PATTERN.search(url.strip())
+    if not match:
+        return None
+    return f"{match.group(1)}/{match.group(2)}".lower()
+
+
+class RateLimiter:
+    """Programează cererile GitHub pe baza antetelor de rate-limit.
+    
+    Citește `X-RateLimit-Remaining`/`X-RateLimit-Reset` și `Retry-After` și, când
+    cota este epuizată, pune în pauză toate firele până la resetare.
+    """
+
+    def __init__(self, max_wait=3600):
+        self.max_wait = max_wait
+        self.lock = threading.Lock()
+        self.blocked_until = 0.0
+        self.waits = 0
+        self.wait_time = 0.0
+
+    def wait(self):
+        """Așteaptă până când este permisă o nouă cerere; False dacă pauza depășește `max_wait`."""
+        with self.lock:
+            delay = self.blocked_until - time.time()
+        if delay <= 0:
+            return True
+        if delay > self.max_wait:
+            return False
+        with self.lock:
+            self.waits += 1
+            self.wait_time += delay
+        time.sleep(delay)
+        return True
+
+    def block_for(self, seconds):
+        """Blochează cererile pentru cel puțin `seconds` secunde."""
+        with self.lock:
+            self.blocked_until = max(self.blocked_until, time.time() + seconds)
+
+    def update(self, response):
+        """Actualizează starea din antetele unui răspuns; True dacă cererea trebuie reîncercată."""
+        headers = response.headers
+        retry_after = headers.get("Retry-After")
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset = headers.get("X-RateLimit-Reset")
+        
+        if retry_after is not None:
+            try:
+                self.block_for(float(retry_after))
+            except ValueError:
+                self.block_for(60)
+            return response.status_code in (403, 429)
+        
+        if remaining is not None and reset is not None:
+            try:
+                if int(remaining) == 0:
+                    self.block_for(max(0.0, float(reset) - time.time()) + 1)
+                    return response.status_code in (403, 429)
+            except ValueError:
+                pass
+        
+        return response.status_code == 429
+
+
+class CachedResponse:
+    """Răspuns HTTP reconstruit din cache, cu interfața folosită de GitHubClient."""
+
+    def __init__(self, status_code, content, headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class HttpCache:
+    """Cache persistent (SQLite) pentru răspunsuri HTTP, cu TTL pe intrare și evacuare LRU.
+    
+    Intrările expirate sunt revalidate cu `If-None-Match`/`If-Modified-Since`; un
+    răspuns 304 reîmprospătează intrarea fără a consuma cota GitHub.
+    """
+
+    def __init__(self, db_path, ttl=24 * 3600, max_bytes=100 * 1024 * 1024):
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self.evictions = 0
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self.conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        with self.conn:
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " url TEXT PRIMARY KEY, status INTEGER, etag TEXT, last_modified TEXT,"
+                " body BLOB, expires_at REAL, last_access REAL, size INTEGER)"
+            )
+        self.total_size = self.conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0]
+
+    def get(self, url):
+        """Returnează intrarea pentru `url` ca dicționar (sau None) și îi actualizează accesul."""
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT status, etag, last_modified, body, expires_at FROM responses WHERE url = ?",
+                (url,),
+            ).fetchone()
+            if row is None:
+                return None
+            self.conn.execute("UPDATE responses SET last_access = ? WHERE url = ?", (time.time(), url))
+        status, etag, last_modified, body, expires_at = row
+        return {
+            "status": status,
+            "etag": etag,
+            "last_modified": last_modified,
+            "body": body,
+            "fresh": expires_at > time.time(),
+        }
+
+    def put(self, url, response):
+        """Salvează un răspuns și evacuează intrările cel mai puțin folosite peste `max_bytes`."""
+        body = response.content
+        now = time.time()
+        with self.lock:
+            old = self.conn.execute("SELECT size FROM responses WHERE url = ?", (url,)).fetchone()
+            if old:
+                self.total_size -= old[0]
+            self.conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (url, response.status_code, response.headers.get("ETag"),
+                 response.headers.get("Last-Modified"), body, now + self.ttl, now, len(body)),
+            )
+            self.total_size += len(body)
+            while self.total_size > self.max_bytes:
+                row = self.conn.execute(
+                    "SELECT url, size FROM responses ORDER BY last_access LIMIT 1"
+                ).fetchone()
+                if row is None:
+                    break
+                self.conn.execute("DELETE FROM responses WHERE url = ?", (row[0],))
+                self.total_size -= row[1]
+                self.evictions += 1
+
+    def refresh(self, url):
+        """Prelungește valabilitatea unei intrări după un răspuns 304."""
+        with self.lock:
+            self.conn.execute(
+                "UPDATE responses SET expires_at = ? WHERE url = ?", (time.time() + self.ttl, url)
+            )
+
+    def record(self, counter):
+        """Incrementează un contor de utilizare (`hits`, `misses`, `revalidated`) sub lacăt."""
+        with self.lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def commit(self):
+        """Salvează pe disc răspunsurile scrise de la ultimul commit."""
+        with self.lock:
+            self.conn.commit()
+
+    def summary(self):
+        """Rezumatul statisticilor de utilizare a cache-ului."""
+        return (f"Cache HTTP: {self.hits} hit-uri, {self.revalidated} revalidări (304), "
+                f"{self.misses} miss-uri, {self.evictions} intrări evacuate")
+
+    def close(self):
+        with self.lock:
+            self.conn.commit()
+            self.conn.close()
+
+
+class GitHubClient:
+    """Client GitHub cu sesiune HTTP comună, concurență limitată și deduplicare pe repo.
+    
+    Rezultatele sunt memorate după cheia canonică `owner/repo`, astfel încât același
+    repo este interogat o singură dată, indiferent de câte biblioteci îl referă.
+    """
+
+    def __init__(self, token=None, api_url=GITHUB_API_URL, concurrency=8,
+                 timeout=10, max_retries=3, max_wait=3600, http_cache=None, offline=False,
+                 metrics=None):
+        self.api_url = api_url.rstrip("/")
+        self.metrics = metrics
+        self.http_cache = http_cache
+        self.offline = offline
+        self.concurrency = max(1, concurrency)
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.rate_limiter = RateLimiter(max_wait)
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=self.concurrency, pool_maxsize=self.concurrency
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers["Accept"] = "application/vnd.github+json"
+        if token:
+            self.session.headers["Authorization"] = f"token {token}"
+        self.results = {}
+        self.failures = {}
+        self.requests_made = 0
+
+    def get(self, path):
+        """Execută un GET pe API, trecând prin cache-ul HTTP (dacă există).
+        
+        Intrările proaspete sunt servite direct, cele expirate sunt revalidate
+        condiționat, iar în modul offline se folosește orice intrare disponibilă.
+        """
+        url = f"{self.api_url}/{path.lstrip('/')}"
+        cache = self.http_cache
+        entry = cache.get(url) if cache is not None else None
+        
+        if entry is not None and (entry["fresh"] or self.offline):
+            cache.record("hits")
+            return CachedResponse(entry["status"], entry["body"])
+        if self.offline:
+            if cache is not None:
+                cache.record("misses")
+            raise RuntimeError(f"{path} nu este disponibil în cache (mod offline)")
+        
+        headers = {}
+        if entry is not None:
+            if entry["etag"]:
+                headers["If-None-Match"] = entry["etag"]
+            if entry["last_modified"]:
+                headers["If-Modified-Since"] = entry["last_modified"]
+        
+        response = self._request(url, headers)
+        if cache is not None:
+            if response.status_code == 304 and entry is not None:
+                cache.record("revalidated")
+                cache.refresh(url)
+                return CachedResponse(entry["status"], entry["body"])
+            cache.record("misses")
+            if response.status_code in (200, 404):
+                cache.put(url, response)
+        return response
+    
+    def _request(self, url, headers):
+        """Execută cererea efectivă, cu reîncercări și respectarea limitelor de rată."""
+        for attempt in range(self.max_retries + 1):
+            if not self.rate_limiter.wait():
+                raise RuntimeError("limita de rată GitHub nu se resetează în timp util")
+            # Cererile pornesc din mai multe fire; contorul folosește lacătul limitatorului
+            with self.rate_limiter.lock:
+                self.requests_made += 1
+            start = time.perf_counter()
+            response = self.session.get(url, headers=headers, timeout=self.timeout)
+            if self.metrics is not None:
+                self.metrics.observe_http(
+                    time.perf_counter() - start, response.status_code, len(response.content)
+                )
+            if self.rate_limiter.update(response):
+                continue
+            if response.status_code >= 500 and attempt < self.max_retries:
+                # Eroare temporară a serverului: backoff exponențial
+                self.rate_limiter.block_for(2 ** attempt)
+                continue
+            return response
+        return response
+
+    def fetch_repo(self, repo_key):
+        """Obține descrierea și ultima versiune publicată pentru un repo `owner/repo`."""
+        response = self.get(f"repos/{repo_key}")
+        if response.status_code != 200:
+            raise RuntimeError(f"HTTP {response.status_code} pentru repos/{repo_key}")
+        repo_data = response.json()
+        info = {"description": repo_data.get("description") or "", "latest_version": ""}
+        
+        # Primul release este cel mai recent
+        releases_response = self.get(f"repos/{repo_key}/releases?per_page=1")
+        if releases_response.status_code == 200:
+            releases = releases_response.json()
+            if releases:
+                # Curăță tag-ul de prefixe comune precum 'v'
+                info["latest_version"] = releases[0].get("tag_name", "").lstrip('v')
+        return info
+
+    def fetch_repos(self, repo_keys):
+        """Interoghează concurent repo-urile încă necunoscute; returnează {cheie: info}."""
+        pending = sorted({key for key in repo_keys if key not in self.results and key not in self.failures})
+        
+        def fetch(key):
+            try:
+                return key, self.fetch_repo(key), None
+            except Exception as e:
+                return key, None, e
+        
+        if pending:
+            with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+                for key, info, error in executor.map(fetch, pending):
+                    if error is None:
+                        self.results[key] = info
+                    else:
+                        self.failures[key] = str(error)
+            # Fiecare lot ajunge pe disc imediat; o întrerupere ulterioară nu pierde răspunsurile
+            if self.http_cache is not None:
+                self.http_cache.commit()
+        return {key: self.results[key] for key in repo_keys if key in self.results}
+
+
+VERSION_NUMBER_PATTERN = re.compile(r'\d+(?:\.\d+)*')
+
+
+def version_key(version):
+    """Cheie de sortare pentru versiuni de tip semver (`v1.2.3`, `1.2.3-beta.1`)."""
+    match = VERSION_NUMBER_PATTERN.search(version or "")
+    if not match:
+        return ((), 0, version or "")
+    numbers = tuple(int(part) for part in match.group().split("."))
+    numbers += (0,) * (3 - len(numbers))
+    suffix = version[match.end():]
+    # O versiune pre-release (`-beta`) precede versiunea finală
+    release = 0 if suffix.startswith("-") else 1
+    return (numbers, release, suffix)
+
+
+# Versiune semver (opțional cu prefix "v", ca tag-urile git), cu pre-release și metadate de build
+VERSION_SPEC_PATTERN = re.compile(
+    r'^(?P<op>\^|~|>=|<=|>|<|==|=)?\s*[vV]?(?P<release>\d+(?:\.\d+)*)'
+    r'(?:-(?P<pre>[0-9A-Za-z.-]+)|(?P<tag>[A-Za-z][0-9A-Za-z.-]*))?(?:\+[0-9A-Za-z.-]+)?$'
+)
+RANGE_COMPARATOR_PATTERN = re.compile(r'(>=|<=|>|<|==|=|!=)\s*([^\s,<>=!]+)')
+# Un hash conține cel puțin o literă, altfel ar prinde versiunile numerice (20230101)
+GIT_HASH_PATTERN = re.compile(r'^(?=[0-9a-f]*[a-f])[0-9a-f]{7,40}$')
+
+
+@dataclass(frozen=True, slots=True)
+class VersionSpec:
+    """O versiune sau o specificație de versiune PlatformIO, parsată o singură dată.
+    
+    `kind` este "exact", "caret" (^1.2.3), "tilde" (~1.2.3), "range" (>=1.0,<2),
+    "any" (*) sau "unknown" (ramuri git, hash-uri, text liber). `key` este cheia
+    comparabilă a versiunii minime, iar `upper` limita superioară admisă (exclusivă,
+    sau inclusivă pentru "exact" și `<=`); None dacă nu există.
+    """
+
+    raw: str
+    kind: str
+    key: tuple = None
+    upper: tuple = None
+    upper_inclusive: bool = False
+
+    def behind(self, latest):
+        """True dacă ultima versiune publicată depășește ce admite specificația; None dacă nu se știe."""
+        if self.kind == "unknown" or latest is None or latest.kind != "exact":
+            return None
+        if self.upper is None:
+            return False
+        if self.upper_inclusive:
+            return latest.key > self.upper
+        return latest.key >= self.upper
+
+
+def _version_key_parts(release, pre=None):
+    """Cheia comparabilă: (tuplu numeric de minim 3 componente, 1 pentru release / 0 pentru pre-release, ...)."""
+    numbers = tuple(int(part) for part in release.split("."))
+    numbers += (0,) * (3 - len(numbers))
+    if not pre:
+        return (numbers, 1, ())
+    # Identificatorii numerici se compară numeric și preced pe cei alfanumerici (semver)
+    return (numbers, 0, tuple((0, int(p), "") if p.isdigit() else (1, 0, p) for p in pre.split(".")))
+
+
+@functools.lru_cache(maxsize=65536)
+def parse_version_spec(text):
+    """Parsează o versiune sau o specificație (`1.2.3`, `v1.2`, `^6.21.0`, `~1.2`, `>=1.0,<2`, `*`)."""
+    raw = (text or "").strip()
+    if raw in ("*", "latest", "x"):
+        return VersionSpec(raw, "any")
+    if GIT_HASH_PATTERN.match(raw):
+        return VersionSpec(raw, "unknown")
+    
+    match = VERSION_SPEC_PATTERN.match(raw)
+    if match:
+        key = _version_key_parts(match.group("release"), match.group("pre") or match.group("tag"))
+        op = match.group("op")
+        given = match.group("release").count(".") + 1
+        major, minor, patch = key[0][:3]
+        if op == "^":
+            # Ca la npm/PlatformIO: prima componentă nenulă (sau ultima dată) rămâne fixă
+            if major > 0 or given == 1:
+                upper = (major + 1, 0, 0)
+            elif minor > 0 or given == 2:
+                upper = (0, minor + 1, 0)
+            else:
+                upper = (0, 0, patch + 1)
+            return VersionSpec(raw, "caret", key, (upper, 0, ()))
+        if op == "~":
+            upper = (major, minor + 1, 0) if given >= 2 else (major + 1, 0, 0)
+            return VersionSpec(raw, "tilde", key, (upper, 0, ()))
+        if op in (None, "=", "=="):
+            return VersionSpec(raw, "exact", key, key, True)
+        if op in (">", ">="):
+            return VersionSpec(raw, "range", key)
+        return VersionSpec(raw, "range", None, key, op == "<=")
+    
+    # Interval compus din comparatori (">=1.0.0,<2.0.0", ">=1.2 <2")
+    comparators = RANGE_COMPARATOR_PATTERN.findall(raw)
+    if comparators and not RANGE_COMPARATOR_PATTERN.sub("", raw).strip(" ,"):
+        lower = upper = None
+        upper_inclusive = False
+        for op, version in comparators:
+            bound = parse_version_spec(version)
+            if bound.kind != "exact":
+                return VersionSpec(raw, "unknown")
+            if op in (">", ">=") and (lower is None or bound.key > lower):
+                lower = bound.key
+            elif op in ("<", "<=") and (upper is None or bound.key < upper):
+                upper, upper_inclusive = bound.key, op == "<="
+            elif op in ("=", "=="):
+                lower = upper = bound.key
+                upper_inclusive = True
+        return VersionSpec(raw, "range", lower, upper, upper_inclusive)
+    return VersionSpec(raw, "unknown")
+
+
+def iter_json_array(file_obj, keys=("libraries", "items", "packages"), chunk_size=1 << 20):
+    """Iterează elementele unui tablou JSON mare fără a încărca întregul fișier.
+    
+    Tabloul poate fi rădăcina documentului sau valoarea uneia dintre cheile `keys`
+    ale obiectului rădăcină. Elementele sunt decodate unul câte unul cu `raw_decode`.
+    """
+    decoder = json.JSONDecoder()
+    start_pattern = re.compile(r'^\s*\[|"(?:%s)"\s*:\s*\[' % "|".join(map(re.escape, keys)))
+    buf = ""
+    eof = False
+    
+    def fill():
+        nonlocal buf, eof
+        chunk = file_obj.read(chunk_size)
+        if not chunk:
+            eof = True
+        buf += chunk
+    
+    # Caută începutul tabloului
+    while True:
+        match = start_pattern.search(buf)
+        if match:
+            pos = match.end()
+            break
+        if eof:
+            return
+        fill()
+    
+    while True:
+        # Sare peste spații și virgule dintre elemente
+        while pos < len(buf) and buf[pos] in " \t\r\n,":
+            pos += 1
+        if pos >= len(buf):
+            if eof:
+                return
+            buf = buf[pos:]
+            pos = 0
+            fill()
+            continue
+        if buf[pos] == "]":
+            return
+        try:
+            item, end = decoder.raw_decode(buf, pos)
+        except json.JSONDecodeError:
+            if eof:
+                raise
+            # Elementul este incomplet: păstrăm doar restul neprocesat și citim în continuare
+            buf = buf[pos:]
+            pos = 0
+            fill()
+            continue
+        yield item
+        pos = end
+
+
+def _registry_text(value, *keys):
+    """Extrage un șir dintr-un câmp care poate fi șir, obiect sau listă de obiecte."""
+    if isinstance(value, list):
+        value = value[0] if value else ""
+    if isinstance(value, dict):
+        for key in keys:
+            if value.get(key):
+                return str(value[key])
+        return ""
+    return str(value or "")
+
+
+def normalize_registry_entry(entry):
+    """Aduce o intrare din library_index.json (Arduino) sau din registrul PlatformIO la un format comun."""
+    name = _registry_text(entry.get("name"))
+    repo_url = _registry_text(entry.get("repository") or entry.get("repository_url"), "url")
+    owner = _registry_text(entry.get("owner"), "username", "name")
+    if not owner:
+        repo_key = github_repo_key(repo_url) if repo_url else None
+        if repo_key:
+            owner = repo_key.split("/")[0]
+    headers = entry.get("providesIncludes") or entry.get("headers") or []
+    return {
+        "name": name,
+        "owner": owner,
+        # Câmpurile specifice library_index.json identifică intrările indexului oficial Arduino
+        "official": any(key in entry for key in ("sentence", "providesIncludes", "architectures")),
+        "version": _registry_text(entry.get("version"), "name"),
+        "repo_url": repo_url,
+        "author": _registry_text(entry.get("author") or entry.get("authors"), "name"),
+        "description": _registry_text(entry.get("sentence") or entry.get("description")),
+        "homepage": _registry_text(entry.get("website") or entry.get("homepage")),
+        "headers": [str(h) for h in headers if h],
+    }
+
+
+class RegistryIndex:
+    """Index local (SQLite, mapat în memorie) al registrelor de biblioteci Arduino/PlatformIO.
+    
+    Fișierele sursă (library_index.json sau un dump al registrului PlatformIO, JSON ori
+    NDJSON) sunt parcurse în flux; pentru fiecare bibliotecă se păstrează doar ultima
+    versiune. Căutările se fac după nume, nume de header sau `owner/nume`. Un fișier
+    sursă este reindexat doar dacă s-a schimbat.
+    
+    Un alias poate aparține mai multor biblioteci (de ex. un fork cu același nume).
+    Candidații sunt ordonați explicit: potrivirea exactă a owner-ului, apoi intrarea din
+    indexul oficial Arduino, apoi biblioteca al cărei repo aparține owner-ului din
+    registru. Dacă nu există un candidat clar preferat, căutarea nu rezolvă nimic.
+    """
+
+    SCHEMA_VERSION = 2
+    FIELDS = ("name", "owner", "repo_url", "latest_version", "author", "description", "homepage", "official")
+
+    def __init__(self, db_path):
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self.conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        self.conn.execute("PRAGMA mmap_size=268435456")
+        self.lock = threading.Lock()
+        self.memo = {}
+        with self.conn:
+            self.conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+            row = self.conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+            if row is None or row[0] != str(self.SCHEMA_VERSION):
+                # Schema veche: tabelele sunt recreate, iar sursele reindexate la următorul update
+                for table in ("sources", "libraries", "aliases"):
+                    self.conn.execute(f"DROP TABLE IF EXISTS {table}")
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO meta VALUES ('version', ?)", (str(self.SCHEMA_VERSION),)
+                )
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS sources ("
+                " path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER)"
+            )
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS libraries ("
+                " id INTEGER PRIMARY KEY, source TEXT, name TEXT, owner TEXT, repo_url TEXT,"
+                " latest_version TEXT, author TEXT, description TEXT, homepage TEXT,"
+                " official INTEGER)"
+            )
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS aliases ("
+                " kind TEXT, alias TEXT, lib_id INTEGER, source TEXT,"
+                " PRIMARY KEY (kind, alias, lib_id)) WITHOUT ROWID"
+            )
+            self.conn.execute("CREATE INDEX IF NOT EXISTS libraries_source ON libraries (source)")
+
+    def update(self, index_path):
+        """Reindexează `index_path` dacă s-a modificat; returnează True dacă a fost reconstruit."""
+        index_path = os.path.abspath(index_path)
+        st = os.stat(index_path)
+        row = self.conn.execute(
+            "SELECT size, mtime_ns FROM sources WHERE path = ?", (index_path,)
+        ).fetchone()
+        if row == (st.st_size, st.st_mtime_ns):
+            return False
+        
+        # Păstrăm doar ultima versiune a fiecărei biblioteci (după owner și nume)
+        latest = {}
+        with open(index_path, "r", encoding="utf-8") as f:
+            if index_path.endswith((".ndjson", ".jsonl")):
+                entries = (json.loads(line) for line in f if line.strip())
+            else:
+                entries = iter_json_array(f)
+            for entry in entries:
+                if not isinstance(entry, dict):
+                    continue
+                record = normalize_registry_entry(entry)
+                if not record["name"]:
+                    continue
+                key = (record["owner"].lower(), record["name"].lower())
+                current = latest.get(key)
+                if current is None or version_key(record["version"]) > version_key(current["version"]):
+                    latest[key] = record
+        
+        with self.lock, self.conn:
+            self.conn.execute("DELETE FROM aliases WHERE source = ?", (index_path,))
+            self.conn.execute("DELETE FROM libraries WHERE source = ?", (index_path,))
+            for key in sorted(latest):
+                record = latest[key]
+                cursor = self.conn.execute(
+                    "INSERT INTO libraries (source, name, owner, repo_url, latest_version,"
+                    " author, description, homepage, official) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (index_path, record["name"], record["owner"], record["repo_url"],
+                     record["version"], record["author"], record["description"], record["homepage"],
+                     int(record["official"])),
+                )
+                aliases = [("name", record["name"].lower())]
+                aliases += [("header", header.lower()) for header in record["headers"]]
+                if record["owner"]:
+                    aliases.append(("owner", f"{record['owner']}/{record['name']}".lower()))
+                self.conn.executemany(
+                    "INSERT OR IGNORE INTO aliases VALUES (?, ?, ?, ?)",
+                    [(kind, alias, cursor.lastrowid, index_path) for kind, alias in aliases],
+                )
+            self.conn.execute(
+                "INSERT OR REPLACE INTO sources VALUES (?, ?, ?)",
+                (index_path, st.st_size, st.st_mtime_ns),
+            )
+        self.memo.clear()
+        return True
+
+    def lookup(self, kind, alias, owner=None):
+        """Caută o bibliotecă după tipul de alias (`name`, `header`, `owner`); returnează un dicționar sau None.
+        
+        Cu `owner`, sunt acceptate doar bibliotecile acelui owner (în registru sau ca
+        proprietar al repo-ului).
+        """
+        key = (kind, alias.lower(), owner.lower() if owner else None)
+        if key in self.memo:
+            return self.memo[key]
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT l.name, l.owner, l.repo_url, l.latest_version, l.author, l.description,"
+                " l.homepage, l.official"
+                " FROM aliases a JOIN libraries l ON l.id = a.lib_id WHERE a.kind = ? AND a.alias = ?",
+                key[:2],
+            ).fetchall()
+        candidates = [dict(zip(self.FIELDS, row)) for row in rows]
+        if owner:
+            candidates = [entry for entry in candidates if key[2] in self._owners(entry)]
+        result = self._preferred(candidates)
+        self.memo[key] = result
+        return result
+
+    @staticmethod
+    def _owners(entry):
+        """Owner-ul din registru și proprietarul repo-ului GitHub (litere mici)."""
+        repo_key = github_repo_key(entry["repo_url"]) if entry["repo_url"] else None
+        return (entry["owner"].lower(), repo_key.split("/")[0] if repo_key else "")
+
+    @classmethod
+    def _preferred(cls, candidates):
+        """Candidatul clar preferat sau None dacă lista e goală ori ambiguă."""
+        if not candidates:
+            return None
+        
+        def rank(entry):
+            registry_owner, repo_owner = cls._owners(entry)
+            return (bool(entry["official"]), bool(repo_owner) and repo_owner == registry_owner)
+        
+        best = max(rank(entry) for entry in candidates)
+        top = [entry for entry in candidates if rank(entry) == best]
+        # Aceeași bibliotecă poate apărea în mai multe registre; contează doar repo-uri distincte
+        identities = {
+            (github_repo_key(entry["repo_url"]) if entry["repo_url"] else None)
+            or (entry["owner"].lower(), entry["name"].lower())
+            for entry in top
+        }
+        return top[0] if len(identities) == 1 else None
+
+    def resolve(self, lib_name):
+        """Rezolvă un nume de bibliotecă așa cum apare în proiect (nume, `owner/nume` sau header)."""
+        if "/" in lib_name:
+            owner, name = lib_name.split("/", 1)
+            # Fără revenire la biblioteca altui owner cu același nume
+            return self.lookup("owner", lib_name) or self.lookup("name", name, owner=owner)
+        stem, ext = os.path.splitext(lib_name)
+        if ext in (".h", ".hpp"):
+            return self.lookup("header", lib_name) or self.lookup("name", stem)
+        return self.lookup("name", lib_name)
+
+    def close(self):
+        self.conn.close()
+
+
+class PlatformIOConfig:
+    """Rezolvă un platformio.ini așa cum îl vede PlatformIO.
+    
+    Încarcă și fișierele din `extra_configs`, aplică moștenirea prin `extends` și din
+    secțiunea comună `[env]` și evaluează interpolările `${secțiune.opțiune}`,
+    `${sysenv.VAR}` și `${this.opțiune}`. Fiecare pereche (secțiune, opțiune) este
+    evaluată o singură dată, cu detectarea ciclurilor.
+    """
+
+    INTERPOLATION_PATTERN = re.compile(r'\$\{([^{}]+)\.([^{}.]+)\}')
+
+    def __init__(self, ini_path, environ=None):
+        self.ini_path = ini_path
+        self.environ = os.environ if environ is None else environ
+        self.parser = configparser.ConfigParser(
+            interpolation=None, strict=False, inline_comment_prefixes=(";",)
+        )
+        self.parser.optionxform = str
+        # Fișierele încărcate din `extra_configs`, în ordinea citirii
+        self.extra_configs = []
+        self._parsed = set()
+        self._read(ini_path)
+        self._values = {}
+        self._resolving = set()
+        self._lineages = {}
+
+    def _read(self, path):
+        """Citește un fișier de configurare de pe disc sau dintr-o arhivă, apoi `extra_configs`.
+        
+        Ca în PlatformIO, fiecare fișier citit poate adăuga alte `extra_configs`; un
+        fișier este citit o singură dată, deci referințele circulare se opresc singure.
+        """
+        key = os.path.normcase(os.path.abspath(path))
+        if key in self._parsed:
+            return
+        self._parsed.add(key)
+        if split_archive_path(path) is None:
+            self.parser.read(path, encoding="utf-8")
+        else:
+            self.parser.read_string(read_file_bytes(path).decode("utf-8"), source=path)
+        if path != self.ini_path:
+            self.extra_configs.append(path)
+        for extra_path in self._extra_config_paths():
+            self._read(extra_path)
+
+    def _extra_config_paths(self):
+        """Fișierele din `[platformio] extra_configs` (șabloane glob, relative la proiect)."""
+        if not self.parser.has_option("platformio", "extra_configs"):
+            return []
+        base_dir = os.path.dirname(os.path.abspath(self.ini_path))
+        location = split_archive_path(base_dir)
+        extra_paths = []
+        for pattern in self.parse_multi_values(self.parser.get("platformio", "extra_configs")):
+            if location is None:
+                paths = glob.glob(os.path.join(base_dir, pattern))
+            else:
+                # Într-o arhivă șablonul se aplică numelor membrilor
+                archive_path, member_dir = location
+                member_pattern = posixpath.normpath(posixpath.join(member_dir, pattern.replace(os.sep, "/")))
+                paths = [
+                    os.path.join(archive_path, *name.split("/"))
+                    for name in ArchiveReader.open(archive_path).members()
+                    if fnmatch.fnmatchcase(name, member_pattern)
+                ]
+            extra_paths.extend(sorted(paths))
+        return extra_paths
+
+    @staticmethod
+    def parse_multi_values(value):
+        """Împarte o valoare multiplă: pe linii sau, pentru o singură linie, după ", " (ca PlatformIO)."""
+        items = value.split("\n") if "\n" in value else value.split(", ")
+        values = []
+        for item in items:
+            item = item.strip()
+            if not item or item.startswith(("#", ";")):
+                continue
+            if ";" in item:
+                item = item.split(";", 1)[0].strip()
+            values.append(item)
+        return values
+
+    def environments(self):
+        """Numele mediilor definite (`[env:NUME]`), în ordinea din fișier."""
+        return [section[4:] for section in self.parser.sections() if section.startswith("env:")]
+
+    def _lineage(self, section):
+        """Secțiunile din care o secțiune își moștenește opțiunile, în ordinea priorității."""
+        if section in self._lineages:
+            return self._lineages[section]
+        
+        lineage = []
+        stack = [section]
+        visiting = set()
+        while stack:
+            current = stack.pop()
+            if current in visiting or not self.parser.has_section(current):
+                continue
+            visiting.add(current)
+            lineage.append(current)
+            if self.parser.has_option(current, "extends"):
+                parents = self.parse_multi_values(self.parser.get(current, "extends"))
+                stack.extend(reversed(parents))
+        if section.startswith("env:") and self.parser.has_section("env") and "env" not in visiting:
+            lineage.append("env")
+        self._lineages[section] = lineage
+        return lineage
+
+    def _raw(self, section, option):
+        """Valoarea neinterpolată a unei opțiuni, ținând cont de moștenire (sau None)."""
+        for candidate in self._lineage(section):
+            if self.parser.has_option(candidate, option):
+                return self.parser.get(candidate, option)
+        return None
+
+    def get(self, section, option, default=""):
+        """Valoarea complet interpolată a unei opțiuni."""
+        key = (section, option)
+        if key in self._values:
+            return self._values[key]
+        if key in self._resolving:
+            raise ValueError(f"referință circulară la ${{{section}.{option}}}")
+        
+        raw = self._raw(section, option)
+        if raw is None:
+            return default
+        self._resolving.add(key)
+        try:
+            value = self.INTERPOLATION_PATTERN.sub(
+                lambda match: self._interpolate(section, match.group(1), match.group(2)), raw
+            )
+        finally:
+            self._resolving.discard(key)
+        self._values[key] = value
+        return value
+
+    def _interpolate(self, section, ref_section, ref_option):
+        """Evaluează o referință `${ref_section.ref_option}` din `section`."""
+        if ref_section == "sysenv":
+            return self.environ.get(ref_option, "")
+        if ref_section == "this":
+            if ref_option == "__env__":
+                return section[4:] if section.startswith("env:") else section
+            ref_section = section
+        return self.get(ref_section, ref_option)
+
+    def lib_deps(self, environment):
+        """Dependențele efective ale unui mediu, după moștenire și interpolare."""
+        return self.parse_multi_values(self.get(f"env:{environment}", "lib_deps"))
+
+
+class IncludeGraph:
+    """Indexul header → bibliotecă și graful include-urilor dintre fișierele proiectului.
+    
+    Rădăcinile bibliotecilor sunt directoarele cu manifest (library.properties /
+    library.json), `lib/<nume>` și `.pio/libdeps/<env>/<nume>`; restul fișierelor
+    (src, include, schițele) aparțin proiectului. Fiecare include este rezolvat
+    printr-o căutare în dicționar după numele header-ului. Include-urile care nu
+    corespund niciunui fișier din arbore (framework, biblioteci de sistem) rămân
+    identificate după numele header-ului.
+    """
+
+    HEADER_EXTENSIONS = ('.h',)
+    SKETCH_EXTENSIONS = ('.ino', '.cpp')
+
+    def __init__(self, rel_paths, library_roots=None):
+        self.files = set(rel_paths)
+        self.library_roots = dict(library_roots or {})
+        for rel_path in sorted(self.files):
+            parts = rel_path.split(os.sep)
+            if parts[0] == "lib" and len(parts) >= 3:
+                self.library_roots.setdefault(os.path.join(*parts[:2]), parts[1])
+            elif parts[:2] == [".pio", "libdeps"] and len(parts) >= 5:
+                self.library_roots.setdefault(os.path.join(*parts[:4]), parts[3])
+        self._dir_owners = {}
+        
+        # Header-ele indexate după nume; la nume identice ordinea căilor decide
+        self.headers = defaultdict(list)
+        for rel_path in sorted(self.files):
+            if rel_path.endswith(self.HEADER_EXTENSIONS):
+                self.headers[os.path.basename(rel_path)].append(rel_path)
+        
+        # Muchiile fiecărui fișier: fișierele incluse din arbore și bibliotecile directe
+        self.edges = {}
+        self._transitive = None
+
+    def owner(self, rel_path):
+        """Biblioteca ce conține fișierul sau None pentru fișierele proiectului."""
+        directory = os.path.dirname(rel_path)
+        if directory in self._dir_owners:
+            return self._dir_owners[directory]
+        owner = None
+        current = directory
+        while current:
+            if current in self.library_roots:
+                owner = self.library_roots[current]
+                break
+            current = os.path.dirname(current)
+        self._dir_owners[directory] = owner
+        return owner
+
+    def resolve(self, rel_path, include):
+        """Rezolvă un include: (fișier din arbore, None) sau (None, nume de header extern)."""
+        # Calea relativă la fișierul care include (de ex. "../include/config.h")
+        candidate = os.path.normpath(os.path.join(os.path.dirname(rel_path), include))
+        if candidate in self.files:
+            return candidate, None
+        
+        name = os.path.basename(include)
+        candidates = self.headers.get(name)
+        if not candidates:
+            return None, name
+        if len(candidates) > 1:
+            # Include-urile cu subdirector ("Adafruit/Foo.h") trebuie să se potrivească cu sufixul căii
+            suffix = os.sep + os.path.normpath(include)
+            matching = [path for path in candidates if path.endswith(suffix)] or candidates
+            # Întâi header-ul din aceeași bibliotecă (sau din proiect), apoi cel din proiect
+            owner = self.owner(rel_path)
+            for path in matching:
+                if self.owner(path) == owner:
+                    return path, None
+            for path in matching:
+                if self.owner(path) is None:
+                    return path, None
+            return matching[0], None
+        return candidates[0], None
+
+    def add_file(self, rel_path, includes):
+        """Adaugă muchiile unui fișier; returnează bibliotecile pe care le include direct."""
+        owner = self.owner(rel_path)
+        targets = []
+        libraries = set()
+        for include in includes:
+            target, external = self.resolve(rel_path, include)
+            if target is None:
+                libraries.add(external)
+                continue
+            targets.append(target)
+            target_owner = self.owner(target)
+            # Header-ele proprii ale unei biblioteci nu sunt o utilizare a ei
+            if target_owner is not None and target_owner != owner:
+                libraries.add(target_owner)
+        self.edges[rel_path] = (targets, libraries)
+        self._transitive = None
+        return libraries
+
+    def transitive_libraries(self):
+        """Bibliotecile atinse din fiecare fișier, direct sau prin include-uri indirecte.
+        
+        Componentele tare conexe (Tarjan, iterativ) tratează ciclurile de include-uri;
+        toate fișierele unui ciclu împart același set, calculat o singură dată.
+        """
+        if self._transitive is not None:
+            return self._transitive
+        
+        edges = self.edges
+        index = {}
+        low = {}
+        stack = []
+        on_stack = set()
+        result = {}
+        for start in sorted(edges):
+            if start in index:
+                continue
+            index[start] = low[start] = len(index)
+            stack.append(start)
+            on_stack.add(start)
+            work = [(start, iter(edges[start][0]))]
+            while work:
+                node, children = work[-1]
+                descended = False
+                for child in children:
+                    if child not in edges:
+                        continue
+                    if child not in index:
+                        index[child] = low[child] = len(index)
+                        stack.append(child)
+                        on_stack.add(child)
+                        work.append((child, iter(edges[child][0])))
+                        descended = True
+                        break
+                    if child in on_stack:
+                        low[node] = min(low[node], index[child])
+                if descended:
+                    continue
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                if low[node] != index[node]:
+                    continue
+                
+                # Rădăcina unei componente: componentele succesoare sunt deja calculate
+                members = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    members.append(member)
+                    if member == node:
+                        break
+                libraries = set()
+                for member in members:
+                    libraries |= edges[member][1]
+                    for child in edges[member][0]:
+                        if child in result:
+                            libraries |= result[child]
+                shared = frozenset(libraries)
+                for member in members:
+                    result[member] = shared
+        
+        self._transitive = result
+        return result
+
+    def sketches(self):
+        """Unitățile de compilare ale proiectului: fișierele .ino și .cpp din afara bibliotecilor."""
+        return sorted(
+            rel_path for rel_path in self.edges
+            if rel_path.endswith(self.SKETCH_EXTENSIONS) and self.owner(rel_path) is None
+        )
+
+    def report(self):
+        """Bibliotecile directe și tranzitive ale fiecărei schițe."""
+        transitive = self.transitive_libraries()
+        return {
+            rel_path: {
+                "direct": sorted(self.edges[rel_path][1]),
+                "transitive": sorted(transitive[rel_path]),
+            }
+            for rel_path in self.sketches()
+        }
+
+
+class PathTable:
+    """Internează căile relative: fiecare cale e stocată o dată și referită printr-un ID întreg."""
+
+    def __init__(self):
+        self.paths = []
+        self.ids = {}
+
+    def intern(self, path):
+        """Returnează ID-ul căii, adăugând-o în tabel dacă nu există."""
+        path_id = self.ids.get(path)
+        if path_id is None:
+            path_id = self.ids[path] = len(self.paths)
+            self.paths.append(path)
+        return path_id
+
+    def __getitem__(self, path_id):
+        return self.paths[path_id]
+
+    def __len__(self):
+        return len(self.paths)
+
+
+@dataclass(slots=True)
+class LibraryRecord:
+    """Datele unei biblioteci; fișierele în care apare sunt păstrate ca ID-uri din `PathTable`."""
+
+    name: str = ""
+    version: str = ""
+    author: str = ""
+    github_url: str = ""
+    description: str = ""
+    homepage: str = ""
+    latest_version: str = ""
+    source: str = ""
+    # URL dedus doar din forma `owner/nume`; nu apare în rezultate cât timp GitHub nu îl confirmă
+    guessed_github_url: str = ""
+    file_ids: set = field(default_factory=set)
+    environments: set = field(default_factory=set)
+
+    def file_paths(self, paths):
+        """Căile fișierelor în care apare biblioteca, sortate."""
+        return sorted(paths[file_id] for file_id in self.file_ids)
+
+
+OUTPUT_FIELDNAMES = [
+    "name", "version", "latest_version", "author", "description",
+    "github_url", "homepage", "source", "environments", "files_found_in"
+]
+
+
+def library_row(lib_name, record, paths):
+    """Rândul de ieșire al unei biblioteci, cu listele păstrate ca liste (NDJSON, server live)."""
+    return {
+        "name": lib_name,
+        "version": record.version,
+        "latest_version": record.latest_version,
+        "author": record.author,
+        "description": record.description,
+        "github_url": record.github_url,
+        "homepage": record.homepage,
+        "source": record.source,
+        "environments": sorted(record.environments),
+        "files_found_in": record.file_paths(paths),
+    }
+
+
+@contextmanager
+def atomic_output(output_file):
+    """Oferă o cale temporară din același director, mutată peste `output_file` la final.
+    
+    Cine citește fișierul (de ex. raportul HTML sau modul watch) vede fie versiunea
+    veche, fie cea nouă, niciodată una scrisă pe jumătate.
+    """
+    directory, filename = os.path.split(os.path.abspath(output_file))
+    # Numele temporar este unic per proces și fir, deci scrierile concurente nu se încurcă
+    temp_path = os.path.join(directory, f".{filename}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        yield temp_path
+        os.replace(temp_path, output_file)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+class CsvWriter:
+    """Scrie bibliotecile într-un fișier CSV, rând cu rând."""
+
+    label = "CSV"
+    extension = ".csv"
+
+    def __init__(self, output_file):
+        self.output_file = output_file
+
+    def write(self, records, paths):
+        """Scrie perechile (nume, înregistrare) primite în ordine."""
+        with atomic_output(self.output_file) as temp_path, \
+                open(temp_path, 'w', newline='', encoding='utf-8') as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(OUTPUT_FIELDNAMES)
+            for lib_name, record in records:
+                writer.writerow([
+                    lib_name, record.version, record.latest_version, record.author,
+                    record.description, record.github_url, record.homepage, record.source,
+                    ", ".join(sorted(record.environments)),
+                    # Lista fișierelor este construită doar pentru rândul curent
+                    ", ".join(record.file_paths(paths)),
+                ])
+
+
+class NdjsonWriter:
+    """Scrie câte un obiect JSON pe linie; fișierele sunt o listă, nu un șir concatenat."""
+
+    label = "NDJSON"
+    extension = ".ndjson"
+
+    def __init__(self, output_file):
+        self.output_file = output_file
+
+    def write(self, records, paths):
+        with atomic_output(self.output_file) as temp_path, open(temp_path, 'w', encoding='utf-8') as f:
+            for lib_name, record in records:
+                row = library_row(lib_name, record, paths)
+                f.write(json.dumps(row, ensure_ascii=False) + "\n")
+
+
+class SqliteWriter:
+    """Scrie un fișier SQLite normalizat: biblioteci, fișiere și tabela de legătură dintre ele."""
+
+    label = "SQLite"
+    extension = ".sqlite"
+
+    def __init__(self, output_file):
+        self.output_file = output_file
+
+    def write(self, records, paths):
+        with atomic_output(self.output_file) as temp_path:
+            self._write_database(temp_path, records, paths)
+
+    def _write_database(self, db_path, records, paths):
+        conn = sqlite3.connect(db_path)
+        try:
+            with conn:
+                conn.execute(
+                    "CREATE TABLE libraries (id INTEGER PRIMARY KEY, name TEXT UNIQUE, version TEXT,"
+                    " latest_version TEXT, author TEXT, description TEXT, github_url TEXT,"
+                    " homepage TEXT, source TEXT)"
+                )
+                conn.execute("CREATE TABLE files (id INTEGER PRIMARY KEY, path TEXT UNIQUE)")
+                conn.execute(
+                    "CREATE TABLE library_environments (library_id INTEGER REFERENCES libraries(id),"
+                    " environment TEXT, PRIMARY KEY (library_id, environment))"
+                )
+                conn.execute(
+                    "CREATE TABLE library_files (library_id INTEGER REFERENCES libraries(id),"
+                    " file_id INTEGER REFERENCES files(id), PRIMARY KEY (library_id, file_id))"
+                )
+                conn.executemany(
+                    "INSERT INTO files VALUES (?, ?)", ((i, paths[i]) for i in range(len(paths)))
+                )
+                for library_id, (lib_name, record) in enumerate(records):
+                    conn.execute(
+                        "INSERT INTO libraries VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        (library_id, lib_name, record.version, record.latest_version, record.author,
+                         record.description, record.github_url, record.homepage, record.source),
+                    )
+                    conn.executemany(
+                        "INSERT INTO library_files VALUES (?, ?)",
+                        ((library_id, file_id) for file_id in record.file_ids),
+                    )
+                    conn.executemany(
+                        "INSERT INTO library_environments VALUES (?, ?)",
+                        ((library_id, env) for env in sorted(record.environments)),
+                    )
+                conn.execute("CREATE INDEX library_files_file ON library_files (file_id)")
+        finally:
+            conn.close()
+
+
+class ReportBundle:
+    """Pachetul JSON încărcat de raport_tehnic.html.
+    
+    Conține înregistrările deja deduplicate (după nume și repo GitHub), ordinile de
+    sortare precalculate pentru fiecare criteriu din pagină, statisticile și un
+    index inversat al cuvintelor (litere și cifre Unicode), sortat ca în JavaScript;
+    pagina găsește prin căutare binară cuvintele care încep cu termenul căutat și,
+    doar dacă nu există, pe cele care îl conțin.
+    Pagina doar selectează și afișează, fără să mai parseze sau să sorteze datele.
+    
+    Deduplicarea, sortarea și câmpurile căutate urmează aceleași reguli ca pagina
+    pentru fișierele CSV (`dedupeLibraries`, `sortText`, `buildSearchIndex` din
+    raport_tehnic.js), deci ambele vederi afișează aceleași biblioteci.
+    """
+
+    VERSION = 1
+    TEXT_FIELDS = ("name", "version", "latest_version", "author", "description",
+                   "github_url", "homepage", "source")
+    FIELDS = TEXT_FIELDS + ("environments", "files", "projects", "status")
+    SORT_KEYS = ("name", "version", "author", "source")
+    SEARCH_FIELDS = ("name", "version", "author", "description", "github_url", "homepage",
+                     "source", "environments")
+    TOKEN_PATTERN = re.compile(r"\w+")
+
+    def __init__(self):
+        self.records = []
+        self.positions = {}
+        self.files = PathTable()
+        self.rows_seen = 0
+
+    def add(self, lib_name, record, paths, project=None):
+        """Adaugă o bibliotecă; duplicatele (aceeași identitate) sunt combinate."""
+        self.rows_seen += 1
+        prefix = f"{project}/" if project else ""
+        file_ids = {self.files.intern(prefix + paths[file_id]) for file_id in record.file_ids}
+        identity = (lib_name.lower(), github_repo_key(record.github_url) or "")
+        position = self.positions.get(identity)
+        if position is None:
+            self.positions[identity] = len(self.records)
+            entry = {field_name: getattr(record, field_name) for field_name in self.TEXT_FIELDS[1:]}
+            entry["name"] = lib_name
+            entry["environments"] = set(record.environments)
+            entry["files"] = file_ids
+            entry["projects"] = {project} if project else set()
+            self.records.append(entry)
+            return
+        
+        # Câmpurile goale se completează din duplicat, listele se reunesc
+        entry = self.records[position]
+        for field_name in self.TEXT_FIELDS[1:]:
+            value = getattr(record, field_name)
+            if value and not entry[field_name]:
+                entry[field_name] = value
+        entry["environments"].update(record.environments)
+        entry["files"].update(file_ids)
+        if project:
+            entry["projects"].add(project)
+
+    @staticmethod
+    def sort_text(text):
+        """Cheia de sortare comună cu pagina: fără diacritice, cu litere mici.
+        
+        Rezultatul este codificat UTF-16, ca să fie comparat pe aceleași unități
+        ca șirurile în JavaScript.
+        """
+        decomposed = unicodedata.normalize("NFD", text)
+        stripped = "".join(c for c in decomposed if not unicodedata.category(c).startswith("M"))
+        return stripped.lower().encode("utf-16-be")
+
+    @staticmethod
+    def version_status(version, latest_version):
+        """Starea versiunii, ca în pagină: current, outdated sau unknown.
+        
+        Specificațiile (`^6.21.0`, `~1.2`) sunt la zi dacă admit ultima versiune publicată;
+        versiunile care nu pot fi parsate sunt comparate ca text.
+        """
+        if not version or not latest_version:
+            return "unknown"
+        behind = parse_version_spec(version).behind(parse_version_spec(latest_version))
+        if behind is None:
+            behind = version.lstrip("v") != latest_version.lstrip("v")
+        return "outdated" if behind else "current"
+
+    def to_dict(self):
+        records = self.records
+        rows = []
+        for entry in records:
+            rows.append([entry[field_name] for field_name in self.TEXT_FIELDS] + [
+                sorted(entry["environments"]),
+                sorted(entry["files"]),
+                sorted(entry["projects"]),
+                self.version_status(entry["version"], entry["latest_version"]),
+            ])
+        
+        # Cheile de sortare sunt calculate o singură dată; egalitățile se departajează după nume
+        names = [self.sort_text(entry["name"]) for entry in records]
+        sort_orders = {}
+        for sort_key in self.SORT_KEYS:
+            keys = [(self.sort_text(entry[sort_key]), names[i]) for i, entry in enumerate(records)]
+            sort_orders[sort_key] = sorted(range(len(records)), key=keys.__getitem__)
+        
+        # Mediile sunt căutate în forma afișată și în CSV („a, b”)
+        search_columns = [self.FIELDS.index(field_name) for field_name in self.SEARCH_FIELDS]
+        postings = defaultdict(set)
+        for i, row in enumerate(rows):
+            for column in search_columns:
+                value = row[column]
+                text = ", ".join(value) if isinstance(value, list) else value
+                for token in self.TOKEN_PATTERN.findall(text.lower()):
+                    postings[token].add(i)
+        # Ordinea unităților UTF-16 este cea a comparației `<` din pagină (căutarea binară)
+        tokens = sorted(postings, key=lambda token: token.encode("utf-16-be"))
+        
+        by_source = defaultdict(int)
+        for entry in records:
+            by_source[entry["source"]] += 1
+        statuses = [row[-1] for row in rows]
+        return {
+            "version": self.VERSION,
+            "generated": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "fields": list(self.FIELDS),
+            "records": rows,
+            "files": self.files.paths,
+            "sort": sort_orders,
+            "stats": {
+                "total": self.rows_seen,
+                "unique": len(records),
+                "with_versions": sum(1 for entry in records if entry["version"].strip()),
+                "outdated": statuses.count("outdated"),
+                "by_source": dict(sorted(by_source.items())),
+                "projects": len({p for entry in records for p in entry["projects"]}),
+            },
+            "search": {
+                "tokens": tokens,
+                "postings": [sorted(postings[token]) for token in tokens],
+            },
+        }
+
+    def to_json(self):
+        """Serializarea compactă a pachetului (fără spații)."""
+        return json.dumps(self.to_dict(), ensure_ascii=False, separators=(",", ":"))
+
+    def write(self, output_file):
+        with atomic_output(output_file) as temp_path, open(temp_path, "w", encoding="utf-8") as f:
+            f.write(self.to_json())
+
+
+class BundleWriter:
+    """Scrie pachetul JSON al raportului (vezi `ReportBundle`)."""
+
+    label = "bundle JSON"
+    extension = ".bundle.json"
+
+    def __init__(self, output_file):
+        self.output_file = output_file
+
+    def write(self, records, paths):
+        bundle = ReportBundle()
+        for lib_name, record in records:
+            bundle.add(lib_name, record, paths)
+        bundle.write(self.output_file)
+
+
+OUTPUT_WRITERS = {
+    "csv": CsvWriter, "ndjson": NdjsonWriter, "sqlite": SqliteWriter, "bundle": BundleWriter,
+}
+
+
 class LibraryAnalyzer:
-    def __init__(self, project_dir, output_file, github_token=None):
-        self.project_dir = os.path.abspath(project_dir)
+    def __init__(self, project_dir, output_file, github_token=None,
+                 prune_patterns=None, respect_gitignore=False, jobs=1, cache_path=None,
+                 github_client=None, registry=None, executor=None, output_formats=("csv",),
+                 include_graph=False, metrics=None, scan_archives=True):
+        # Un proiect arhivat este analizat direct din arhivă, cu căi relative la rădăcina lui
+        self.project_dir = archive_project_root(os.path.abspath(project_dir))
         self.output_file = output_file
         self.github_token = github_token
-        self.libraries = defaultdict(lambda: {
-            "name": "",
-            "version": "",
-            "author": "",
-            "github_url": "",
-            "description": "",
-            "homepage": "",
-            "latest_version": "",
-            "files_found_in": set(),
-            "source": ""
-        })
-        self.headers = {}
-        if github_token:
-            self.headers = {"Authorization": f"token {github_token}"}
+        self.jobs = max(1, jobs or 1)
+        self.cache_path = cache_path
+        self.scan_cache = None
+        # Pool de procese comun (de ex. în modul batch); altfel se creează unul la nevoie
+        self.executor = executor
+        self.prune_patterns = prune_patterns
+        self.respect_gitignore = respect_gitignore
+        self.scan_archives = scan_archives
+        self.inventory = None
+        # Rezultatele scanării pentru fiecare fișier sursă, după calea relativă
+        self.source_results = {}
+        # Manifestele deja citite, după (tip, cale); modul watch le invalidează la modificare
+        self.manifest_results = {}
+        # Rădăcinile bibliotecilor găsite în manifeste: director relativ → nume
+        self.library_roots = {}
+        # Fișierele `extra_configs` ale platformio.ini, urmărite și în modul watch
+        self.platformio_extra_configs = []
+        self.include_graph = None
+        self.write_include_graph_file = include_graph
+        self.output_formats = output_formats
+        self.paths = PathTable()
+        self.libraries = defaultdict(LibraryRecord)
+        self.github_client = github_client
+        # Bibliotecile (nume, repo) al căror eșec GitHub a fost deja raportat
+        self.reported_github_failures = set()
+        self.registry = registry
+        # Instrumentarea rulării (comună tuturor proiectelor în modul batch)
+        self.metrics = metrics or Metrics()
     
     def run(self):
+        self.scan()
+        
+        # Completează datele din indexul local al registrelor, apoi de pe GitHub
+        if self.registry is not None:
+            with self.metrics.phase("registry"):
+                self.enrich_with_registry()
+        with self.metrics.phase("enrichment"):
+            self.enrich_with_github_data()
+        
+        # Scrie datele în formatele de ieșire cerute
+        with self.metrics.phase("write"):
+            self.write_outputs()
+        
+        return len(self.libraries)
+    
+    def scan(self):
+        """Rulează fazele locale ale analizei: parcurgere, surse, PlatformIO și manifeste Arduino."""
         print(f"Scanez proiectul la locația: {self.project_dir}")
         
+        metrics = self.metrics
+        
+        # O singură parcurgere a arborelui, folosită de toate fazele
+        with metrics.phase("walk"):
+            inventory = self.build_inventory()
+        
+        # Rezultatele nemodificate de la rularea anterioară sunt luate din cache
+        if self.cache_path:
+            self.scan_cache = ScanCache(self.cache_path, self.project_dir)
+        
         # Scanează fișierele sursă
-        source_files = self.find_files(['.cpp', '.h', '.ino'])
-        for file_path in source_files:
-            self.extract_libraries_from_code(file_path)
+        with metrics.phase("code_scan"):
+            self.scan_sources(inventory.sources)
+        
+        self.build_library_table(inventory)
+        # Sursele și manifestele din arhive au fost citite; conținutul lor nu mai e necesar
+        ArchiveReader.release(inventory.archives)
+        
+        if self.scan_cache is not None:
+            print(f"Cache scanare: {self.scan_cache.hits} fișiere reutilizate, "
+                  f"{self.scan_cache.misses} analizate")
+            metrics.count("scan_cache_hits", self.scan_cache.hits)
+            metrics.count("scan_cache_misses", self.scan_cache.misses)
+            self.scan_cache.close()
+            self.scan_cache = None
+    
+    def build_library_table(self, inventory):
+        """Construiește tabelul bibliotecilor din surse deja scanate și din manifeste."""
+        metrics = self.metrics
         
         # Scanează fișierele specifice PlatformIO
-        self.analyze_platformio_files()
+        with metrics.phase("platformio"):
+            self.analyze_platformio_files(inventory)
         
         # Scanează fișierele specifice Arduino
-        self.analyze_arduino_library_files()
+        with metrics.phase("arduino_manifests"):
+            self.analyze_arduino_library_files(inventory)
+        
+        # Include-urile se atribuie bibliotecilor după ce rădăcinile lor sunt cunoscute
+        with metrics.phase("includes"):
+            self.resolve_includes()
+            self.resolve_source_metadata()
+    
+    def update(self, inventory, changed_paths):
+        """Actualizează analiza după modificarea unor fișiere (modul watch).
+        
+        Doar sursele și manifestele din `changed_paths` (căi absolute: modificate,
+        adăugate sau șterse) sunt recitite; celelalte rezultate rămân în memorie, iar
+        tabelul bibliotecilor se reconstruiește din ele. Datele GitHub sunt memorate
+        de client, deci se fac cereri doar pentru repo-uri noi.
+        """
+        self.inventory = inventory
+        for file_path in changed_paths:
+            self.source_results.pop(os.path.relpath(file_path, self.project_dir), None)
+        self.manifest_results = {
+            key: result for key, result in self.manifest_results.items()
+            if key[1] not in changed_paths
+        }
         
-        # Îmbogățește informațiile despre biblioteci cu date de pe GitHub
-        self.enrich_with_github_data()
+        # Rezultatele fișierelor șterse dispar; fișierele noi sau modificate sunt scanate
+        current = {os.path.relpath(path, self.project_dir): path for path in inventory.sources}
+        self.source_results = {
+            rel_path: result for rel_path, result in self.source_results.items() if rel_path in current
+        }
+        pending = [path for rel_path, path in current.items() if rel_path not in self.source_results]
+        with self.metrics.phase("code_scan"):
+            self.scan_sources(pending)
         
-        # Scrie datele în fișierul CSV
-        self.write_to_csv()
+        self.libraries = defaultdict(LibraryRecord)
+        self.paths = PathTable()
+        self.library_roots = {}
+        self.build_library_table(inventory)
+        ArchiveReader.release(inventory.archives)
         
+        if self.registry is not None:
+            with self.metrics.phase("registry"):
+                self.enrich_with_registry()
+        with self.metrics.phase("enrichment"):
+            self.enrich_with_github_data()
+        with self.metrics.phase("write"):
+            self.write_outputs()
         return len(self.libraries)
     
+    def build_inventory(self):
+        """Construiește (o singură dată) inventarul fișierelor proiectului."""
+        if self.inventory is None:
+            self.inventory = ProjectInventory.build(
+                self.project_dir,
+                prune_patterns=self.prune_patterns,
+                respect_gitignore=self.respect_gitignore,
+                scan_archives=self.scan_archives,
+            )
+            metrics = self.metrics
+            metrics.count("dirs_visited", self.inventory.dirs_visited)
+            metrics.count("dirs_pruned", self.inventory.dirs_pruned)
+            metrics.count("files_visited", self.inventory.files_visited)
+            metrics.count("archives_visited", self.inventory.archives_visited)
+            metrics.count("source_files", len(self.inventory.sources))
+            for kind, path, message in self.inventory.errors:
+                metrics.record_error(kind, message, path)
+        return self.inventory
+    
     def find_files(self, extensions):
-        """Găsește toate fișierele cu extensiile specificate în directorul dat."""
-        matched_files = []
-        for dirpath, dirnames, filenames in os.walk(self.project_dir):
-            for filename in filenames:
-                if any(filename.endswith(ext) for ext in extensions):
-                    matched_files.append(os.path.join(dirpath, filename))
-        return matched_files
+        """Găsește toate fișierele sursă cu extensiile specificate, din inventarul proiectului."""
+        extensions = tuple(extensions)
+        return [path for path in self.build_inventory().sources if path.endswith(extensions)]
+    
+    def scan_sources(self, source_files):
+        """Scanează fișierele sursă, serial sau într-un pool de procese (`jobs` > 1).
+        
+        Rezultatele sunt combinate în ordinea inventarului, deci ieșirea este
+        identică cu cea a rulării seriale.
+        """
+        results = {}
+        pending = []
+        for file_path in source_files:
+            known_digest = None
+            st = None
+            if self.scan_cache is not None:
+                try:
+                    st = file_stat(file_path)
+                except OSError as e:
+                    self.metrics.error("read", f"Eroare la citirea fișierului {file_path}: {e}", file_path)
+                    continue
+                rel_path = os.path.relpath(file_path, self.project_dir)
+                cached, known_digest = self.scan_cache.lookup(rel_path, "source", st)
+                if cached is not None:
+                    results[file_path] = cached
+                    continue
+            pending.append((file_path, st, known_digest))
+        
+        paths = [item[0] for item in pending]
+        digests = [item[2] for item in pending]
+        chunksize = max(1, min(MAX_SCAN_CHUNK, len(pending) // (self.jobs * 4)))
+        if self.executor is not None:
+            contents = [preloaded_member(path) for path in paths]
+            scanned = self.executor.map(_scan_source_worker, paths, digests, contents, chunksize=chunksize)
+            self._collect_scans(pending, scanned, results, pooled=True)
+        elif self.jobs == 1 or len(pending) < 2:
+            self._collect_scans(pending, map(_scan_source_worker, paths, digests), results)
+        else:
+            # Membrii tar citiți deja la listare sunt trimiși proceselor; cei zip sunt citiți acolo
+            contents = [preloaded_member(path) for path in paths]
+            with ProcessPoolExecutor(max_workers=self.jobs) as executor:
+                scanned = executor.map(_scan_source_worker, paths, digests, contents, chunksize=chunksize)
+                self._collect_scans(pending, scanned, results, pooled=True)
+        
+        for file_path in source_files:
+            if file_path in results:
+                self.record_source_result(file_path, results[file_path])
+    
+    def _collect_scans(self, pending, scanned, results, pooled=False):
+        """Preia rezultatele scanărilor și actualizează cache-ul de scanare.
+        
+        Cu `pooled`, timpul CPU raportat de procesele din pool se adaugă fazei `code_scan`
+        (scanarea serială e deja inclusă în CPU-ul firului curent).
+        """
+        metrics = self.metrics
+        for (file_path, st, known_digest), (result, digest, error, stats) in zip(pending, scanned):
+            if pooled:
+                metrics.add_worker_cpu("code_scan", stats.get("cpu_time", 0.0))
+            if error is not None:
+                metrics.error("read", f"Eroare la citirea fișierului {file_path}: {error}", file_path)
+                continue
+            metrics.count("files_scanned")
+            metrics.count("bytes_read", stats.get("bytes", 0))
+            metrics.add_time("regex", stats.get("regex_time", 0.0))
+            if self.scan_cache is not None:
+                rel_path = os.path.relpath(file_path, self.project_dir)
+                if result is None:
+                    result = self.scan_cache.revalidate(rel_path, "source", st)
+                else:
+                    self.scan_cache.store(rel_path, "source", st, digest, result)
+            results[file_path] = result
+    
+    def read_manifest(self, kind, file_path, reader):
+        """Citește un manifest cu `reader`, trecând prin cache-ul de scanare dacă este activ."""
+        key = (kind, file_path)
+        if key in self.manifest_results:
+            return self.manifest_results[key]
+        
+        st = file_stat(file_path)
+        if self.scan_cache is None:
+            self.metrics.count("manifests_read")
+            self.metrics.count("bytes_read", st.st_size)
+            result = self.manifest_results[key] = reader(file_path)
+            return result
+        
+        rel_path = os.path.relpath(file_path, self.project_dir)
+        result, known_digest = self.scan_cache.lookup(rel_path, kind, st)
+        if result is None:
+            self.metrics.count("manifests_read")
+            self.metrics.count("bytes_read", st.st_size)
+            digest = content_digest(read_file_bytes(file_path))
+            if digest == known_digest:
+                result = self.scan_cache.revalidate(rel_path, kind, st)
+            else:
+                result = reader(file_path)
+                self.scan_cache.store(rel_path, kind, st, digest, result)
+        self.manifest_results[key] = result
+        return result
     
     def extract_libraries_from_code(self, file_path):
         """Extrage bibliotecile din fișier bazat pe directive #include."""
-        include_pattern = re.compile(r'#include\s+[<"]([^>"]+)[>"]')
-        version_pattern = re.compile(r'#define\s+(\w+_VERSION|VERSION_\w+)\s+["\']?([0-9\.]+)["\']?')
-        github_pattern = re.compile(r'(?:https?://)?(?:www\.)?github\.com/([a-zA-Z0-9_-]+/[a-zA-Z0-9_-]+)')
-        author_pattern = re.compile(r'@author\s+([^\n]+)')
-        desc_pattern = re.compile(r'/\*\*\s*\n\s*\*\s*([^\n]+)')
-        
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                content = file.read()
+            result, _ = scan_source_file(file_path)
+        except OSError as e:
+            self.metrics.error("read", f"Eroare la citirea fișierului {file_path}: {e}", file_path)
+            return
+        self.record_source_result(file_path, result)
+    
+    def record_source_result(self, file_path, result):
+        """Înregistrează rezultatul scanării unui fișier (include-urile se rezolvă ulterior)."""
+        rel_path = os.path.relpath(file_path, self.project_dir)
+        self.source_results[rel_path] = result
+    
+    def resolve_includes(self):
+        """Atribuie fiecare include bibliotecii care îl conține și construiește graful include-urilor.
+        
+        Header-ele proiectului (src, include, schița) nu sunt raportate ca biblioteci;
+        include-urile nerezolvate rămân identificate după numele header-ului.
+        """
+        self.include_graph = IncludeGraph(self.source_results, self.library_roots)
+        for rel_path in sorted(self.source_results):
+            libraries = self.include_graph.add_file(rel_path, self.source_results[rel_path]["includes"])
+            for lib_name in libraries:
+                if lib_name not in self.libraries:
+                    self.libraries[lib_name].name = lib_name
+                    self.libraries[lib_name].source = "code"
+                self.libraries[lib_name].file_ids.add(self.paths.intern(rel_path))
+    
+    def resolve_source_metadata(self):
+        """Atribuie metadatele găsite în surse bibliotecii al cărei header le definește."""
+        # Bibliotecile din cod sunt identificate după numele header-ului; indexăm după nume fără extensie
+        libs_by_stem = defaultdict(list)
+        for lib_name, lib_info in self.libraries.items():
+            if lib_info.source == "code":
+                libs_by_stem[os.path.splitext(lib_name)[0].lower()].append(lib_name)
+        
+        # Header-ele au prioritate față de implementări; apoi ordinea căilor, pentru determinism
+        ordered = sorted(
+            self.source_results.items(),
+            key=lambda item: (not item[0].endswith(".h"), item[0]),
+        )
+        for rel_path, result in ordered:
+            stem = os.path.splitext(os.path.basename(rel_path))[0]
+            for lib_name in libs_by_stem.get(stem.lower(), ()):
+                lib_info = self.libraries[lib_name]
                 
-                # Extrage include-urile
-                includes = include_pattern.findall(content)
-                for inc in includes:
-                    lib_name = os.path.basename(inc)
-                    if lib_name not in self.libraries:
-                        self.libraries[lib_name]["name"] = lib_name
-                        self.libraries[lib_name]["source"] = "code"
-                    
-                    rel_path = os.path.relpath(file_path, self.project_dir)
-                    self.libraries[lib_name]["files_found_in"].add(rel_path)
+                # Versiunea
+                if not lib_info.version:
+                    lib_base = os.path.splitext(lib_name)[0].upper()
+                    for version_var, version_val in result["versions"]:
+                        if lib_base in version_var:
+                            lib_info.version = version_val
+                            break
                 
-                # Pentru fiecare bibliotecă, încearcă să găsești informații suplimentare
-                for lib_name in self.libraries:
-                    # Versiunea
-                    if not self.libraries[lib_name]["version"]:
-                        lib_base = os.path.splitext(lib_name)[0].upper()
-                        for version_var, version_val in version_pattern.findall(content):
-                            if lib_base in version_var:
-                                self.libraries[lib_name]["version"] = version_val
-                                break
-                    
-                    # Link GitHub
-                    if not self.libraries[lib_name]["github_url"]:
-                        github_matches = github_pattern.findall(content)
-                        if github_matches:
-                            self.libraries[lib_name]["github_url"] = f"https://github.com/{github_matches[0]}"
-                    
-                    # Autor
-                    if not self.libraries[lib_name]["author"]:
-                        author_matches = author_pattern.findall(content)
-                        if author_matches:
-                            self.libraries[lib_name]["author"] = author_matches[0].strip()
-                    
-                    # Descriere
-                    if not self.libraries[lib_name]["description"]:
-                        desc_matches = desc_pattern.findall(content)
-                        if desc_matches:
-                            self.libraries[lib_name]["description"] = desc_matches[0].strip()
-        
-        except (UnicodeDecodeError, IOError) as e:
-            print(f"Eroare la citirea fișierului {file_path}: {e}")
-    
-    def analyze_platformio_files(self):
+                # Link GitHub, autor și descriere
+                if not lib_info.github_url and result["github"]:
+                    lib_info.github_url = f"https://github.com/{result['github']}"
+                if not lib_info.author and result["author"]:
+                    lib_info.author = result["author"]
+                if not lib_info.description and result["description"]:
+                    lib_info.description = result["description"]
+    
+    def analyze_platformio_files(self, inventory=None):
         """Analizează fișierele specifice PlatformIO pentru informații despre biblioteci."""
+        inventory = inventory or self.build_inventory()
+        
         # Verifică platformio.ini
-        platformio_ini = os.path.join(self.project_dir, "platformio.ini")
-        if os.path.exists(platformio_ini):
+        platformio_ini = inventory.platformio_ini
+        if platformio_ini:
             try:
-                config = configparser.ConfigParser()
-                config.read(platformio_ini)
-                
-                for section in config.sections():
-                    if "env:" in section:
-                        if config.has_option(section, "lib_deps"):
-                            libs = config.get(section, "lib_deps").split("\n")
-                            for lib_dep in libs:
-                                lib_dep = lib_dep.strip()
-                                if not lib_dep or lib_dep.startswith("#"):
-                                    continue
-                                
-                                # Analizează dependența bibliotecii
-                                self.parse_platformio_lib_dep(lib_dep)
+                config = PlatformIOConfig(platformio_ini)
+                self.platformio_extra_configs = config.extra_configs
+            except Exception as e:
+                self.metrics.error("platformio", f"Eroare la citirea platformio.ini: {e}", platformio_ini)
+                config = None
             
+            # Dependențele efective ale fiecărui mediu (extends, [env], ${...} rezolvate)
+            for environment in config.environments() if config else ():
+                try:
+                    lib_deps = config.lib_deps(environment)
+                except ValueError as e:
+                    self.metrics.error(
+                        "platformio",
+                        f"Eroare la rezolvarea lib_deps pentru env:{environment}: {e}",
+                        platformio_ini,
+                    )
+                    continue
+                for lib_dep in lib_deps:
+                    # Analizează dependența bibliotecii
+                    self.parse_platformio_lib_dep(lib_dep, environment)
+        
+        # Fișierele lib_deps_...json din .platformio conțin date despre biblioteci
+        for metadata_path in inventory.platformio_metadata:
+            filename = os.path.basename(metadata_path)
+            try:
+                lib_data = self.read_manifest("lib_deps", metadata_path, read_json_manifest)
+                for lib in lib_data:
+                    if "name" in lib:
+                        lib_name = lib["name"]
+                        self.libraries[lib_name].name = lib_name
+                        self.libraries[lib_name].source = "platformio"
+                        
+                        if "version" in lib:
+                            self.libraries[lib_name].version = lib["version"]
+                        
+                        if "meta" in lib:
+                            meta = lib["meta"]
+                            if "author" in meta:
+                                self.libraries[lib_name].author = meta["author"]
+                            if "description" in meta:
+                                self.libraries[lib_name].description = meta["description"]
+                            if "homepage" in meta:
+                                self.libraries[lib_name].homepage = meta["homepage"]
+                                # Presupunem că link-ul homepage ar putea fi GitHub
+                                if "github.com" in meta["homepage"]:
+                                    self.libraries[lib_name].github_url = meta["homepage"]
             except Exception as e:
-                print(f"Eroare la citirea platformio.ini: {e}")
-        
-        # Verifică .platformio directory pentru metadate
-        platformio_dir = os.path.join(self.project_dir, ".platformio")
-        if os.path.exists(platformio_dir):
-            for dirpath, dirnames, filenames in os.walk(platformio_dir):
-                # Caută fișiere lib_deps_...json care conțin date despre biblioteci
-                for filename in filenames:
-                    if filename.startswith("lib_deps_") and filename.endswith(".json"):
-                        try:
-                            with open(os.path.join(dirpath, filename), 'r') as f:
-                                lib_data = json.load(f)
-                                for lib in lib_data:
-                                    if "name" in lib:
-                                        lib_name = lib["name"]
-                                        self.libraries[lib_name]["name"] = lib_name
-                                        self.libraries[lib_name]["source"] = "platformio"
-                                        
-                                        if "version" in lib:
-                                            self.libraries[lib_name]["version"] = lib["version"]
-                                        
-                                        if "meta" in lib:
-                                            meta = lib["meta"]
-                                            if "author" in meta:
-                                                self.libraries[lib_name]["author"] = meta["author"]
-                                            if "description" in meta:
-                                                self.libraries[lib_name]["description"] = meta["description"]
-                                            if "homepage" in meta:
-                                                self.libraries[lib_name]["homepage"] = meta["homepage"]
-                                                # Presupunem că link-ul homepage ar putea fi GitHub
-                                                if "github.com" in meta["homepage"]:
-                                                    self.libraries[lib_name]["github_url"] = meta["homepage"]
-                        except Exception as e:
-                            print(f"Eroare la procesarea {filename}: {e}")
-    
-    def parse_platformio_lib_dep(self, lib_dep):
+                self.metrics.error("manifest", f"Eroare la procesarea {filename}: {e}", metadata_path)
+    
+    def parse_platformio_lib_dep(self, lib_dep, environment=None):
         """Analizează o dependență de bibliotecă specificată în platformio.ini."""
         # Formate posibile:
         # 1. name
@@ -185,6 +2879,7 @@ class LibraryAnalyzer:
         lib_name = ""
         lib_version = ""
         lib_url = ""
+        github_url = ""
         
         if "=" in lib_dep:
             # Formatul: name=version
@@ -211,227 +2906,1207 @@ class LibraryAnalyzer:
                 path_parts = parsed_url.path.strip("/").split("/")
                 if len(path_parts) >= 2:
                     lib_name = path_parts[1]
-                    self.libraries[lib_name]["github_url"] = f"https://github.com/{path_parts[0]}/{path_parts[1]}"
+                    if lib_name.endswith(".git"):
+                        lib_name = lib_name[:-4]
+                    github_url = f"https://github.com/{path_parts[0]}/{lib_name}"
             else:
                 # Nu putem determina numele, folosim URL ca identificator
                 lib_name = lib_url
         else:
             # Formatul: name sau owner/name
             lib_name = lib_dep
-            if "/" in lib_dep and not lib_dep.startswith(("/", "./", "../")):
-                # Aceasta pare a fi o dependență GitHub
-                self.libraries[lib_name]["github_url"] = f"https://github.com/{lib_dep}"
         
         # Eliminăm orice spații sau ghilimele
         lib_name = lib_name.strip(' "\'')
         
+        guessed_github_url = ""
+        if not lib_url and "/" in lib_name and not lib_name.startswith(("/", "./", "../")):
+            # Formatul owner/name: repo-ul din indexul registrelor are prioritate; fără date
+            # din registru, URL-ul GitHub este doar presupus
+            entry = self.registry.resolve(lib_name) if self.registry is not None else None
+            if entry is None:
+                guessed_github_url = f"https://github.com/{lib_name}"
+            elif entry["repo_url"] and github_repo_key(entry["repo_url"]):
+                github_url = entry["repo_url"]
+        
         # Actualizăm datele bibliotecii
         if lib_name:
             if lib_name not in self.libraries:
-                self.libraries[lib_name]["name"] = lib_name
-                self.libraries[lib_name]["source"] = "platformio_ini"
+                self.libraries[lib_name].name = lib_name
+                self.libraries[lib_name].source = "platformio_ini"
             
-            if lib_version and not self.libraries[lib_name]["version"]:
-                self.libraries[lib_name]["version"] = lib_version
+            if lib_version and not self.libraries[lib_name].version:
+                self.libraries[lib_name].version = lib_version
             
-            if lib_url and not self.libraries[lib_name]["homepage"]:
-                self.libraries[lib_name]["homepage"] = lib_url
-    
-    def analyze_arduino_library_files(self):
-        """Analizează fișierele specifice bibliotecilor Arduino."""
-        # Verifică library.properties și library.json în toate subdirectoarele
-        for dirpath, dirnames, filenames in os.walk(self.project_dir):
-            if "library.properties" in filenames:
-                self.parse_arduino_library_properties(os.path.join(dirpath, "library.properties"))
+            if lib_url and not self.libraries[lib_name].homepage:
+                self.libraries[lib_name].homepage = lib_url
+            
+            if github_url and not self.libraries[lib_name].github_url:
+                self.libraries[lib_name].github_url = github_url
             
-            if "library.json" in filenames:
-                self.parse_arduino_library_json(os.path.join(dirpath, "library.json"))
+            if guessed_github_url and not self.libraries[lib_name].guessed_github_url:
+                self.libraries[lib_name].guessed_github_url = guessed_github_url
             
-            # Verifică fișierele Arduino library_index.json
-            if "package_index.json" in filenames:
-                self.parse_arduino_package_index(os.path.join(dirpath, "package_index.json"))
+            if environment:
+                self.libraries[lib_name].environments.add(environment)
+    
+    def analyze_arduino_library_files(self, inventory=None):
+        """Analizează fișierele specifice bibliotecilor Arduino."""
+        inventory = inventory or self.build_inventory()
+        
+        # library.properties, library.json și package_index.json din toate subdirectoarele
+        for manifest_name, manifest_path in inventory.manifests:
+            if manifest_name == "library.properties":
+                self.parse_arduino_library_properties(manifest_path)
+            elif manifest_name == "library.json":
+                self.parse_arduino_library_json(manifest_path)
+            elif manifest_name == "package_index.json":
+                self.parse_arduino_package_index(manifest_path)
+    
+    def add_library_root(self, manifest_path, lib_name):
+        """Reține directorul manifestului ca rădăcină a bibliotecii (primul manifest are prioritate)."""
+        root = os.path.relpath(os.path.dirname(manifest_path), self.project_dir)
+        if root != os.curdir:
+            self.library_roots.setdefault(root, lib_name)
     
     def parse_arduino_library_properties(self, file_path):
         """Analizează fișierul library.properties al unei biblioteci Arduino."""
         try:
-            config = configparser.ConfigParser()
-            # Adaugă o secțiune implicită (library.properties nu are secțiuni)
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = '[global]\n' + f.read()
-            config.read_string(content)
+            fields = self.read_manifest("library.properties", file_path, read_library_properties)
             
-            if config.has_section("global"):
-                lib_name = config.get("global", "name", fallback="")
-                if lib_name:
-                    self.libraries[lib_name]["name"] = lib_name
-                    self.libraries[lib_name]["source"] = "arduino_library"
-                    self.libraries[lib_name]["version"] = config.get("global", "version", fallback="")
-                    self.libraries[lib_name]["author"] = config.get("global", "author", fallback="")
-                    self.libraries[lib_name]["description"] = config.get("global", "sentence", fallback="")
-                    
-                    # Încercăm să obținem URL-ul GitHub
-                    url = config.get("global", "url", fallback="")
-                    if url:
-                        self.libraries[lib_name]["homepage"] = url
-                        if "github.com" in url:
-                            self.libraries[lib_name]["github_url"] = url
+            lib_name = fields.get("name", "")
+            if lib_name:
+                self.add_library_root(file_path, lib_name)
+                self.libraries[lib_name].name = lib_name
+                self.libraries[lib_name].source = "arduino_library"
+                self.libraries[lib_name].version = fields.get("version", "")
+                self.libraries[lib_name].author = fields.get("author", "")
+                self.libraries[lib_name].description = fields.get("sentence", "")
+                
+                # Încercăm să obținem URL-ul GitHub
+                url = fields.get("url", "")
+                if url:
+                    self.libraries[lib_name].homepage = url
+                    if "github.com" in url:
+                        self.libraries[lib_name].github_url = url
         
         except Exception as e:
-            print(f"Eroare la citirea {file_path}: {e}")
+            self.metrics.error("manifest", f"Eroare la citirea {file_path}: {e}", file_path)
     
     def parse_arduino_library_json(self, file_path):
         """Analizează fișierul library.json al unei biblioteci Arduino/PlatformIO."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = self.read_manifest("library.json", file_path, read_json_manifest)
+            
+            lib_name = data.get("name", "")
+            if lib_name:
+                self.add_library_root(file_path, lib_name)
+                self.libraries[lib_name].name = lib_name
+                self.libraries[lib_name].source = "arduino_library_json"
+                self.libraries[lib_name].version = data.get("version", "")
+                self.libraries[lib_name].description = data.get("description", "")
                 
-                lib_name = data.get("name", "")
-                if lib_name:
-                    self.libraries[lib_name]["name"] = lib_name
-                    self.libraries[lib_name]["source"] = "arduino_library_json"
-                    self.libraries[lib_name]["version"] = data.get("version", "")
-                    self.libraries[lib_name]["description"] = data.get("description", "")
-                    
-                    # Autorul poate fi un string sau un obiect
-                    author = data.get("author", "")
-                    if isinstance(author, dict):
-                        self.libraries[lib_name]["author"] = author.get("name", "")
-                    elif isinstance(author, list) and len(author) > 0:
-                        if isinstance(author[0], dict):
-                            self.libraries[lib_name]["author"] = author[0].get("name", "")
-                        else:
-                            self.libraries[lib_name]["author"] = str(author[0])
+                # Autorul poate fi un string sau un obiect
+                author = data.get("author", "")
+                if isinstance(author, dict):
+                    self.libraries[lib_name].author = author.get("name", "")
+                elif isinstance(author, list) and len(author) > 0:
+                    if isinstance(author[0], dict):
+                        self.libraries[lib_name].author = author[0].get("name", "")
                     else:
-                        self.libraries[lib_name]["author"] = str(author)
-                    
-                    # Încercăm să obținem URL-ul GitHub
-                    repository = data.get("repository", {})
-                    if isinstance(repository, dict):
-                        repo_url = repository.get("url", "")
-                        if repo_url and "github.com" in repo_url:
-                            self.libraries[lib_name]["github_url"] = repo_url
-                    
-                    homepage = data.get("homepage", "")
-                    if homepage:
-                        self.libraries[lib_name]["homepage"] = homepage
-                        if "github.com" in homepage and not self.libraries[lib_name]["github_url"]:
-                            self.libraries[lib_name]["github_url"] = homepage
+                        self.libraries[lib_name].author = str(author[0])
+                else:
+                    self.libraries[lib_name].author = str(author)
+                
+                # Încercăm să obținem URL-ul GitHub
+                repository = data.get("repository", {})
+                if isinstance(repository, dict):
+                    repo_url = repository.get("url", "")
+                    if repo_url and "github.com" in repo_url:
+                        self.libraries[lib_name].github_url = repo_url
+                
+                homepage = data.get("homepage", "")
+                if homepage:
+                    self.libraries[lib_name].homepage = homepage
+                    if "github.com" in homepage and not self.libraries[lib_name].github_url:
+                        self.libraries[lib_name].github_url = homepage
         
         except Exception as e:
-            print(f"Eroare la citirea {file_path}: {e}")
+            self.metrics.error("manifest", f"Eroare la citirea {file_path}: {e}", file_path)
     
     def parse_arduino_package_index(self, file_path):
         """Analizează fișierul package_index.json pentru informații despre biblioteci."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                
-                for package in data.get("packages", []):
-                    for platform in package.get("platforms", []):
-                        for tool_dep in platform.get("toolsDependencies", []):
-                            name = tool_dep.get("name", "")
-                            version = tool_dep.get("version", "")
-                            if name:
-                                if name not in self.libraries:
-                                    self.libraries[name]["name"] = name
-                                    self.libraries[name]["source"] = "arduino_package"
-                                if version and not self.libraries[name]["version"]:
-                                    self.libraries[name]["version"] = version
+            tools = self.read_manifest("package_index.json", file_path, read_package_index)
+            
+            for name, version in tools:
+                if name:
+                    if name not in self.libraries:
+                        self.libraries[name].name = name
+                        self.libraries[name].source = "arduino_package"
+                    if version and not self.libraries[name].version:
+                        self.libraries[name].version = version
         
         except Exception as e:
-            print(f"Eroare la citirea {file_path}: {e}")
+            self.metrics.error("manifest", f"Eroare la citirea {file_path}: {e}", file_path)
+    
+    def enrich_with_registry(self):
+        """Completează URL-ul repo-ului, ultima versiune și autorul din indexul local al registrelor."""
+        resolved = 0
+        for lib_name, lib_info in self.libraries.items():
+            entry = self.registry.resolve(lib_name)
+            if entry is None:
+                continue
+            resolved += 1
+            if not lib_info.github_url and entry["repo_url"] and github_repo_key(entry["repo_url"]):
+                lib_info.github_url = entry["repo_url"]
+            if not lib_info.latest_version:
+                lib_info.latest_version = entry["latest_version"]
+            if not lib_info.author:
+                lib_info.author = entry["author"]
+            if not lib_info.description:
+                lib_info.description = entry["description"]
+            if not lib_info.homepage:
+                lib_info.homepage = entry["homepage"]
+        print(f"Index registre: {resolved} biblioteci rezolvate local")
     
     def enrich_with_github_data(self):
         """Îmbogățește informațiile despre biblioteci cu date de pe GitHub."""
+        if self.github_client is None:
+            self.github_client = GitHubClient(self.github_token, metrics=self.metrics)
+        
+        # Mai multe biblioteci pot indica același repo: fiecare repo e cerut o singură dată
+        repo_keys = self.github_repo_keys()
+        repos = self.github_client.fetch_repos(set(repo_keys.values()))
+        
+        for lib_name, key in repo_keys.items():
+            info = repos.get(key)
+            if info is None:
+                # Eșecurile sunt memorate de client; modul watch le-ar raporta la fiecare actualizare
+                if (lib_name, key) not in self.reported_github_failures:
+                    self.reported_github_failures.add((lib_name, key))
+                    error = self.github_client.failures.get(key, "date indisponibile")
+                    self.metrics.error(
+                        "github", f"Eroare la obținerea datelor de pe GitHub pentru {lib_name}: {error}"
+                    )
+                continue
+            
+            # Repo-ul presupus există pe GitHub, deci URL-ul devine confirmat
+            if not self.libraries[lib_name].github_url:
+                self.libraries[lib_name].github_url = self.libraries[lib_name].guessed_github_url
+            
+            # Actualizează datele bibliotecii
+            if not self.libraries[lib_name].description:
+                self.libraries[lib_name].description = info["description"]
+            if info["latest_version"]:
+                self.libraries[lib_name].latest_version = info["latest_version"]
+    
+    def github_repo_keys(self):
+        """Cheile canonice `owner/repo` ale bibliotecilor care au un URL GitHub (sigur sau presupus)."""
+        repo_keys = {}
         for lib_name, lib_info in self.libraries.items():
-            github_url = lib_info["github_url"]
-            if github_url:
-                # Extrage owner/repo din URL
-                parsed_url = urlparse(github_url)
-                path_parts = parsed_url.path.strip("/").split("/")
-                
-                if len(path_parts) >= 2:
-                    owner = path_parts[0]
-                    repo = path_parts[1]
-                    
-                    # Elimină .git din numele repo-ului dacă există
-                    if repo.endswith(".git"):
-                        repo = repo[:-4]
-                    
-                    # Obține datele despre repo de pe GitHub API
-                    try:
-                        api_url = f"https://api.github.com/repos/{owner}/{repo}"
-                        response = requests.get(api_url, headers=self.headers, timeout=10)
-                        
-                        if response.status_code == 200:
-                            repo_data = response.json()
-                            
-                            # Actualizează datele bibliotecii
-                            if not lib_info["description"]:
-                                self.libraries[lib_name]["description"] = repo_data.get("description", "")
-                            
-                            # Obține ultimele release-uri pentru a vedea ultima versiune
-                            releases_url = f"https://api.github.com/repos/{owner}/{repo}/releases"
-                            releases_response = requests.get(releases_url, headers=self.headers, timeout=10)
-                            
-                            if releases_response.status_code == 200:
-                                releases = releases_response.json()
-                                if releases:
-                                    # Primul release este cel mai recent
-                                    latest_version = releases[0].get("tag_name", "")
-                                    # Curăță tag-ul de prefixe comune precum 'v'
-                                    latest_version = latest_version.lstrip('v')
-                                    self.libraries[lib_name]["latest_version"] = latest_version
-                    
-                    except Exception as e:
-                        print(f"Eroare la obținerea datelor de pe GitHub pentru {lib_name}: {e}")
+            url = lib_info.github_url or lib_info.guessed_github_url
+            if url:
+                key = github_repo_key(url)
+                if key:
+                    repo_keys[lib_name] = key
+        return repo_keys
+    
+    def output_path(self, output_format):
+        """Calea fișierului de ieșire pentru un format (extensia se deduce din format)."""
+        extension = OUTPUT_WRITERS[output_format].extension
+        if self.output_file.endswith(extension):
+            return self.output_file
+        return os.path.splitext(self.output_file)[0] + extension
+    
+    def write_outputs(self):
+        """Scrie datele bibliotecilor în toate formatele cerute."""
+        for output_format in self.output_formats:
+            self.write_output(OUTPUT_WRITERS[output_format](self.output_path(output_format)))
+        if self.write_include_graph_file:
+            self.write_include_graph()
+    
+    def write_include_graph(self, output_file=None):
+        """Scrie în JSON bibliotecile directe și tranzitive ale fiecărei schițe."""
+        output_file = output_file or os.path.splitext(self.output_file)[0] + "_include_graph.json"
+        report = self.include_graph.report() if self.include_graph is not None else {}
+        try:
+            with atomic_output(output_file) as temp_path, open(temp_path, "w", encoding="utf-8") as f:
+                json.dump({"project": self.project_dir, "sketches": report}, f, indent=2, ensure_ascii=False)
+            print(f"Graful include-urilor a fost scris în {output_file}")
+        except Exception as e:
+            self.metrics.error("write", f"Eroare la scrierea în fișierul {output_file}: {e}", output_file)
+    
+    def write_output(self, writer):
+        """Transmite bibliotecile, sortate după nume, unui writer."""
+        try:
+            writer.write(
+                ((lib_name, self.libraries[lib_name]) for lib_name in sorted(self.libraries)),
+                self.paths,
+            )
+            print(f"Datele au fost scrise în {writer.output_file}")
+        except Exception as e:
+            self.metrics.error("write", f"Eroare la scrierea în fișierul {writer.label}: {e}", writer.output_file)
     
     def write_to_csv(self):
         """Scrie datele bibliotecilor în fișierul CSV."""
-        fieldnames = [
-            "name", "version", "latest_version", "author", "description", 
-            "github_url", "homepage", "source", "files_found_in"
-        ]
+        self.write_output(CsvWriter(self.output_file))
+
+
+def read_project_manifest(manifest_path):
+    """Citește lista de proiecte: o cale pe linie, opțional sub forma `nume=cale`."""
+    base_dir = os.path.dirname(os.path.abspath(manifest_path))
+    projects = []
+    with open(manifest_path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            name, sep, path = line.partition("=")
+            if not sep:
+                name, path = "", line
+            projects.append((name.strip(), os.path.join(base_dir, path.strip())))
+    return projects
+
+
+def unique_project_names(projects):
+    """Atribuie fiecărui proiect un nume unic, folosit pentru fișierele de ieșire.
+    
+    Același director, indicat de mai multe ori, este analizat o singură dată.
+    """
+    named = []
+    used = set()
+    seen_paths = set()
+    for name, path in projects:
+        real_path = os.path.realpath(path)
+        if real_path in seen_paths:
+            continue
+        seen_paths.add(real_path)
+        name = name or strip_archive_extension(os.path.basename(os.path.normpath(path))) or "proiect"
+        candidate = name
+        counter = 2
+        while candidate in used:
+            candidate = f"{name}_{counter}"
+            counter += 1
+        used.add(candidate)
+        named.append((candidate, path))
+    return named
+
+
+class BatchAnalyzer:
+    """Analizează mai multe proiecte cu un pool de lucru comun.
+    
+    Proiectele sunt scanate în paralel (fișierele sursă trec prin același pool de
+    procese), iar îmbogățirea din registre și de pe GitHub este deduplicată între
+    proiecte. Pe lângă CSV-ul fiecărui proiect se scrie un tabel combinat.
+    """
+
+    COMBINED_FIELDNAMES = ["name", "project", "version", "latest_version", "github_url", "source"]
+
+    def __init__(self, projects, output_dir, jobs=1, github_client=None, registry=None,
+                 metrics=None, **options):
+        self.projects = unique_project_names(projects)
+        self.output_dir = output_dir
+        self.jobs = max(1, jobs or 1)
+        self.metrics = metrics or Metrics()
+        self.github_client = github_client or GitHubClient(
+            options.get("github_token"), metrics=self.metrics
+        )
+        self.registry = registry
+        self.options = options
+        self.analyzers = {}
+
+    def run(self):
+        """Scanează, îmbogățește și scrie rezultatele pentru toate proiectele."""
+        os.makedirs(self.output_dir, exist_ok=True)
+        executor = ProcessPoolExecutor(max_workers=self.jobs) if self.jobs > 1 else None
+        try:
+            for name, path in self.projects:
+                self.analyzers[name] = LibraryAnalyzer(
+                    path,
+                    os.path.join(self.output_dir, f"{name}_libraries.csv"),
+                    jobs=self.jobs,
+                    github_client=self.github_client,
+                    registry=self.registry,
+                    executor=executor,
+                    metrics=self.metrics,
+                    **self.options,
+                )
+            with ThreadPoolExecutor(max_workers=self.jobs) as pool:
+                list(pool.map(LibraryAnalyzer.scan, self.analyzers.values()))
+        finally:
+            if executor is not None:
+                executor.shutdown()
+        
+        # Îmbogățire comună: fiecare repo GitHub este cerut o singură dată pentru toate proiectele
+        repo_keys = set()
+        for analyzer in self.analyzers.values():
+            if self.registry is not None:
+                with self.metrics.phase("registry"):
+                    analyzer.enrich_with_registry()
+            repo_keys.update(analyzer.github_repo_keys().values())
+        with self.metrics.phase("enrichment"):
+            self.github_client.fetch_repos(repo_keys)
+            for analyzer in self.analyzers.values():
+                analyzer.enrich_with_github_data()
+        
+        with self.metrics.phase("write"):
+            for analyzer in self.analyzers.values():
+                analyzer.write_outputs()
+            self.write_combined_csv()
+            if "bundle" in self.options.get("output_formats", ()):
+                self.write_combined_bundle()
+        return {name: len(analyzer.libraries) for name, analyzer in self.analyzers.items()}
+
+    def write_combined_csv(self):
+        """Scrie tabelul combinat: ce proiecte folosesc fiecare bibliotecă și în ce versiune."""
+        output_file = os.path.join(self.output_dir, "combined_libraries.csv")
+        rows = []
+        for project, analyzer in self.analyzers.items():
+            for lib_name, lib_info in analyzer.libraries.items():
+                rows.append({
+                    "name": lib_name,
+                    "project": project,
+                    "version": lib_info.version,
+                    "latest_version": lib_info.latest_version,
+                    "github_url": lib_info.github_url,
+                    "source": lib_info.source,
+                })
+        rows.sort(key=lambda row: (row["name"], row["project"]))
         
         try:
-            with open(self.output_file, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+            with atomic_output(output_file) as temp_path, \
+                    open(temp_path, 'w', newline='', encoding='utf-8') as csvfile:
+                writer = csv.DictWriter(csvfile, fieldnames=self.COMBINED_FIELDNAMES)
                 writer.writeheader()
-                
-                for lib_name, lib_info in sorted(self.libraries.items()):
-                    # Convertește set-ul de fișiere într-un string
-                    files_str = ", ".join(sorted(lib_info["files_found_in"]))
-                    
-                    row = {
-                        "name": lib_name,
-                        "version": lib_info["version"],
-                        "latest_version": lib_info["latest_version"],
-                        "author": lib_info["author"],
-                        "description": lib_info["description"],
-                        "github_url": lib_info["github_url"],
-                        "homepage": lib_info["homepage"],
-                        "source": lib_info["source"],
-                        "files_found_in": files_str
-                    }
-                    
-                    writer.writerow(row)
-            
-            print(f"Datele au fost scrise în {self.output_file}")
+                writer.writerows(rows)
+            print(f"Tabelul combinat a fost scris în {output_file}")
+        except Exception as e:
+            self.metrics.error("write", f"Eroare la scrierea în fișierul CSV: {e}", output_file)
+
+    def write_combined_bundle(self):
+        """Scrie pachetul JSON combinat: bibliotecile deduplicate între proiecte."""
+        output_file = os.path.join(self.output_dir, "combined_libraries" + BundleWriter.extension)
+        bundle = ReportBundle()
+        for project, analyzer in self.analyzers.items():
+            for lib_name in sorted(analyzer.libraries):
+                bundle.add(lib_name, analyzer.libraries[lib_name], analyzer.paths, project)
+        try:
+            bundle.write(output_file)
+            print(f"Pachetul combinat a fost scris în {output_file}")
+        except Exception as e:
+            self.metrics.error("write", f"Eroare la scrierea în fișierul {output_file}: {e}", output_file)
+
+
+class LiveReportHandler(BaseHTTPRequestHandler):
+    """Servește starea curentă: `/libraries`, `/bundle` (pachetul raportului) și `/status`.
+    
+    Răspunsurile au ETag după numărul generației, deci o interogare fără modificări
+    primește 304. Antetele CORS permit citirea doar din raport_tehnic.html deschis
+    local (originea `null` a paginilor file://) sau din originile date cu `--allow-origin`.
+    """
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_cors_headers(self):
+        # Răspunsul depinde de antetul Origin, deci nu poate fi refolosit pentru altă origine
+        self.send_header("Vary", "Origin")
+        origin = self.headers.get("Origin")
+        if origin != "null" and origin not in self.server.allowed_origins:
+            return
+        self.send_header("Access-Control-Allow-Origin", origin)
+        self.send_header("Access-Control-Allow-Headers", "If-None-Match")
+        self.send_header("Access-Control-Expose-Headers", "ETag")
+
+    def do_OPTIONS(self):
+        self.send_response(204)
+        self.send_cors_headers()
+        self.end_headers()
+
+    def do_GET(self):
+        path = urlparse(self.path).path.rstrip("/")
+        if path == "/libraries":
+            etag, body = self.server.libraries_payload()
+        elif path == "/bundle":
+            etag, body = self.server.bundle_payload()
+        elif path == "/status":
+            etag, body = None, self.server.status_payload()
+        else:
+            self.send_response(404)
+            self.send_cors_headers()
+            self.end_headers()
+            return
+        
+        if etag is not None and self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_cors_headers()
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-cache")
+        if etag is not None:
+            self.send_header("ETag", etag)
+        self.send_cors_headers()
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class LiveReportServer(ThreadingHTTPServer):
+    """Server HTTP local pentru modul watch; datele sunt serializate o dată pe actualizare."""
+
+    daemon_threads = True
+
+    def __init__(self, address, allowed_origins=()):
+        super().__init__(address, LiveReportHandler)
+        # Originile web (pe lângă file://) care pot citi datele din browser
+        self.allowed_origins = frozenset(origin.rstrip("/") for origin in allowed_origins)
+        self.lock = threading.Lock()
+        self.generation = 0
+        self.payload = b"[]"
+        self.bundle = ReportBundle().to_json().encode("utf-8")
+        self.status = {"generation": 0}
+
+    def publish(self, analyzer, duration):
+        """Serializează bibliotecile curente ale analizorului."""
+        rows = []
+        bundle = ReportBundle()
+        for lib_name in sorted(analyzer.libraries):
+            record = analyzer.libraries[lib_name]
+            rows.append(library_row(lib_name, record, analyzer.paths))
+            bundle.add(lib_name, record, analyzer.paths)
+        payload = json.dumps(rows, ensure_ascii=False).encode("utf-8")
+        bundle_payload = bundle.to_json().encode("utf-8")
+        with self.lock:
+            self.generation += 1
+            self.payload = payload
+            self.bundle = bundle_payload
+            self.status = {
+                "generation": self.generation,
+                "project": analyzer.project_dir,
+                "libraries": len(rows),
+                "updated": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "duration": round(duration, 6),
+            }
+
+    def libraries_payload(self):
+        with self.lock:
+            return f'"{self.generation}"', self.payload
+
+    def bundle_payload(self):
+        with self.lock:
+            return f'"{self.generation}"', self.bundle
+
+    def status_payload(self):
+        with self.lock:
+            return json.dumps(self.status, ensure_ascii=False).encode("utf-8")
+
+
+class ProjectWatcher:
+    """Modul watch: analiza rămâne în memorie și este actualizată la modificarea fișierelor.
+    
+    Arborele este verificat periodic (polling cu os.scandir, fără dependențe
+    externe): sursele, manifestele, platformio.ini și fișierele din `extra_configs`
+    sunt comparate după (mtime, dimensiune), iar analizorul recitește doar
+    fișierele modificate.
+    """
+
+    def __init__(self, analyzer, interval=1.0, server=None):
+        self.analyzer = analyzer
+        self.interval = interval
+        self.server = server
+        self.stats = {}
+
+    def snapshot(self):
+        """Inventarul curent al proiectului, cu amprentele fișierelor."""
+        inventory = ProjectInventory.build(
+            self.analyzer.project_dir,
+            prune_patterns=self.analyzer.prune_patterns,
+            respect_gitignore=self.analyzer.respect_gitignore,
+            with_stats=True,
+            scan_archives=self.analyzer.scan_archives,
+        )
+        self.add_config_stats(inventory)
+        return inventory
+
+    def add_config_stats(self, inventory):
+        """Adaugă amprentele fișierelor `extra_configs` (pot avea orice nume și pot fi în afara proiectului)."""
+        for path in self.analyzer.platformio_extra_configs:
+            if path in inventory.stats:
+                continue
+            try:
+                st = file_stat(path)
+            except OSError:
+                # Un fișier șters lipsește din amprente, deci apare ca modificat
+                continue
+            inventory.stats[path] = (st.st_mtime_ns, st.st_size)
+
+    def start(self):
+        """Rulează analiza completă inițială și publică rezultatul."""
+        start = time.perf_counter()
+        inventory = self.snapshot()
+        self.analyzer.inventory = inventory
+        num_libraries = self.analyzer.run()
+        # Fișierele `extra_configs` sunt cunoscute abia după citirea platformio.ini
+        self.add_config_stats(inventory)
+        self.stats = inventory.stats
+        if self.server is not None:
+            self.server.publish(self.analyzer, time.perf_counter() - start)
+        return num_libraries
+
+    def poll(self):
+        """O verificare a arborelui; returnează căile modificate (set gol dacă nu există)."""
+        inventory = self.snapshot()
+        previous = self.stats
+        changed = {path for path, stat in inventory.stats.items() if previous.get(path) != stat}
+        changed.update(path for path in previous if path not in inventory.stats)
+        if not changed:
+            return changed
+        
+        start = time.perf_counter()
+        num_libraries = self.analyzer.update(inventory, changed)
+        self.add_config_stats(inventory)
+        self.stats = inventory.stats
+        duration = time.perf_counter() - start
+        if self.server is not None:
+            self.server.publish(self.analyzer, duration)
+        print(f"Actualizare în {duration * 1000:.0f} ms: {len(changed)} fișiere modificate, "
+              f"{num_libraries} biblioteci")
+        return changed
+
+    def run(self):
+        """Verifică arborele la fiecare `interval` secunde, până la Ctrl+C."""
+        print(f"Urmăresc modificările din {self.analyzer.project_dir} (Ctrl+C pentru oprire)")
+        try:
+            while True:
+                time.sleep(self.interval)
+                self.poll()
+        except KeyboardInterrupt:
+            print("Modul watch a fost oprit.")
+
+
+def library_identity(name, github_url):
+    """Identitatea canonică a unei biblioteci: repo-ul GitHub (dacă există) și numele normalizat.
+    
+    Un repo poate conține mai multe biblioteci (sau un proiect întreg, ca WLED), deci
+    repo-ul singur nu identifică biblioteca.
+    """
+    name = normalized_library_name(name)
+    repo_key = github_repo_key(github_url or "")
+    if repo_key:
+        return f"github:{repo_key}:{name}"
+    return f"name:{name}"
+
+
+def normalized_library_name(name):
+    """Numele fără proprietar și fără extensia header-ului (`owner/Foo`, `Foo.h` → `Foo`).
+    
+    Majusculele sunt păstrate: `LittleFS.h` și `LITTLEFS.h` sunt headere diferite.
+    """
+    name = name.strip().rsplit("/", 1)[-1]
+    return name[:-2] if name.endswith(".h") else name
+
+
+def read_report_rows(report_path):
+    """Citește un raport scris de analizor: tupluri (proiect, nume, versiune, ultima versiune, URL GitHub).
+    
+    Sunt acceptate CSV-urile per proiect și cel combinat, NDJSON, SQLite și
+    pachetele `.bundle.json`; proiectul este "" pentru rapoartele unui singur proiect.
+    """
+    lower = report_path.lower()
+    if lower.endswith(".json"):
+        with open(report_path, "r", encoding="utf-8") as f:
+            bundle = json.load(f)
+        fields = bundle["fields"]
+        columns = [fields.index(name) for name in ("name", "version", "latest_version", "github_url")]
+        projects_column = fields.index("projects")
+        for record in bundle["records"]:
+            name, version, latest_version, github_url = (record[i] for i in columns)
+            for project in record[projects_column] or [""]:
+                yield project, name, version, latest_version, github_url
+    elif lower.endswith(".ndjson"):
+        with open(report_path, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    row = json.loads(line)
+                    yield "", row["name"], row["version"], row["latest_version"], row["github_url"]
+    elif lower.endswith(".sqlite"):
+        conn = sqlite3.connect(f"file:{report_path}?mode=ro", uri=True)
+        try:
+            for name, version, latest_version, github_url in conn.execute(
+                "SELECT name, version, latest_version, github_url FROM libraries"
+            ):
+                yield "", name, version or "", latest_version or "", github_url or ""
+        finally:
+            conn.close()
+    else:
+        with open(report_path, "r", newline="", encoding="utf-8") as f:
+            reader = csv.reader(f)
+            header = next(reader, [])
+            columns = [header.index(name) for name in ("name", "version", "latest_version", "github_url")]
+            project_column = header.index("project") if "project" in header else None
+            for row in reader:
+                if not row:
+                    continue
+                name, version, latest_version, github_url = (row[i] for i in columns)
+                project = row[project_column] if project_column is not None else ""
+                yield project, name, version, latest_version, github_url
+
+
+class ReportTable:
+    """Tabel în memorie, pe coloane, cu bibliotecile din mai multe rapoarte.
+    
+    Fiecare rând este (raport, proiect, identitate, versiune, ultima versiune), cu
+    șirurile internate ca ID-uri întregi. Fiecare versiune distinctă este parsată o
+    singură dată și primește un rang, deci compararea a două versiuni devine o
+    comparație de întregi. Indexul (raport, proiect) → {identitate: rând} permite
+    diferențele dintre instantanee ca operații pe mulțimi.
+    """
+
+    def __init__(self):
+        # Etichetele rapoartelor, în ordinea comparării, și căile lor
+        self.reports = []
+        # Tabele de internare (aceeași structură ca pentru căile fișierelor)
+        self.projects = PathTable()
+        self.identities = PathTable()
+        self.versions = PathTable()
+        self.names = {}
+        self.report_column = array("i")
+        self.project_column = array("i")
+        self.identity_column = array("i")
+        self.version_column = array("i")
+        self.latest_column = array("i")
+        # Nume normalizat → identitățile GitHub cu acel nume (pentru rândurile fără URL)
+        self.aliases = defaultdict(set)
+        self.specs = []
+        self.ranks = array("i")
+        self.snapshots = {}
+        # (nume, URL GitHub) → ID-ul identității; aceleași perechi se repetă în fiecare instantaneu
+        self._identity_ids = {}
+
+    def __len__(self):
+        return len(self.report_column)
+
+    def load(self, report_path, label=None):
+        """Adaugă rândurile unui raport; returnează numărul lor."""
+        # Raportul este citit complet înainte de a fi adăugat: un fișier invalid nu lasă rânduri parțiale
+        rows = list(read_report_rows(report_path))
+        report_id = len(self.reports)
+        self.reports.append((label or report_path, report_path))
+        count = 0
+        for project, name, version, latest_version, github_url in rows:
+            identity_id = self._identity_ids.get((name, github_url))
+            if identity_id is None:
+                identity = library_identity(name, github_url)
+                if identity.startswith("github:"):
+                    self.aliases[normalized_library_name(name)].add(identity)
+                identity_id = self._identity_ids[(name, github_url)] = self.identities.intern(identity)
+                self.names.setdefault(identity_id, name)
+            self.report_column.append(report_id)
+            self.project_column.append(self.projects.intern(project))
+            self.identity_column.append(identity_id)
+            self.version_column.append(self.versions.intern(version.strip()))
+            self.latest_column.append(self.versions.intern(latest_version.strip()))
+            count += 1
+        return count
+
+    def build_index(self):
+        """Parsează versiunile, unifică identitățile și construiește indexul instantaneelor."""
+        # O singură parsare și o singură sortare pentru toate versiunile distincte
+        self.specs = [parse_version_spec(version) for version in self.versions.paths]
+        ranked = sorted((spec.key, version_id) for version_id, spec in enumerate(self.specs)
+                        if spec.key is not None)
+        self.ranks = array("i", [-1]) * len(self.specs)
+        rank = -1
+        previous = None
+        for key, version_id in ranked:
+            if key != previous:
+                rank += 1
+                previous = key
+            self.ranks[version_id] = rank
+        
+        # Rândurile fără URL GitHub preiau identitatea GitHub cu același nume normalizat, dacă e unică
+        remap = list(range(len(self.identities)))
+        for identity_id, identity in enumerate(self.identities.paths):
+            if identity.startswith("name:"):
+                candidates = self.aliases.get(identity[5:], ())
+                if len(candidates) == 1:
+                    remap[identity_id] = self.identities.ids[next(iter(candidates))]
+        self.identity_column = array("i", (remap[i] for i in self.identity_column))
+        
+        # La duplicate într-un instantaneu se păstrează versiunea cea mai precisă
+        self.snapshots = {}
+        for row in range(len(self)):
+            snapshot = self.snapshots.setdefault((self.report_column[row], self.project_column[row]), {})
+            identity_id = self.identity_column[row]
+            current = snapshot.get(identity_id)
+            if current is None or self._preference(row) > self._preference(current):
+                snapshot[identity_id] = row
+
+    def _preference(self, row):
+        spec = self.specs[self.version_column[row]]
+        return (spec.raw != "", spec.kind == "exact", self.ranks[self.version_column[row]])
+
+    def name(self, identity_id):
+        return self.names.get(identity_id) or self.identities[identity_id]
+
+    def version(self, row):
+        return self.versions[self.version_column[row]]
+
+    def latest_version(self, row):
+        return self.versions[self.latest_column[row]]
+
+    def behind_latest(self, row):
+        """True dacă ultima versiune publicată nu este admisă de versiunea din rând."""
+        latest = self.specs[self.latest_column[row]]
+        if not latest.raw:
+            return None
+        return self.specs[self.version_column[row]].behind(latest)
+
+
+class VersionDrift:
+    """Deriva versiunilor între rapoarte: adăugări, eliminări, actualizări și rămâneri în urmă.
+    
+    Rapoartele sunt comparate în ordinea dată (de ex. instantanee zilnice sau
+    proiecte diferite), separat pentru fiecare proiect din rapoartele combinate.
+    """
+
+    CSV_FIELDNAMES = ["kind", "from_report", "report", "project", "name", "identity",
+                      "from_version", "version", "latest_version"]
+
+    def __init__(self, table):
+        self.table = table
+        self.transitions = []
+        self.behind = []
+        self.divergent = []
+        self.history = []
+
+    def compute(self):
+        table = self.table
+        by_project = defaultdict(list)
+        for report_id, project_id in table.snapshots:
+            by_project[project_id].append(report_id)
         
+        for project_id, report_ids in by_project.items():
+            for from_report, to_report in zip(report_ids, report_ids[1:]):
+                self.transitions.append(self._transition(project_id, from_report, to_report))
+            # Starea curentă a proiectului: ultimul raport în care apare
+            last = table.snapshots[(report_ids[-1], project_id)]
+            for identity_id, row in sorted(last.items(), key=lambda item: table.name(item[0]).lower()):
+                if table.behind_latest(row):
+                    self.behind.append((report_ids[-1], project_id, identity_id, row))
+        
+        for (report_id, project_id), snapshot in table.snapshots.items():
+            self.history.append({
+                "report": table.reports[report_id][0],
+                "project": table.projects[project_id],
+                "libraries": len(snapshot),
+                "behind_latest": sum(1 for row in snapshot.values() if table.behind_latest(row)),
+            })
+        self._find_divergent()
+        return self
+
+    def _transition(self, project_id, from_report, to_report):
+        table = self.table
+        before = table.snapshots[(from_report, project_id)]
+        after = table.snapshots[(to_report, project_id)]
+        version_column = table.version_column
+        ranks = table.ranks
+        changes = {"upgraded": [], "downgraded": [], "changed": []}
+        for identity_id in before.keys() & after.keys():
+            old_id = version_column[before[identity_id]]
+            new_id = version_column[after[identity_id]]
+            if old_id == new_id:
+                continue
+            old_rank, new_rank = ranks[old_id], ranks[new_id]
+            if old_rank >= 0 and new_rank >= 0 and old_rank != new_rank:
+                kind = "upgraded" if new_rank > old_rank else "downgraded"
+            elif old_rank >= 0 and old_rank == new_rank and table.specs[old_id].kind == table.specs[new_id].kind:
+                # Aceeași versiune scrisă altfel ("v1.2" / "1.2.0")
+                continue
+            else:
+                kind = "changed"
+            changes[kind].append((identity_id, before[identity_id], after[identity_id]))
+        
+        by_name = lambda item: table.name(item[0]).lower()
+        return {
+            "project": project_id,
+            "from": from_report,
+            "to": to_report,
+            "added": sorted(((i, after[i]) for i in after.keys() - before.keys()), key=by_name),
+            "removed": sorted(((i, before[i]) for i in before.keys() - after.keys()), key=by_name),
+            **{kind: sorted(items, key=by_name) for kind, items in changes.items()},
+        }
+
+    def _find_divergent(self):
+        """Bibliotecile folosite în versiuni diferite de proiectele aceluiași raport."""
+        table = self.table
+        by_report = defaultdict(lambda: defaultdict(dict))
+        for (report_id, project_id), snapshot in table.snapshots.items():
+            if table.projects[project_id]:
+                for identity_id, row in snapshot.items():
+                    by_report[report_id][identity_id][project_id] = row
+        for report_id, identities in by_report.items():
+            for identity_id, rows in sorted(identities.items(), key=lambda item: table.name(item[0]).lower()):
+                # Versiunile comparabile după rang și tip, celelalte după text
+                values = set()
+                for row in rows.values():
+                    version_id = table.version_column[row]
+                    rank = table.ranks[version_id]
+                    values.add((rank, table.specs[version_id].kind) if rank >= 0 else table.versions[version_id])
+                if len(values) > 1:
+                    self.divergent.append((report_id, identity_id, rows))
+
+    def _library(self, identity_id, row, **extra):
+        table = self.table
+        entry = {
+            "name": table.name(identity_id),
+            "identity": table.identities[identity_id],
+            "version": table.version(row),
+            "latest_version": table.latest_version(row),
+        }
+        entry.update(extra)
+        return entry
+
+    def to_dict(self):
+        table = self.table
+        label = lambda report_id: table.reports[report_id][0]
+        transitions = []
+        for transition in self.transitions:
+            entry = {
+                "from": label(transition["from"]),
+                "to": label(transition["to"]),
+                "project": table.projects[transition["project"]],
+            }
+            for kind in ("added", "removed"):
+                entry[kind] = [self._library(i, row) for i, row in transition[kind]]
+            for kind in ("upgraded", "downgraded", "changed"):
+                entry[kind] = [
+                    self._library(i, new_row, from_version=table.version(old_row))
+                    for i, old_row, new_row in transition[kind]
+                ]
+            transitions.append(entry)
+        return {
+            "reports": [{"label": label, "path": path} for label, path in table.reports],
+            "rows": len(table),
+            "libraries": len({table.identity_column[row] for row in range(len(table))}),
+            "transitions": transitions,
+            "behind_latest": [
+                self._library(i, row, report=label(report_id), project=table.projects[project_id])
+                for report_id, project_id, i, row in self.behind
+            ],
+            "divergent": [
+                {
+                    "report": label(report_id),
+                    "name": table.name(identity_id),
+                    "identity": table.identities[identity_id],
+                    "versions": {table.projects[p]: table.version(row) for p, row in sorted(rows.items())},
+                }
+                for report_id, identity_id, rows in self.divergent
+            ],
+            "history": self.history,
+        }
+
+    def csv_rows(self):
+        """Rezultatul ca tabel plat: un rând per bibliotecă și tip de modificare."""
+        data = self.to_dict()
+        for transition in data["transitions"]:
+            for kind in ("added", "removed", "upgraded", "downgraded", "changed"):
+                for lib in transition[kind]:
+                    yield [kind, transition["from"], transition["to"], transition["project"], lib["name"],
+                           lib["identity"], lib.get("from_version", ""), lib["version"], lib["latest_version"]]
+        for lib in data["behind_latest"]:
+            yield ["behind_latest", "", lib["report"], lib["project"], lib["name"], lib["identity"],
+                   "", lib["version"], lib["latest_version"]]
+        for entry in data["divergent"]:
+            for project, version in entry["versions"].items():
+                yield ["divergent", "", entry["report"], project, entry["name"], entry["identity"],
+                       "", version, ""]
+
+    def write(self, output_file, output_format=None):
+        """Scrie rezultatul ca JSON sau CSV (implicit după extensia fișierului)."""
+        output_format = output_format or ("csv" if output_file.lower().endswith(".csv") else "json")
+        with atomic_output(output_file) as temp_path, \
+                open(temp_path, "w", newline="", encoding="utf-8") as f:
+            if output_format == "csv":
+                writer = csv.writer(f)
+                writer.writerow(self.CSV_FIELDNAMES)
+                writer.writerows(self.csv_rows())
+            else:
+                json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+
+
+def drift_main(argv):
+    """Subcomanda `drift`: compară rapoarte existente (instantanee sau proiecte diferite)."""
+    parser = argparse.ArgumentParser(
+        prog="analiza_bibliotecilor_Arduino_PlatformIO.py drift",
+        description="Compară rapoarte de biblioteci: adăugări, eliminări, actualizări, "
+                    "versiuni rămase în urmă și versiuni divergente între proiecte.",
+    )
+    parser.add_argument("reports", nargs="+", metavar="report",
+                        help="Rapoarte CSV, NDJSON, SQLite sau .bundle.json, în ordinea comparării")
+    parser.add_argument("-o", "--output", default="drift.json",
+                        help="Fișierul rezultatului (.json sau .csv)")
+    parser.add_argument("-f", "--format", choices=("json", "csv"), default=None,
+                        help="Formatul rezultatului (implicit după extensia fișierului)")
+    args = parser.parse_args(argv)
+    
+    start = time.perf_counter()
+    table = ReportTable()
+    for report_path in args.reports:
+        try:
+            table.load(report_path)
         except Exception as e:
-            print(f"Eroare la scrierea în fișierul CSV: {e}")
+            print(f"Eroare la citirea raportului {report_path}: {e}")
+    table.build_index()
+    drift = VersionDrift(table).compute()
+    
+    try:
+        drift.write(args.output, args.format)
+    except Exception as e:
+        print(f"Eroare la scrierea în fișierul {args.output}: {e}")
+        return 1
+    counts = defaultdict(int)
+    for transition in drift.transitions:
+        for kind in ("added", "removed", "upgraded", "downgraded", "changed"):
+            counts[kind] += len(transition[kind])
+    print(f"Rapoarte: {len(table.reports)}, {len(table)} rânduri, {len(set(table.identity_column))} biblioteci "
+          f"({time.perf_counter() - start:.3f} s)")
+    print(f"Modificări: {counts['added']} adăugate, {counts['removed']} eliminate, "
+          f"{counts['upgraded']} actualizate, {counts['downgraded']} retrogradate, {counts['changed']} schimbate")
+    print(f"În urmă față de ultima versiune: {len(drift.behind)}; divergente între proiecte: {len(drift.divergent)}")
+    print(f"Rezultatul a fost scris în {args.output}")
+    return 0
+
+
+def print_github_stats(github_client):
+    """Afișează statisticile cache-ului HTTP și pauzele impuse de limita de rată."""
+    if github_client.http_cache is not None:
+        print(github_client.http_cache.summary())
+    limiter = github_client.rate_limiter
+    if limiter.waits:
+        print(f"Pauze pentru limita de rată GitHub: {limiter.waits} ({limiter.wait_time:.1f} s)")
+
+
+def run_watch(analyzer, interval, port=None, allowed_origins=()):
+    """Analiza inițială, apoi actualizări incrementale până la Ctrl+C."""
+    server = None
+    if port is not None:
+        server = LiveReportServer(("127.0.0.1", port), allowed_origins)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        watcher = ProjectWatcher(analyzer, interval=interval, server=server)
+        num_libraries = watcher.start()
+        print(f"Analiza inițială completă: {num_libraries} biblioteci.")
+        if server is not None:
+            print(f"Datele live sunt disponibile la http://127.0.0.1:{server.server_address[1]}/libraries")
+        watcher.run()
+    finally:
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+
+
+def profile_report(profiler, snapshot, limit=25):
+    """Punctele fierbinți din cProfile și locurile cu cele mai multe alocări (tracemalloc)."""
+    stats = pstats.Stats(profiler)
+    functions = []
+    for (filename, lineno, function), (_, calls, tottime, cumtime, _) in stats.stats.items():
+        functions.append({
+            "function": f"{os.path.basename(filename)}:{lineno}({function})",
+            "calls": calls,
+            "tottime": round(tottime, 6),
+            "cumtime": round(cumtime, 6),
+        })
+    functions.sort(key=lambda entry: entry["cumtime"], reverse=True)
+    allocations = [
+        {"location": str(stat.traceback), "size": stat.size, "count": stat.count}
+        for stat in snapshot.statistics("lineno")[:limit]
+    ]
+    return {"functions": functions[:limit], "allocations": allocations}
+
+
+def print_profile(profiler, snapshot, limit=25):
+    """Afișează funcțiile cu cel mai mare timp cumulat și cele mai mari alocări."""
+    output = io.StringIO()
+    pstats.Stats(profiler, stream=output).sort_stats("cumulative").print_stats(limit)
+    print(output.getvalue())
+    print("Cele mai mari alocări de memorie:")
+    for stat in snapshot.statistics("lineno")[:10]:
+        print(f"  {stat}")
+
 
 def main():
-    # Folosește aceste valori hardcodate în loc de argparse 
-    project_dir = r"WLED\WLED-main"  # Înlocuiește cu calea proiectului tău
-    output_file = "libraries.csv"  # Numele fișierului CSV de ieșire
-    github_token = None  # Opțional, dacă ai un token GitHub
+    # Subcomanda `drift` compară rapoarte existente, fără a scana proiecte
+    if sys.argv[1:2] == ["drift"]:
+        return drift_main(sys.argv[2:])
+    
+    parser = argparse.ArgumentParser(
+        description="Analizează bibliotecile folosite în proiecte Arduino/PlatformIO."
+    )
+    parser.add_argument("project_dirs", nargs="*", metavar="project_dir",
+                        help="Calea unuia sau mai multor proiecte de analizat (director sau arhivă zip/tar)")
+    parser.add_argument("-m", "--manifest", default=None,
+                        help="Fișier cu lista de proiecte (o cale pe linie, opțional nume=cale)")
+    parser.add_argument("-o", "--output", default="libraries.csv",
+                        help="Numele fișierului CSV de ieșire (un singur proiect)")
+    parser.add_argument("-f", "--format", dest="formats", action="append",
+                        choices=sorted(OUTPUT_WRITERS), default=None,
+                        help="Formatul de ieșire (repetabil; implicit csv)")
+    parser.add_argument("--output-dir", default=".",
+                        help="Directorul rezultatelor în modul cu mai multe proiecte")
+    parser.add_argument("--github-token", default=os.environ.get("GITHUB_TOKEN"),
+                        help="Token GitHub opțional (implicit din GITHUB_TOKEN)")
+    parser.add_argument("-j", "--jobs", type=int, default=1,
+                        help="Numărul de procese pentru scanarea surselor și a proiectelor")
+    parser.add_argument("--prune", action="append", default=None, metavar="PATTERN",
+                        help="Șablon .gitignore de ignorat (înlocuiește lista implicită)")
+    parser.add_argument("--respect-gitignore", action="store_true",
+                        help="Aplică și fișierele .gitignore din proiect")
+    parser.add_argument("--no-archives", action="store_true",
+                        help="Nu citește arhivele zip/tar găsite în proiect (de ex. în .pio/libdeps)")
+    parser.add_argument("--cache-dir", default=default_cache_dir(),
+                        help="Directorul cache-ului de scanare incrementală")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Dezactivează cache-urile persistente (scanare și HTTP)")
+    parser.add_argument("--offline", action="store_true",
+                        help="Îmbogățește datele doar din cache-ul HTTP, fără acces la rețea")
+    parser.add_argument("--http-cache-ttl", type=float, default=24 * 3600,
+                        help="Valabilitatea răspunsurilor GitHub din cache, în secunde")
+    parser.add_argument("--http-cache-max-mb", type=float, default=100,
+                        help="Dimensiunea maximă a cache-ului HTTP, în MB")
+    parser.add_argument("--registry-index", action="append", default=[], metavar="FILE",
+                        help="library_index.json Arduino sau dump al registrului PlatformIO (repetabil)")
+    parser.add_argument("--registry-db", default=None,
+                        help="Fișierul indexului local al registrelor (implicit în --cache-dir)")
+    parser.add_argument("--github-api-url", default=GITHUB_API_URL,
+                        help="Adresa API-ului GitHub (de ex. un server local de test)")
+    parser.add_argument("--github-concurrency", type=int, default=8,
+                        help="Numărul maxim de cereri GitHub simultane")
+    parser.add_argument("--trace", default=None, metavar="FILE",
+                        help="Scrie instrumentarea rulării (faze, contoare, HTTP, erori) ca JSON")
+    parser.add_argument("--profile", action="store_true",
+                        help="Rulează sub cProfile și tracemalloc și afișează punctele fierbinți")
+    parser.add_argument("--profile-output", default=None, metavar="FILE",
+                        help="Salvează statisticile cProfile brute (pentru pstats/snakeviz)")
+    parser.add_argument("--watch", action="store_true",
+                        help="Rămâne activ și actualizează rezultatele la modificarea fișierelor")
+    parser.add_argument("--watch-interval", type=float, default=1.0,
+                        help="Intervalul de verificare a modificărilor în modul watch, în secunde")
+    parser.add_argument("--serve", type=int, default=None, metavar="PORT",
+                        help="În modul watch, servește bibliotecile ca JSON pe http://127.0.0.1:PORT")
+    parser.add_argument("--allow-origin", action="append", default=[], metavar="ORIGIN",
+                        help="Origine web (de ex. http://localhost:8000) care poate citi datele servite; "
+                             "raportul deschis ca fișier local este permis mereu")
+    parser.add_argument("--include-graph", action="store_true",
+                        help="Scrie și <ieșire>_include_graph.json cu bibliotecile directe și tranzitive ale schițelor")
+    args = parser.parse_args()
+    
+    projects = [("", path) for path in args.project_dirs]
+    if args.manifest:
+        projects += read_project_manifest(args.manifest)
+    if not projects:
+        parser.error("specifică cel puțin un project_dir sau --manifest")
+    
+    http_cache = None
+    if not args.no_cache:
+        http_cache = HttpCache(
+            os.path.join(args.cache_dir, "http_cache.sqlite"),
+            ttl=args.http_cache_ttl,
+            max_bytes=int(args.http_cache_max_mb * 1024 * 1024),
+        )
     
-    analyzer = LibraryAnalyzer(project_dir, output_file, github_token)
-    num_libraries = analyzer.run()
+    registry = None
+    if args.registry_index:
+        registry = RegistryIndex(
+            args.registry_db or os.path.join(args.cache_dir, "registry_index.sqlite")
+        )
+        for index_path in args.registry_index:
+            if registry.update(index_path):
+                print(f"Indexul registrului a fost reconstruit din {index_path}")
+    
+    metrics = Metrics()
+    github_client = GitHubClient(
+        args.github_token,
+        api_url=args.github_api_url,
+        concurrency=args.github_concurrency,
+        http_cache=http_cache,
+        offline=args.offline,
+        metrics=metrics,
+    )
+    options = {
+        "github_token": args.github_token,
+        "prune_patterns": args.prune,
+        "respect_gitignore": args.respect_gitignore,
+        "scan_archives": not args.no_archives,
+        "cache_path": None if args.no_cache else os.path.join(args.cache_dir, "scan_cache.sqlite"),
+        "output_formats": args.formats or ["csv"],
+        "include_graph": args.include_graph,
+        "metrics": metrics,
+    }
+    
+    # Cu --profile întreaga analiză rulează sub cProfile și tracemalloc
+    profiler = None
+    if args.profile:
+        tracemalloc.start()
+        profiler = cProfile.Profile()
+        profiler.enable()
+    try:
+        if len(projects) == 1:
+            output_file = args.output
+            analyzer = LibraryAnalyzer(
+                projects[0][1],
+                output_file,
+                jobs=args.jobs,
+                github_client=github_client,
+                registry=registry,
+                **options,
+            )
+            if args.watch:
+                run_watch(analyzer, args.watch_interval, args.serve, args.allow_origin)
+            else:
+                num_libraries = analyzer.run()
+                print_github_stats(github_client)
+                print(f"Analiza completă. S-au găsit {num_libraries} biblioteci.")
+                print(f"Rezultatele au fost salvate în {output_file}")
+        else:
+            if args.watch:
+                parser.error("--watch funcționează doar cu un singur proiect")
+            batch = BatchAnalyzer(
+                projects,
+                args.output_dir,
+                jobs=args.jobs,
+                github_client=github_client,
+                registry=registry,
+                **options,
+            )
+            counts = batch.run()
+            print_github_stats(github_client)
+            for name, num_libraries in counts.items():
+                print(f"{name}: {num_libraries} biblioteci")
+            print(f"Analiza completă pentru {len(counts)} proiecte. "
+                  f"Rezultatele au fost salvate în {args.output_dir}")
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            snapshot = tracemalloc.take_snapshot()
+            tracemalloc.stop()
+            print_profile(profiler, snapshot)
+            metrics.profile = profile_report(profiler, snapshot)
+            if args.profile_output:
+                profiler.dump_stats(args.profile_output)
+        if http_cache is not None:
+            http_cache.close()
+        if registry is not None:
+            registry.close()
     
-    print(f"Analiza completă. S-au găsit {num_libraries} biblioteci.")
-    print(f"Rezultatele au fost salvate în {output_file}")
+    metrics.record_github(github_client)
+    print(metrics.summary())
+    if args.trace:
+        metrics.write_trace(args.trace)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,446 @@
+"""Benchmark reproductibil pentru analiza_bibliotecilor_Arduino_PlatformIO.py.
+
+Generează proiecte sintetice Arduino/PlatformIO de dimensiune configurabilă,
+măsoară separat fiecare fază a `LibraryAnalyzer.run()` (îmbogățirea GitHub se
+face față de un server local) și compară rezultatele cu o linie de bază JSON.
+
+    python benchmark_analiza.py generate sintetic --files 2000 --libraries 60
+    python benchmark_analiza.py run sintetic -o baseline.json
+    python benchmark_analiza.py run --files 2000 -o curent.json
+    python benchmark_analiza.py compare baseline.json curent.json --threshold 0.10
+"""
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import argparse
+import platform
+import tempfile
+import threading
+import tracemalloc
+import statistics
+from datetime import datetime, timezone
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import analiza_bibliotecilor_Arduino_PlatformIO as analiza
+
+# Fazele raportate, cu numele din `Metrics.phases` ale analizorului
+PHASES = ["walk", "code_scan", "platformio", "arduino_manifests", "includes", "enrichment", "write"]
+
+# Fișierul cu parametrii generatorului, scris în rădăcina proiectului sintetic
+GENERATOR_INFO = ".benchmark.json"
+
+BASELINE_VERSION = 2
+
+
+def generate_project(root, files=1000, libraries=40, envs=6, header_kb=512, seed=1):
+    """Generează un proiect sintetic determinist (pentru același `seed`).
+
+    Conține `files` fișiere sursă în `src/`, `libraries` biblioteci (în `lib/`, în
+    `.pio/libdeps/` și grupate într-un director cu manifeste imbricate), un
+    platformio.ini cu `envs` medii legate prin `extends` și lanțuri `${...}`
+    și câteva header-e generate mari, de `header_kb` KB fiecare.
+    """
+    rng = random.Random(seed)
+    os.makedirs(root, exist_ok=True)
+
+    lib_names = [f"SynthLib{i:03d}" for i in range(libraries)]
+    for i, lib_name in enumerate(lib_names):
+        # Un sfert din biblioteci sunt copii .pio/libdeps, una din patru este imbricată
+        if i % 4 == 0:
+            lib_dir = os.path.join(root, ".pio", "libdeps", "env_0", lib_name)
+        elif i % 4 == 1:
+            lib_dir = os.path.join(root, "lib", "Bundle", "libraries", lib_name)
+        else:
+            lib_dir = os.path.join(root, "lib", lib_name)
+        os.makedirs(os.path.join(lib_dir, "src"), exist_ok=True)
+
+        url = f"https://github.com/synth/{lib_name}"
+        if i % 2 == 0:
+            _write(os.path.join(lib_dir, "library.properties"), (
+                f"name={lib_name}\nversion=1.{i}.0\nauthor=Synth Author {i}\n"
+                f"sentence=Biblioteca sintetică {i}\nurl={url}\n"
+            ))
+        else:
+            _write(os.path.join(lib_dir, "library.json"), json.dumps({
+                "name": lib_name,
+                "version": f"1.{i}.0",
+                "author": {"name": f"Synth Author {i}"},
+                "description": f"Biblioteca sintetică {i}",
+                "repository": {"type": "git", "url": f"{url}.git"},
+            }, indent=2))
+
+        # Bibliotecile depind în lanț una de alta, pentru include-uri tranzitive
+        dependency = lib_names[(i + 1) % libraries]
+        _write(os.path.join(lib_dir, "src", f"{lib_name}.h"), (
+            f"/**\n * {lib_name} - bibliotecă sintetică\n * @author Synth Author {i}\n */\n"
+            f"#pragma once\n#define {lib_name.upper()}_VERSION \"1.{i}.0\"\n"
+            f"#include <Arduino.h>\n#include <{dependency}.h>\n"
+            f"class {lib_name} {{ public: void begin(); }};\n"
+        ))
+        _write(os.path.join(lib_dir, "src", f"{lib_name}.cpp"), (
+            f"#include \"{lib_name}.h\"\nvoid {lib_name}::begin() {{}}\n"
+        ))
+
+    # Header-e generate mari (tabele, fonturi) care trebuie parcurse integral
+    include_dir = os.path.join(root, "include")
+    os.makedirs(include_dir, exist_ok=True)
+    generated = [f"generated_{k}.h" for k in range(max(1, files // 500))]
+    for name in generated:
+        lines = ["#pragma once", "#if 0", "#include <NotUsed.h>", "#endif"]
+        size = 0
+        n = 0
+        while size < header_kb * 1024:
+            line = f"#define GEN_{n:07d} 0x{rng.getrandbits(32):08x}  // valoare generată"
+            lines.append(line)
+            size += len(line) + 1
+            n += 1
+        _write(os.path.join(include_dir, name), "\n".join(lines) + "\n")
+    _write(os.path.join(include_dir, "config.h"), (
+        "#pragma once\n#include <WiFi.h>\n#define CONFIG_VERSION \"1.0\"\n"
+    ))
+
+    # Fișierele sursă ale proiectului, grupate câte 100 pe director
+    filler = "\n".join(f"static int value_{n} = {n} * 3; // cod de umplutură" for n in range(40))
+    for n in range(files):
+        includes = ["#include <Arduino.h>", '#include "config.h"']
+        for lib_name in rng.sample(lib_names, min(len(lib_names), rng.randint(3, 6))):
+            includes.append(f"#include <{lib_name}.h>")
+        if rng.random() < 0.05:
+            includes.append(f'#include "{rng.choice(generated)}"')
+        includes.append("// #include <Commented.h>")
+        source_dir = os.path.join(root, "src", f"m{n // 100:03d}")
+        os.makedirs(source_dir, exist_ok=True)
+        _write(os.path.join(source_dir, f"module_{n:05d}.cpp"), (
+            "\n".join(includes) + f"\n{filler}\nvoid module_{n}() {{}}\n"
+        ))
+    _write(os.path.join(root, "src", "main.cpp"), (
+        "#include <Arduino.h>\n#include \"config.h\"\n"
+        f"#include <{lib_names[0]}.h>\nvoid setup() {{}}\nvoid loop() {{}}\n"
+    ) if lib_names else "void setup() {}\nvoid loop() {}\n")
+
+    _write(os.path.join(root, "platformio.ini"), _platformio_ini(lib_names, envs))
+
+    info = {
+        "files": files, "libraries": libraries, "envs": envs,
+        "header_kb": header_kb, "seed": seed,
+    }
+    _write(os.path.join(root, GENERATOR_INFO), json.dumps(info, indent=2))
+    return info
+
+
+def _platformio_ini(lib_names, envs):
+    """platformio.ini cu [env] comun, medii moștenite prin `extends` și lanțuri `${...}`."""
+    base = lib_names[:3]
+    lines = [
+        "[platformio]",
+        "default_envs = env_0",
+        "",
+        "[common]",
+        "lib_deps_base =",
+        *(f"    synth/{name}@^1.0.0" for name in base),
+        "",
+        "[env]",
+        "framework = arduino",
+        "lib_deps = ${common.lib_deps_base}",
+        "",
+    ]
+    for k in range(envs):
+        lines.append(f"[env:env_{k}]")
+        if k == 0:
+            lines += ["platform = espressif32", "board = esp32dev", "lib_deps = ${env.lib_deps}"]
+        else:
+            lines += [f"extends = env:env_{k - 1}", f"lib_deps = ${{env:env_{k - 1}.lib_deps}}"]
+        if lib_names:
+            lines.append(f"    synth/{lib_names[k % len(lib_names)]}@~1.{k}.0")
+        lines.append("")
+    return "\n".join(lines)
+
+
+def _write(path, text):
+    with open(path, "w", encoding="utf-8", newline="\n") as f:
+        f.write(text)
+
+
+class StubGitHubHandler(BaseHTTPRequestHandler):
+    """Server GitHub minimal: `/repos/<owner>/<repo>` și `/repos/<owner>/<repo>/releases`."""
+
+    latency = 0.0
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        if self.latency:
+            time.sleep(self.latency)
+        parts = self.path.split("?", 1)[0].strip("/").split("/")
+        if parts[0] != "repos" or len(parts) not in (3, 4):
+            self.send_response(404)
+            self.end_headers()
+            return
+        if len(parts) == 4:
+            body = [{"tag_name": "v2.0.0"}]
+        else:
+            body = {"description": f"Repo sintetic {parts[1]}/{parts[2]}"}
+        data = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class StubGitHubServer(ThreadingHTTPServer):
+    # Coada implicită (5) pierde conexiuni când clientul deschide mai multe simultan
+    request_queue_size = 128
+    daemon_threads = True
+
+
+def start_stub_server(latency=0.0):
+    """Pornește serverul GitHub local pe un port liber; returnează serverul."""
+    handler = type("Handler", (StubGitHubHandler,), {"latency": latency})
+    server = StubGitHubServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def run_once(project_dir, output_dir, api_url, jobs=1, measure_memory=False):
+    """Rulează o analiză completă; returnează timpii fazelor și datele rulării.
+
+    Timpii fazelor sunt cei măsurați de analizor (`analyzer.metrics.phases`).
+    """
+    github_client = analiza.GitHubClient(api_url=api_url)
+    analyzer = analiza.LibraryAnalyzer(
+        project_dir,
+        os.path.join(output_dir, "libraries.csv"),
+        jobs=jobs,
+        github_client=github_client,
+    )
+
+    if measure_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        num_libraries = analyzer.run()
+    finally:
+        total = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1] if measure_memory else None
+        if measure_memory:
+            tracemalloc.stop()
+
+    timings = {name: stats["wall"] for name, stats in analyzer.metrics.phases.items()}
+    timings["total"] = total
+    inventory = analyzer.inventory
+    return {
+        "timings": timings,
+        "peak_memory_bytes": peak,
+        "libraries": num_libraries,
+        "source_files": len(inventory.sources),
+        "source_bytes": sum(os.path.getsize(path) for path in inventory.sources),
+        "manifests": len(inventory.manifests),
+        "github_requests": github_client.requests_made,
+    }
+
+
+def run_benchmark(project_dir, repeat=3, jobs=1, stub_latency=0.0):
+    """Măsoară proiectul de `repeat` ori, plus o rulare separată pentru memoria maximă.
+
+    tracemalloc încetinește execuția, de aceea memoria se măsoară într-o rulare
+    proprie, care nu intră în timpi.
+    """
+    server = start_stub_server(stub_latency)
+    api_url = f"http://127.0.0.1:{server.server_address[1]}"
+    output_dir = tempfile.mkdtemp(prefix="benchmark_analiza_")
+    runs = []
+    try:
+        for n in range(repeat):
+            print(f"Rularea {n + 1}/{repeat}...")
+            runs.append(run_once(project_dir, output_dir, api_url, jobs))
+        print("Rulare pentru memoria maximă (tracemalloc)...")
+        memory_run = run_once(project_dir, output_dir, api_url, jobs, measure_memory=True)
+    finally:
+        server.shutdown()
+        server.server_close()
+        shutil.rmtree(output_dir, ignore_errors=True)
+
+    phases = {}
+    for phase in PHASES + ["total"]:
+        values = [run["timings"].get(phase, 0.0) for run in runs]
+        phases[phase] = {
+            "min": min(values),
+            "median": statistics.median(values),
+            "runs": values,
+        }
+
+    generator = None
+    info_path = os.path.join(project_dir, GENERATOR_INFO)
+    if os.path.isfile(info_path):
+        with open(info_path, "r", encoding="utf-8") as f:
+            generator = json.load(f)
+
+    last = runs[-1]
+    return {
+        "version": BASELINE_VERSION,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "params": {
+            "project": os.path.abspath(project_dir),
+            "generator": generator,
+            "repeat": repeat,
+            "jobs": jobs,
+            "stub_latency": stub_latency,
+        },
+        "project": {key: last[key] for key in ("source_files", "source_bytes", "manifests", "libraries")},
+        "github_requests": last["github_requests"],
+        "phases": phases,
+        "peak_memory_bytes": memory_run["peak_memory_bytes"],
+    }
+
+
+def print_result(result):
+    """Afișează timpii fazelor și memoria maximă."""
+    project = result["project"]
+    print(f"{project['source_files']} fișiere sursă ({project['source_bytes'] / 1024 / 1024:.1f} MB), "
+          f"{project['manifests']} manifeste, {project['libraries']} biblioteci")
+    print(f"{'faza':<20}{'min (s)':>12}{'mediana (s)':>14}")
+    for phase, values in result["phases"].items():
+        print(f"{phase:<20}{values['min']:>12.4f}{values['median']:>14.4f}")
+    print(f"Memorie maximă (heap Python): {result['peak_memory_bytes'] / 1024 / 1024:.1f} MB")
+
+
+def compare_results(baseline, current, threshold=0.10, min_delta=0.005, stat="median"):
+    """Compară două rezultate; returnează rândurile comparației și lista regresiilor.
+
+    O fază este regresie dacă e mai lentă cu peste `threshold` (relativ) și cu cel
+    puțin `min_delta` secunde, ca fazele foarte scurte să nu producă alarme false.
+    """
+    rows = []
+    regressions = []
+    for phase, base_values in baseline["phases"].items():
+        if phase not in current["phases"]:
+            continue
+        before = base_values[stat]
+        after = current["phases"][phase][stat]
+        change = (after - before) / before if before else 0.0
+        regressed = change > threshold and after - before >= min_delta
+        rows.append((phase, before, after, change, regressed))
+        if regressed:
+            regressions.append(phase)
+
+    before = baseline.get("peak_memory_bytes")
+    after = current.get("peak_memory_bytes")
+    if before and after:
+        change = (after - before) / before
+        regressed = change > threshold
+        rows.append(("peak_memory_mb", before / 1024 / 1024, after / 1024 / 1024, change, regressed))
+        if regressed:
+            regressions.append("peak_memory_mb")
+    return rows, regressions
+
+
+def load_result(path):
+    with open(path, "r", encoding="utf-8") as f:
+        result = json.load(f)
+    if result.get("version") != BASELINE_VERSION:
+        raise ValueError(f"{path}: versiune necunoscută a formatului ({result.get('version')})")
+    return result
+
+
+def add_generator_arguments(parser):
+    parser.add_argument("--files", type=int, default=1000, help="Numărul de fișiere sursă")
+    parser.add_argument("--libraries", type=int, default=40, help="Numărul de biblioteci")
+    parser.add_argument("--envs", type=int, default=6, help="Numărul de medii din platformio.ini")
+    parser.add_argument("--header-kb", type=int, default=512,
+                        help="Dimensiunea fiecărui header generat mare, în KB")
+    parser.add_argument("--seed", type=int, default=1, help="Sămânța generatorului")
+
+
+def generator_options(args):
+    return {
+        "files": args.files, "libraries": args.libraries, "envs": args.envs,
+        "header_kb": args.header_kb, "seed": args.seed,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark pentru analiza bibliotecilor Arduino/PlatformIO."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    generate = commands.add_parser("generate", help="Generează un proiect sintetic")
+    generate.add_argument("output_dir", help="Directorul proiectului generat")
+    add_generator_arguments(generate)
+
+    run = commands.add_parser("run", help="Măsoară fazele analizei și salvează rezultatul JSON")
+    run.add_argument("project_dir", nargs="?", default=None,
+                     help="Proiectul măsurat (implicit unul sintetic, generat temporar)")
+    run.add_argument("-o", "--output", default=None, help="Fișierul JSON al rezultatului")
+    run.add_argument("-r", "--repeat", type=int, default=3, help="Numărul de rulări măsurate")
+    run.add_argument("-j", "--jobs", type=int, default=1, help="Procese pentru scanarea surselor")
+    run.add_argument("--stub-latency", type=float, default=0.0,
+                     help="Latența simulată a serverului GitHub local, în secunde")
+    add_generator_arguments(run)
+
+    compare = commands.add_parser("compare", help="Compară un rezultat cu linia de bază")
+    compare.add_argument("baseline", help="JSON-ul liniei de bază")
+    compare.add_argument("current", help="JSON-ul rulării curente")
+    compare.add_argument("--threshold", type=float, default=0.10,
+                         help="Creșterea relativă considerată regresie (implicit 0.10)")
+    compare.add_argument("--min-delta", type=float, default=0.005,
+                         help="Diferența minimă, în secunde, pentru a raporta o regresie")
+    compare.add_argument("--stat", choices=("median", "min"), default="median",
+                         help="Statistica comparată")
+    args = parser.parse_args()
+
+    if args.command == "generate":
+        info = generate_project(args.output_dir, **generator_options(args))
+        print(f"Proiectul sintetic a fost generat în {args.output_dir}: {info}")
+        return 0
+
+    if args.command == "run":
+        temp_dir = None
+        project_dir = args.project_dir
+        if project_dir is None:
+            temp_dir = tempfile.mkdtemp(prefix="proiect_sintetic_")
+            project_dir = temp_dir
+            generate_project(project_dir, **generator_options(args))
+        try:
+            result = run_benchmark(project_dir, args.repeat, args.jobs, args.stub_latency)
+        finally:
+            if temp_dir:
+                shutil.rmtree(temp_dir, ignore_errors=True)
+        print_result(result)
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as f:
+                json.dump(result, f, indent=2)
+            print(f"Rezultatul a fost salvat în {args.output}")
+        return 0
+
+    try:
+        baseline = load_result(args.baseline)
+        current = load_result(args.current)
+    except (OSError, ValueError) as e:
+        print(f"Eroare la citirea rezultatelor: {e}")
+        return 2
+    if baseline["params"].get("generator") != current["params"].get("generator"):
+        print("Atenție: rezultatele provin din proiecte generate cu parametri diferiți")
+    rows, regressions = compare_results(
+        baseline, current, args.threshold, args.min_delta, args.stat
+    )
+    print(f"{'faza':<20}{'bază':>12}{'curent':>12}{'diferență':>12}")
+    for phase, before, after, change, regressed in rows:
+        marker = "  REGRESIE" if regressed else ""
+        print(f"{phase:<20}{before:>12.4f}{after:>12.4f}{change:>+11.1%}{marker}")
+    if regressions:
+        print(f"Regresii peste pragul de {args.threshold:.0%}: {', '.join(regressions)}")
+        return 1
+    print("Nicio regresie peste prag.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,6 +2,25 @@
 let libraries = [];
 let uniqueLibraries = [];
 
+// View state: only the current page is rendered, sort orders are computed once
+const PAGE_SIZE = 60;
+// Same rules as ReportBundle in the analyzer, so CSV data and bundles show the same libraries
+const SEARCH_FIELDS = ['name', 'version', 'author', 'description', 'github_url', 'homepage', 'source', 'environments'];
+const SEARCH_TOKEN_PATTERN = /[\p{L}\p{N}_]+/gu;
+const GITHUB_REPO_PATTERN = /github\.com[\/:]+([A-Za-z0-9_.-]+)\/([A-Za-z0-9_.-]+?)(?:\.git)?(?:[\/#?].*)?$/;
+let sortOrders = {};       // sort key -> indices into uniqueLibraries
+let searchIndex = null;    // word index from the report bundle, or built once for CSV data
+let bundleFiles = [];      // file paths referenced by index from bundle records
+let reportStats = null;    // statistics precomputed in the bundle
+let visibleIndices = [];
+let currentPage = 0;
+let searchTimer = null;
+
+// Live mode state (data served by the analyzer's --watch --serve mode)
+const LIVE_POLL_INTERVAL = 2000;
+let liveTimer = null;
+let liveEtag = null;
+
 // DOM elements
 const csvFileInput = document.getElementById('csvFileInput');
 const searchInput = document.getElementById('searchInput');
@@ -20,6 +39,13 @@ const modalTitle = document.getElementById('modalTitle');
 const modalContent = document.getElementById('modalContent');
 const closeButton = document.querySelector('.close-button');
 const generationDateElement = document.getElementById('generationDate');
+const liveUrlInput = document.getElementById('liveUrlInput');
+const liveButton = document.getElementById('liveButton');
+const liveStatus = document.getElementById('liveStatus');
+const pagination = document.getElementById('pagination');
+const pageInfo = document.getElementById('pageInfo');
+const prevPageButton = document.getElementById('prevPage');
+const nextPageButton = document.getElementById('nextPage');
 
 // Set generation date
 const currentDate = new Date();
@@ -28,19 +54,33 @@ generationDateElement.textContent = currentDate.toLocaleDateString('ro-RO');
 // Event listeners
 document.addEventListener('DOMContentLoaded', () => {
     csvFileInput.addEventListener('change', handleFileUpload);
-    searchButton.addEventListener('click', filterLibraries);
+    searchButton.addEventListener('click', () => filterLibraries());
     searchInput.addEventListener('keyup', (e) => {
         if (e.key === 'Enter') {
             filterLibraries();
         }
     });
-    sortSelect.addEventListener('change', () => {
-        sortLibraries(sortSelect.value);
-        renderLibraries();
+    // Search while typing, once the user pauses
+    searchInput.addEventListener('input', () => {
+        clearTimeout(searchTimer);
+        searchTimer = setTimeout(() => filterLibraries(), 150);
     });
+    sortSelect.addEventListener('change', () => filterLibraries());
+    prevPageButton.addEventListener('click', () => changePage(-1));
+    nextPageButton.addEventListener('click', () => changePage(1));
     closeButton.addEventListener('click', () => {
         detailModal.classList.add('hidden');
     });
+    liveButton.addEventListener('click', () => {
+        connectLive(liveUrlInput.value.trim());
+    });
+    
+    // raport_tehnic.html?live=http://127.0.0.1:8765 connects automatically
+    const liveParam = new URLSearchParams(window.location.search).get('live');
+    if (liveParam) {
+        liveUrlInput.value = liveParam;
+        connectLive(liveParam);
+    }
     
     // Close modal when clicking outside of it
     window.addEventListener('click', (e) => {
@@ -62,8 +102,20 @@ function handleFileUpload(event) {
     const reader = new FileReader();
     
     reader.onload = function(e) {
-        const csvData = e.target.result;
-        parseCSV(csvData);
+        const data = e.target.result;
+        
+        // Report bundles (.bundle.json) are already deduplicated, sorted and indexed
+        if (file.name.toLowerCase().endsWith('.json')) {
+            try {
+                loadBundle(JSON.parse(data));
+            } catch (error) {
+                console.error("Error loading bundle:", error);
+                alert("A apărut o eroare la încărcarea pachetului JSON: " + error.message);
+                loadingIndicator.classList.add('hidden');
+            }
+            return;
+        }
+        parseCSV(data);
     };
     
     reader.onerror = function() {
@@ -77,21 +129,19 @@ function handleFileUpload(event) {
 // Function to parse CSV data - Revised for reliability
 function parseCSV(csvData) {
     try {
-        // Split the data into rows
-        const rows = csvData.split('\n');
+        // Split the data into records (quoted fields may hold commas, quotes and newlines)
+        const rows = parseCSVRecords(csvData);
         
         // Extract the headers
-        const headers = rows[0].split(',');
+        const headers = rows[0];
         
         // Clear previous data
         libraries = [];
         
         // Process each row
         for (let i = 1; i < rows.length; i++) {
-            if (!rows[i].trim()) continue; // Skip empty rows
-            
-            // Simple CSV parsing for standard format
-            const values = rows[i].split(',');
+            const values = rows[i];
+            if (values.length === 1 && !values[0].trim()) continue; // Skip empty rows
             
             // Create library object with matching headers
             const library = {};
@@ -104,21 +154,9 @@ function parseCSV(csvData) {
         
         console.log("Parsed libraries:", libraries.length);
         
-        // Process the libraries to get unique ones
-        processLibraries();
-        
         // Sort libraries by name initially
-        sortLibraries('name');
-        
-        // Update stats
-        updateStats();
-        
-        // Render the libraries
-        renderLibraries();
-        
-        // Hide loading indicator and show stats
-        loadingIndicator.classList.add('hidden');
-        libraryStats.classList.remove('hidden');
+        sortSelect.value = 'name';
+        showLibraries();
     } catch (error) {
         console.error("Error parsing CSV:", error);
         alert("A apărut o eroare la procesarea datelor CSV: " + error.message);
@@ -126,98 +164,316 @@ function parseCSV(csvData) {
     }
 }
 
-// Function to process libraries and get unique ones
-// Function to process libraries and get unique ones
+// Function to split CSV text into records of fields, following RFC 4180 (as written by
+// Python's csv module): fields in double quotes may contain commas, line breaks and ""
+function parseCSVRecords(text) {
+    const records = [];
+    let record = [];
+    let field = '';
+    let quoted = false;
+    
+    for (let i = 0; i < text.length; i++) {
+        const char = text[i];
+        if (quoted) {
+            if (char !== '"') {
+                field += char;
+            } else if (text[i + 1] === '"') {
+                field += '"';
+                i++;
+            } else {
+                quoted = false;
+            }
+        } else if (char === '"') {
+            quoted = true;
+        } else if (char === ',') {
+            record.push(field);
+            field = '';
+        } else if (char === '\n' || char === '\r') {
+            if (char === '\r' && text[i + 1] === '\n') i++;
+            record.push(field);
+            records.push(record);
+            record = [];
+            field = '';
+        } else {
+            field += char;
+        }
+    }
+    if (field || record.length) {
+        record.push(field);
+        records.push(record);
+    }
+    return records;
+}
+
+// Function to process and render libraries parsed from a CSV file
+function showLibraries() {
+    // Process the libraries to get unique ones
+    processLibraries();
+    
+    sortOrders = {};
+    searchIndex = null;
+    bundleFiles = [];
+    reportStats = null;
+    
+    showLoadedLibraries(false);
+}
+
+// Function to load a report bundle written by the analyzer (-f bundle or /bundle in watch mode)
+function loadBundle(bundle, keepPage = false) {
+    const fields = bundle.fields;
+    uniqueLibraries = bundle.records.map(values => {
+        const lib = {};
+        fields.forEach((field, i) => {
+            lib[field] = values[i];
+        });
+        lib.environments = lib.environments.join(', ');
+        return lib;
+    });
+    libraries = uniqueLibraries;
+    
+    sortOrders = bundle.sort;
+    searchIndex = bundle.search;
+    bundleFiles = bundle.files;
+    reportStats = bundle.stats;
+    
+    showLoadedLibraries(keepPage);
+}
+
+// Function to update stats and render the first page (keeping the current search, if any)
+function showLoadedLibraries(keepPage) {
+    updateStats();
+    filterLibraries(keepPage);
+    
+    // Hide loading indicator and show stats
+    loadingIndicator.classList.add('hidden');
+    initialMessage.classList.add('hidden');
+    libraryStats.classList.remove('hidden');
+}
+
+// Function to start polling the analyzer's live endpoint
+function connectLive(baseUrl) {
+    if (liveTimer) {
+        clearTimeout(liveTimer);
+        liveTimer = null;
+    }
+    if (!baseUrl) return;
+    
+    liveEtag = null;
+    loadingIndicator.classList.remove('hidden');
+    initialMessage.classList.add('hidden');
+    pollLive(baseUrl.replace(/\/+$/, ''));
+}
+
+// Function to fetch the library list; unchanged data is answered with 304
+async function pollLive(baseUrl) {
+    try {
+        const headers = liveEtag ? { 'If-None-Match': liveEtag } : {};
+        const response = await fetch(`${baseUrl}/bundle`, { headers, cache: 'no-store' });
+        
+        if (response.status === 200) {
+            liveEtag = response.headers.get('ETag');
+            loadBundle(await response.json(), true);
+        } else if (response.status !== 304) {
+            throw new Error(`HTTP ${response.status}`);
+        }
+        
+        liveStatus.textContent = `Live: ${new Date().toLocaleTimeString('ro-RO')}`;
+        liveStatus.className = 'live-status live-connected';
+    } catch (error) {
+        console.error("Error fetching live data:", error);
+        liveStatus.textContent = 'Conexiune live indisponibilă';
+        liveStatus.className = 'live-status live-error';
+        loadingIndicator.classList.add('hidden');
+    }
+    
+    liveTimer = setTimeout(() => pollLive(baseUrl), LIVE_POLL_INTERVAL);
+}
+
 
 
 // Function to process libraries and get unique ones
 function processLibraries() {
+    uniqueLibraries = dedupeLibraries(libraries);
+    console.log("Unique libraries:", uniqueLibraries.length);
+}
+
+// Function to get the canonical owner/repo key of a GitHub URL (like github_repo_key in the analyzer)
+function githubRepoKey(url) {
+    const match = (url || '').trim().match(GITHUB_REPO_PATTERN);
+    return match ? `${match[1]}/${match[2]}`.toLowerCase() : '';
+}
+
+// Function to merge rows of the same library (same lowercase name and GitHub repo);
+// rows without a URL are kept, empty fields are filled from duplicates and lists are joined
+function dedupeLibraries(rows) {
     const libraryMap = new Map();
     
-    // Group libraries by a unique combination of name, github_url, and homepage
-    libraries.forEach(lib => {
-        // Skip entries that don't have name, github_url, or homepage
-        if (!lib.name || !lib.github_url || !lib.homepage) return;
+    rows.forEach(lib => {
+        if (!lib.name) return;
         
-        // Create a unique key based on name, github_url, and homepage
-        const key = `${lib.name.toLowerCase()}-${lib.github_url.toLowerCase()}-${lib.homepage.toLowerCase()}`;
-        
-        if (!libraryMap.has(key)) {
+        const key = `${lib.name.toLowerCase()}\n${githubRepoKey(lib.github_url)}`;
+        const existing = libraryMap.get(key);
+        if (!existing) {
             libraryMap.set(key, {
                 ...lib,
-                filesArray: lib.files_found_in ? [lib.files_found_in] : []
-            });
-        } else {
-            const existing = libraryMap.get(key);
-            // Combine the files found in each library and remove duplicates
-            if (lib.files_found_in) {
-                existing.filesArray.push(lib.files_found_in);
-            }
-            // Update the existing library with any missing information (in case some fields are empty)
-            Object.keys(lib).forEach(key => {
-                if (!existing[key] && lib[key]) {
-                    existing[key] = lib[key];
-                }
+                filesArray: lib.files_found_in ? [lib.files_found_in] : [],
+                environmentsArray: lib.environments ? [lib.environments] : []
             });
+            return;
+        }
+        
+        if (lib.files_found_in) {
+            existing.filesArray.push(lib.files_found_in);
         }
+        if (lib.environments) {
+            existing.environmentsArray.push(lib.environments);
+        }
+        // Update the existing library with any missing information (in case some fields are empty)
+        Object.keys(lib).forEach(field => {
+            if (!existing[field] && lib[field]) {
+                existing[field] = lib[field];
+            }
+        });
     });
     
-    // Convert the map to an array of unique libraries
-    uniqueLibraries = Array.from(libraryMap.values());
-    console.log("Unique libraries:", uniqueLibraries.length);
+    // Join the collected lists and remove duplicates
+    const joinUnique = (values, sorted) => {
+        const items = new Set();
+        values.forEach(value => value.split(',').forEach(item => {
+            const trimmed = item.trim();
+            if (trimmed) items.add(trimmed);
+        }));
+        const list = Array.from(items);
+        return (sorted ? list.sort() : list).join(', ');
+    };
     
-    // Process files_found_in for each unique library
-    uniqueLibraries.forEach(lib => {
-        if (lib.filesArray && lib.filesArray.length > 0) {
-            // Join the files array and remove duplicates
-            const filesSet = new Set();
-            lib.filesArray.forEach(fileStr => {
-                if (typeof fileStr === 'string') {
-                    fileStr.split(',').forEach(f => {
-                        const trimmed = f.trim();
-                        if (trimmed) filesSet.add(trimmed);
-                    });
-                }
-            });
-            lib.files_found_in = Array.from(filesSet).join(', ');
-        }
+    return Array.from(libraryMap.values(), lib => {
+        const { filesArray, environmentsArray, ...unique } = lib;
+        if (filesArray.length > 0) unique.files_found_in = joinUnique(filesArray, false);
+        if (environmentsArray.length > 0) unique.environments = joinUnique(environmentsArray, true);
+        return unique;
     });
 }
 
+// Function to get the sort key shared with the analyzer: no diacritics, lowercase
+function sortText(text) {
+    return (text || '').normalize('NFD').replace(/\p{M}/gu, '').toLowerCase();
+}
+
+// Function to sort library indices by a field; ties are broken by name, as in the bundle
+function buildSortOrder(libs, sortBy) {
+    // Sort keys are computed once, not inside the comparator
+    const keys = libs.map(lib => sortText(lib[sortBy]));
+    const names = libs.map(lib => sortText(lib.name));
+    const compare = (a, b) => (a < b ? -1 : a > b ? 1 : 0);
+    const order = libs.map((_, index) => index);
+    order.sort((a, b) => compare(keys[a], keys[b]) || compare(names[a], names[b]));
+    return order;
+}
 
 
-// Function to sort libraries
-function sortLibraries(sortBy) {
-    uniqueLibraries.sort((a, b) => {
-        const valueA = (a[sortBy] || '').toLowerCase();
-        const valueB = (b[sortBy] || '').toLowerCase();
-        return valueA.localeCompare(valueB);
-    });
+
+// Function to get the display order for a sort key (bundles bring it precomputed)
+function getSortOrder(sortBy) {
+    if (!sortOrders[sortBy]) {
+        sortOrders[sortBy] = buildSortOrder(uniqueLibraries, sortBy);
+    }
+    return sortOrders[sortBy];
 }
 
 // Function to filter libraries based on search input
-function filterLibraries() {
-    const searchTerm = searchInput.value.toLowerCase();
+function filterLibraries(keepPage = false) {
+    const searchTerm = searchInput.value.trim().toLowerCase();
+    const order = getSortOrder(sortSelect.value);
     
     if (!searchTerm) {
-        renderLibraries(uniqueLibraries);
-        return;
+        visibleIndices = order;
+    } else {
+        if (!searchIndex) {
+            searchIndex = buildSearchIndex(uniqueLibraries);
+        }
+        const matches = searchTokenIndex(searchIndex, searchTerm);
+        visibleIndices = matches ? order.filter(index => matches.has(index)) : order;
     }
     
-    const filteredLibraries = uniqueLibraries.filter(lib => {
-        return Object.values(lib).some(value => {
-            if (typeof value === 'string') {
-                return value.toLowerCase().includes(searchTerm);
-            }
-            return false;
+    if (!keepPage) {
+        currentPage = 0;
+    }
+    renderLibraries();
+}
+
+// Function to build the word index of CSV data, identical to the bundle index:
+// lowercase words of the SEARCH_FIELDS, sorted, each with the libraries containing it
+function buildSearchIndex(libs) {
+    const postings = new Map();
+    libs.forEach((lib, index) => {
+        SEARCH_FIELDS.forEach(field => {
+            const words = (lib[field] || '').toLowerCase().match(SEARCH_TOKEN_PATTERN) || [];
+            words.forEach(word => {
+                if (!postings.has(word)) postings.set(word, new Set());
+                postings.get(word).add(index);
+            });
         });
     });
+    const tokens = Array.from(postings.keys()).sort();
+    return { tokens, postings: tokens.map(token => Array.from(postings.get(token)).sort((a, b) => a - b)) };
+}
+
+// Function to find the indexed words for a search term: the sorted words starting with
+// the term are found by binary search; only when there are none, words containing it
+function findTokens(tokens, term) {
+    let low = 0;
+    let high = tokens.length;
+    while (low < high) {
+        const middle = (low + high) >> 1;
+        if (tokens[middle] < term) {
+            low = middle + 1;
+        } else {
+            high = middle;
+        }
+    }
     
-    renderLibraries(filteredLibraries);
+    const found = [];
+    for (let i = low; i < tokens.length && tokens[i].startsWith(term); i++) {
+        found.push(i);
+    }
+    if (found.length === 0) {
+        tokens.forEach((token, i) => {
+            if (token.includes(term)) found.push(i);
+        });
+    }
+    return found;
+}
+
+// Function to search the word index: every word of the search term must match;
+// returns null when there is nothing to filter by
+function searchTokenIndex(wordIndex, searchTerm) {
+    const { tokens, postings } = wordIndex;
+    const terms = searchTerm.match(SEARCH_TOKEN_PATTERN);
+    if (!terms) return null;
+    let result = null;
+    
+    for (const term of terms) {
+        const matches = new Set();
+        findTokens(tokens, term).forEach(i => {
+            postings[i].forEach(index => matches.add(index));
+        });
+        result = result ? new Set([...result].filter(index => matches.has(index))) : matches;
+        if (result.size === 0) break;
+    }
+    
+    return result;
 }
 
 // Function to update statistics
 function updateStats() {
+    if (reportStats) {
+        totalLibrariesElement.textContent = reportStats.total;
+        uniqueLibrariesElement.textContent = reportStats.unique;
+        withVersionsElement.textContent = reportStats.with_versions;
+        return;
+    }
+    
     totalLibrariesElement.textContent = libraries.length;
     uniqueLibrariesElement.textContent = uniqueLibraries.length;
     
@@ -228,21 +484,45 @@ function updateStats() {
     withVersionsElement.textContent = withVersions;
 }
 
-// Function to render libraries
-function renderLibraries(libsToRender = uniqueLibraries) {
+// Function to render the current page of libraries
+function renderLibraries() {
     libraryContainer.innerHTML = '';
     
-    if (libsToRender.length === 0) {
+    if (visibleIndices.length === 0) {
         noResults.classList.remove('hidden');
+        pagination.classList.add('hidden');
         return;
     }
     
     noResults.classList.add('hidden');
     
-    libsToRender.forEach(lib => {
-        const card = createLibraryCard(lib);
-        libraryContainer.appendChild(card);
+    const pageCount = Math.ceil(visibleIndices.length / PAGE_SIZE);
+    currentPage = Math.max(0, Math.min(currentPage, pageCount - 1));
+    const start = currentPage * PAGE_SIZE;
+    
+    // Cards are built off-document and inserted at once
+    const fragment = document.createDocumentFragment();
+    visibleIndices.slice(start, start + PAGE_SIZE).forEach(index => {
+        fragment.appendChild(createLibraryCard(uniqueLibraries[index]));
     });
+    libraryContainer.appendChild(fragment);
+    
+    updatePagination(pageCount);
+}
+
+// Function to update the pagination controls
+function updatePagination(pageCount) {
+    pagination.classList.toggle('hidden', pageCount <= 1);
+    pageInfo.textContent = `Pagina ${currentPage + 1} din ${pageCount} (${visibleIndices.length} biblioteci)`;
+    prevPageButton.disabled = currentPage === 0;
+    nextPageButton.disabled = currentPage >= pageCount - 1;
+}
+
+// Function to move to another page
+function changePage(delta) {
+    currentPage += delta;
+    renderLibraries();
+    libraryContainer.scrollIntoView({ behavior: 'smooth' });
 }
 
 // Function to create a library card
@@ -250,7 +530,7 @@ function createLibraryCard(lib) {
     const card = document.createElement('div');
     card.className = 'library-card';
     
-    const versionStatus = getVersionStatus(lib.version, lib.latest_version);
+    const versionStatus = getVersionStatus(lib.version, lib.latest_version, lib.status);
     
     card.innerHTML = `
         <div class="card-header">
@@ -284,16 +564,143 @@ function createLibraryCard(lib) {
     return card;
 }
 
-// Function to get version status
-function getVersionStatus(version, latestVersion) {
-    if (!version || !latestVersion) {
+// Version specifications, parsed like the analyzer's parse_version_spec so that CSV
+// rows get the same status as the one precomputed in bundles
+const VERSION_SPEC_PATTERN = /^(\^|~|>=|<=|>|<|==|=)?\s*[vV]?(\d+(?:\.\d+)*)(?:-([0-9A-Za-z.-]+)|([A-Za-z][0-9A-Za-z.-]*))?(?:\+[0-9A-Za-z.-]+)?$/;
+const RANGE_COMPARATOR_PATTERN = /(>=|<=|>|<|==|=|!=)\s*([^\s,<>=!]+)/g;
+const GIT_HASH_PATTERN = /^(?=[0-9a-f]*[a-f])[0-9a-f]{7,40}$/;
+const versionSpecs = new Map();
+
+// Comparable key: numbers (at least 3), 1 for a release / 0 for a pre-release, pre-release parts
+function versionKey(release, pre) {
+    const numbers = release.split('.').map(Number);
+    while (numbers.length < 3) numbers.push(0);
+    if (!pre) return { numbers, release: 1, pre: [] };
+    // Numeric identifiers compare numerically and precede alphanumeric ones (semver)
+    return {
+        numbers,
+        release: 0,
+        pre: pre.split('.').map(part => /^\d+$/.test(part) ? [0, Number(part), ''] : [1, 0, part])
+    };
+}
+
+function compareScalars(a, b) {
+    return a < b ? -1 : a > b ? 1 : 0;
+}
+
+function compareArrays(a, b, compareItem) {
+    for (let i = 0; i < Math.min(a.length, b.length); i++) {
+        const result = compareItem(a[i], b[i]);
+        if (result) return result;
+    }
+    return a.length - b.length;
+}
+
+function compareVersionKeys(a, b) {
+    return compareArrays(a.numbers, b.numbers, compareScalars)
+        || compareScalars(a.release, b.release)
+        || compareArrays(a.pre, b.pre, (x, y) => compareArrays(x, y, compareScalars));
+}
+
+// Parses a version or spec: 1.2.3, v1.2, ^6.21.0, ~1.2, >=1.0,<2, *
+function parseVersionSpec(text) {
+    const raw = (text || '').trim();
+    if (versionSpecs.has(raw)) return versionSpecs.get(raw);
+    const spec = buildVersionSpec(raw);
+    versionSpecs.set(raw, spec);
+    return spec;
+}
+
+function buildVersionSpec(raw) {
+    if (raw === '*' || raw === 'latest' || raw === 'x') return { kind: 'any' };
+    if (GIT_HASH_PATTERN.test(raw)) return { kind: 'unknown' };
+    
+    const match = raw.match(VERSION_SPEC_PATTERN);
+    if (match) {
+        const [, op, release, pre, tag] = match;
+        const key = versionKey(release, pre || tag);
+        const given = release.split('.').length;
+        const [major, minor, patch] = key.numbers;
+        const bound = numbers => ({ numbers, release: 0, pre: [] });
+        if (op === '^') {
+            // As in npm/PlatformIO: the first non-zero (or last given) component stays fixed
+            let upper;
+            if (major > 0 || given === 1) {
+                upper = [major + 1, 0, 0];
+            } else if (minor > 0 || given === 2) {
+                upper = [0, minor + 1, 0];
+            } else {
+                upper = [0, 0, patch + 1];
+            }
+            return { kind: 'caret', key, upper: bound(upper), upperInclusive: false };
+        }
+        if (op === '~') {
+            const upper = given >= 2 ? [major, minor + 1, 0] : [major + 1, 0, 0];
+            return { kind: 'tilde', key, upper: bound(upper), upperInclusive: false };
+        }
+        if (!op || op === '=' || op === '==') {
+            return { kind: 'exact', key, upper: key, upperInclusive: true };
+        }
+        if (op === '>' || op === '>=') {
+            return { kind: 'range', key, upper: null, upperInclusive: false };
+        }
+        return { kind: 'range', key: null, upper: key, upperInclusive: op === '<=' };
+    }
+    
+    // Range made of comparators (">=1.0.0,<2.0.0", ">=1.2 <2")
+    const comparators = [...raw.matchAll(RANGE_COMPARATOR_PATTERN)];
+    if (comparators.length && !raw.replace(RANGE_COMPARATOR_PATTERN, '').replace(/^[ ,]+|[ ,]+$/g, '')) {
+        let lower = null;
+        let upper = null;
+        let upperInclusive = false;
+        for (const [, op, version] of comparators) {
+            const bound = parseVersionSpec(version);
+            if (bound.kind !== 'exact') return { kind: 'unknown' };
+            if ((op === '>' || op === '>=') && (!lower || compareVersionKeys(bound.key, lower) > 0)) {
+                lower = bound.key;
+            } else if ((op === '<' || op === '<=') && (!upper || compareVersionKeys(bound.key, upper) < 0)) {
+                upper = bound.key;
+                upperInclusive = op === '<=';
+            } else if (op === '=' || op === '==') {
+                lower = upper = bound.key;
+                upperInclusive = true;
+            }
+        }
+        return { kind: 'range', key: lower, upper, upperInclusive };
+    }
+    return { kind: 'unknown' };
+}
+
+// True if the latest release is beyond what the spec accepts; null when it cannot be told
+function versionBehind(spec, latest) {
+    if (spec.kind === 'unknown' || latest.kind !== 'exact') return null;
+    if (!spec.upper) return false;
+    const order = compareVersionKeys(latest.key, spec.upper);
+    return spec.upperInclusive ? order > 0 : order >= 0;
+}
+
+// Same rules as ReportBundle.version_status in the analyzer
+function computeVersionStatus(version, latestVersion) {
+    if (!version || !latestVersion) return 'unknown';
+    let behind = versionBehind(parseVersionSpec(version), parseVersionSpec(latestVersion));
+    if (behind === null) {
+        behind = version.replace(/^v+/, '') !== latestVersion.replace(/^v+/, '');
+    }
+    return behind ? 'outdated' : 'current';
+}
+
+// Function to get version status (bundles bring it precomputed)
+function getVersionStatus(version, latestVersion, status) {
+    status = status || computeVersionStatus(version, latestVersion);
+    
+    if (status === 'unknown') {
         return {
             status: 'unknown',
             badge: '<span class="version-badge version-unknown">Necunoscută</span>'
         };
     }
     
-    if (version === latestVersion) {
+    if (status === 'current') {
         return {
             status: 'current',
             badge: '<span class="version-badge version-current">Actualizată</span>'
@@ -310,7 +717,7 @@ function getVersionStatus(version, latestVersion) {
 function showLibraryDetails(lib) {
     modalTitle.textContent = lib.name || 'Detalii Bibliotecă';
     
-    const versionStatus = getVersionStatus(lib.version, lib.latest_version);
+    const versionStatus = getVersionStatus(lib.version, lib.latest_version, lib.status);
     
     let githubLink = '';
     if (lib.github_url) {
@@ -326,7 +733,14 @@ function showLibraryDetails(lib) {
         homepageLink = 'N/A';
     }
     
-    const files = lib.files_found_in ? lib.files_found_in.split(',').map(file => file.trim()) : [];
+    const files = getLibraryFiles(lib);
+    const projects = Array.isArray(lib.projects) && lib.projects.length > 0
+        ? `
+            <div class="info-item">
+                <span class="info-label">Proiecte:</span>
+                <span>${lib.projects.join(', ')}</span>
+            </div>`
+        : '';
     
     modalContent.innerHTML = `
         <div class="modal-section">
@@ -347,7 +761,7 @@ function showLibraryDetails(lib) {
             <div class="info-item">
                 <span class="info-label">Sursă:</span>
                 <span>${lib.source || 'N/A'}</span>
-            </div>
+            </div>${projects}
         </div>
         
         <div class="modal-section">
@@ -376,4 +790,12 @@ function showLibraryDetails(lib) {
     `;
     
     detailModal.classList.remove('hidden');
-}
\ No newline at end of file
+}
+
+// Function to get the files of a library (bundle records reference the shared file table)
+function getLibraryFiles(lib) {
+    if (Array.isArray(lib.files)) {
+        return lib.files.map(fileId => bundleFiles[fileId]);
+    }
+    return lib.files_found_in ? lib.files_found_in.split(',').map(file => file.trim()) : [];
+}
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Scriptul analizorului se află în rădăcina depozitului, nu într-un pachet instalat
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,82 @@
+"""Teste pentru versiunile PlatformIO și pentru compararea rapoartelor (`drift`)."""
+import os
+
+import pytest
+
+from analiza_bibliotecilor_Arduino_PlatformIO import ReportTable, library_identity, parse_version_spec
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+VERSION_CASES = [
+    # (id, specificație, tip așteptat, ultima versiune publicată, rămasă în urmă)
+    ("exact_la_zi", "1.2.3", "exact", "1.2.3", False),
+    ("exact_in_urma", "1.2.3", "exact", "1.2.4", True),
+    ("prefix_v", "v1.2", "exact", "1.2.0", False),
+    ("caret_admite", "^6.21.0", "caret", "6.99.0", False),
+    ("caret_major_nou", "^6.21.0", "caret", "7.0.0", True),
+    ("caret_zero_minor", "^0.2.3", "caret", "0.2.9", False),
+    ("caret_zero_minor_nou", "^0.2.3", "caret", "0.3.0", True),
+    ("caret_zero_zero", "^0.0.3", "caret", "0.0.4", True),
+    ("tilde_admite", "~1.2.3", "tilde", "1.2.9", False),
+    ("tilde_minor_nou", "~1.2.3", "tilde", "1.3.0", True),
+    ("tilde_doar_major", "~1", "tilde", "1.9", False),
+    ("interval_admite", ">=1.0,<2", "range", "1.9.9", False),
+    ("interval_depasit", ">=1.0,<2", "range", "2.0.0", True),
+    ("interval_inclusiv", ">=1.2 <=2.0", "range", "2.0.0", False),
+    ("doar_minim", ">1.0", "range", "9.0", False),
+    ("orice", "*", "any", "1.0.0", False),
+    ("pre_release", "1.0.0-beta.2", "exact", "1.0.0", True),
+    ("pre_release_numeric", "1.0.0-beta.2", "exact", "1.0.0-beta.10", True),
+    ("data_numerica", "20230101", "exact", "20230102", True),
+    ("doar_cifre_nu_e_hash", "1234567", "exact", "1234567", False),
+    ("hash_git", "abc1234", "unknown", "1.0.0", None),
+    ("ramura_git", "feature/x", "unknown", "1.0.0", None),
+    ("ultima_nu_e_exacta", "1.0.0", "exact", "^1.0", None),
+]
+
+
+@pytest.mark.parametrize("spec, kind, latest, behind", [case[1:] for case in VERSION_CASES],
+                         ids=[case[0] for case in VERSION_CASES])
+def test_version_spec(spec, kind, latest, behind):
+    parsed = parse_version_spec(spec)
+    assert parsed.kind == kind
+    assert parsed.behind(parse_version_spec(latest)) == behind
+
+
+IDENTITY_CASES = [
+    # (id, rânduri (nume, URL GitHub) dintr-un raport, numărul de biblioteci distincte)
+    ("acelasi_repo_nume_diferite", [("Foo", "https://github.com/o/mono"), ("Bar", "https://github.com/o/mono")], 2),
+    ("acelasi_nume_forme_diferite", [("o/Foo", "https://github.com/o/Foo"), ("Foo.h", "git@github.com:o/foo.git")], 1),
+    ("fara_url_acelasi_nume", [("Foo", "https://github.com/o/Foo"), ("Foo.h", "")], 1),
+    ("fara_url_nume_diferit", [("Bar", "https://github.com/o/Foo"), ("Foo", "")], 2),
+    ("fara_url_nume_ambiguu", [("Foo", "https://github.com/a/Foo"), ("Foo", "https://github.com/b/Foo"),
+                               ("Foo", "")], 3),
+    ("majuscule_diferite", [("LittleFS.h", "https://github.com/o/w"), ("LITTLEFS.h", "https://github.com/o/w")], 2),
+]
+
+
+@pytest.mark.parametrize("rows, expected", [case[1:] for case in IDENTITY_CASES],
+                         ids=[case[0] for case in IDENTITY_CASES])
+def test_library_identity(tmp_path, rows, expected):
+    report = tmp_path / "report.csv"
+    lines = ["name,version,latest_version,github_url"] + [f"{name},1.0,,{url}" for name, url in rows]
+    report.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    table = ReportTable()
+    table.load(str(report))
+    table.build_index()
+    assert [len(snapshot) for snapshot in table.snapshots.values()] == [expected]
+
+
+def test_identity_keeps_repo_and_name():
+    assert library_identity("owner/Foo.h", "https://github.com/Owner/Mono/tree/main") == "github:owner/mono:Foo"
+    assert library_identity("Foo", "") == "name:Foo"
+
+
+@pytest.mark.parametrize("report, rows", [("wled_libraries.csv", 278), ("marauder_libraries.csv", 159)])
+def test_reports_keep_their_libraries(report, rows):
+    """Bibliotecile diferite dintr-un repo comun (de ex. headerele din WLED) nu sunt combinate."""
+    table = ReportTable()
+    assert table.load(os.path.join(REPO_ROOT, report)) == rows
+    table.build_index()
+    assert [len(snapshot) for snapshot in table.snapshots.values()] == [rows]
@@ -0,0 +1,155 @@
+"""Teste pentru clientul GitHub, rulat față de un server HTTP local."""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from analiza_bibliotecilor_Arduino_PlatformIO import GitHubClient, HttpCache, LibraryAnalyzer
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Răspunde cu `server.script[cale]` (o listă consumată în ordine) sau cu 200 și un ETag fix."""
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests.append((self.path, dict(self.headers)))
+            script = server.script.get(self.path)
+            scripted = script.pop(0) if script else None
+        if scripted is not None:
+            status, headers, body = scripted
+        else:
+            etag = f'"{self.path}"'
+            if self.headers.get("If-None-Match") == etag:
+                status, headers, body = 304, {"ETag": etag}, None
+            else:
+                body = [{"tag_name": "v1.0.0"}] if "/releases" in self.path else {"description": self.path}
+                status, headers = 200, {"ETag": etag}
+        data = json.dumps(body).encode() if body is not None else b""
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+@pytest.fixture
+def stub():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.requests = []
+    server.script = {}
+    server.url = f"http://127.0.0.1:{server.server_address[1]}"
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def http_cache(tmp_path):
+    caches = []
+
+    def make(ttl=3600):
+        cache = HttpCache(str(tmp_path / "http.sqlite"), ttl=ttl)
+        caches.append(cache)
+        return cache
+
+    yield make
+    for cache in caches:
+        cache.close()
+
+
+def test_retry_after_blocks_and_retries(stub):
+    stub.script["/repos/o/r"] = [(403, {"Retry-After": "1"}, {})]
+    client = GitHubClient(api_url=stub.url)
+    start = time.monotonic()
+    response = client.get("repos/o/r")
+    assert response.status_code == 200
+    assert time.monotonic() - start >= 0.9
+    assert client.rate_limiter.waits == 1
+    assert client.requests_made == 2
+
+
+def test_rate_limit_reset_blocks_until_reset(stub):
+    reset = str(int(time.time()) + 1)
+    stub.script["/repos/o/r"] = [(403, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": reset}, {})]
+    client = GitHubClient(api_url=stub.url)
+    response = client.get("repos/o/r")
+    assert response.status_code == 200
+    assert client.rate_limiter.waits == 1
+    assert time.time() >= int(reset)
+
+
+def test_reset_beyond_max_wait_gives_up(stub):
+    reset = str(int(time.time()) + 7200)
+    stub.script["/repos/o/r"] = [(403, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": reset}, {})]
+    client = GitHubClient(api_url=stub.url, max_wait=60)
+    with pytest.raises(RuntimeError):
+        client.get("repos/o/r")
+    # Pauza rămâne activă și pentru cererile următoare, fără a mai contacta serverul
+    with pytest.raises(RuntimeError):
+        client.get("repos/o/other")
+    assert client.requests_made == 1
+
+
+def test_fresh_entry_is_served_from_cache(stub, http_cache):
+    cache = http_cache(ttl=3600)
+    client = GitHubClient(api_url=stub.url, http_cache=cache)
+    first = client.get("repos/o/r").json()
+    second = client.get("repos/o/r").json()
+    assert first == second
+    assert client.requests_made == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_expired_entry_is_revalidated_with_etag(stub, http_cache):
+    cache = http_cache(ttl=0.1)
+    client = GitHubClient(api_url=stub.url, http_cache=cache)
+    first = client.get("repos/o/r").json()
+    time.sleep(0.2)
+    second = client.get("repos/o/r").json()
+    assert first == second
+    assert client.requests_made == 2
+    assert stub.requests[1][1].get("If-None-Match") == '"/repos/o/r"'
+    assert cache.revalidated == 1
+
+
+def test_offline_uses_cache_only(stub, http_cache):
+    cache = http_cache(ttl=0)
+    GitHubClient(api_url=stub.url, http_cache=cache).get("repos/o/r")
+    offline = GitHubClient(api_url=stub.url, http_cache=cache, offline=True)
+    # Intrarea expirată este folosită oricum, fără cereri
+    assert offline.get("repos/o/r").json() == {"description": "/repos/o/r"}
+    with pytest.raises(RuntimeError):
+        offline.get("repos/o/missing")
+    assert offline.requests_made == 0
+    assert len(stub.requests) == 1
+
+
+def test_concurrent_fetch_counts_every_request(stub):
+    client = GitHubClient(api_url=stub.url, concurrency=16)
+    keys = [f"o/r{i}" for i in range(40)]
+    results = client.fetch_repos(keys)
+    assert set(results) == set(keys)
+    assert results["o/r0"]["latest_version"] == "1.0.0"
+    assert client.requests_made == len(stub.requests) == 2 * len(keys)
+
+
+def test_failure_is_reported_once_across_updates(stub, tmp_path, capsys):
+    stub.script["/repos/o/missing"] = [(404, {}, {"message": "Not Found"})]
+    analyzer = LibraryAnalyzer(str(tmp_path), str(tmp_path / "out.csv"),
+                               github_client=GitHubClient(api_url=stub.url))
+    analyzer.libraries["Missing"].github_url = "https://github.com/o/missing"
+    # Modul watch reia îmbogățirea la fiecare actualizare; eșecul memorat apare o singură dată
+    analyzer.enrich_with_github_data()
+    analyzer.enrich_with_github_data()
+    assert capsys.readouterr().out.count("Missing") == 1
+    assert analyzer.metrics.error_counts["github"] == 1
@@ -0,0 +1,83 @@
+"""Teste pentru inventarul fișierelor proiectului (`ProjectInventory`)."""
+import io
+import os
+import tarfile
+import zipfile
+
+import pytest
+
+from analiza_bibliotecilor_Arduino_PlatformIO import ProjectInventory, archive_project_root, read_file_bytes
+
+
+def test_unreadable_gitignore_is_recorded(tmp_path, capsys):
+    """Un .gitignore care nu poate fi citit apare în erori, nu doar pe ecran."""
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "main.cpp").write_text("#include <A.h>\n")
+    # Un director cu numele .gitignore face `open` să ridice OSError
+    (tmp_path / ".gitignore").mkdir()
+    inventory = ProjectInventory.build(str(tmp_path), respect_gitignore=True)
+    assert [(kind, path) for kind, path, _ in inventory.errors] == [
+        ("read", os.path.join(str(tmp_path), ".gitignore")),
+    ]
+    assert "Eroare la citirea" in capsys.readouterr().out
+
+
+def write_tree(root, files):
+    for name, data in files.items():
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+
+
+def pack(archive_path, files):
+    """Scrie `files` ({nume: octeți}) într-o arhivă zip sau tar, după extensie."""
+    if archive_path.endswith(".zip"):
+        with zipfile.ZipFile(archive_path, "w") as z:
+            for name, data in files.items():
+                z.writestr(name, data)
+        return
+    with tarfile.open(archive_path, "w:gz") as tar:
+        for name, data in files.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+
+
+NESTED_CASES = [
+    # (id, extensia proiectului arhivat, extensia bibliotecii din .pio/libdeps)
+    ("zip_in_zip", ".zip", ".zip"),
+    ("zip_in_tar", ".tar.gz", ".zip"),
+    ("tar_in_zip", ".zip", ".tar.gz"),
+]
+
+
+@pytest.mark.parametrize("project_ext, library_ext", [case[1:] for case in NESTED_CASES],
+                         ids=[case[0] for case in NESTED_CASES])
+def test_archives_inside_archived_project(tmp_path, project_ext, library_ext):
+    """Arhivele din proiectul arhivat sunt citite ca în proiectul extras."""
+    library = str(tmp_path / ("Bar" + library_ext))
+    pack(library, {"Bar/library.properties": b"name=Bar\nversion=3.1\n", "Bar/src/Bar.h": b"#pragma once\n"})
+    with open(library, "rb") as f:
+        files = {
+            "p/src/main.cpp": b"#include <Bar.h>\n",
+            "p/.pio/libdeps/esp32/Bar" + library_ext: f.read(),
+        }
+    write_tree(tmp_path / "extracted", files)
+    project = str(tmp_path / ("p" + project_ext))
+    pack(project, files)
+    
+    def relative(inventory, root):
+        sources = [os.path.relpath(path, root) for path in inventory.sources]
+        manifests = [(name, os.path.relpath(path, root)) for name, path in inventory.manifests]
+        return sources, manifests
+    
+    expected = relative(ProjectInventory.build(str(tmp_path / "extracted" / "p")), str(tmp_path / "extracted" / "p"))
+    root = archive_project_root(project)
+    inventory = ProjectInventory.build(root)
+    assert relative(inventory, root) == expected
+    assert inventory.errors == []
+    manifest_path = inventory.manifests[0][1]
+    assert read_file_bytes(manifest_path).startswith(b"name=Bar")
+    
+    skipped = ProjectInventory.build(root, scan_archives=False)
+    assert skipped.manifests == []
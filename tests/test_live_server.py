@@ -0,0 +1,36 @@
+"""Teste pentru serverul modului watch (`LiveReportServer`)."""
+import threading
+import urllib.request
+
+import pytest
+
+from analiza_bibliotecilor_Arduino_PlatformIO import LiveReportServer
+
+
+ORIGIN_CASES = [
+    # (id, antetul Origin trimis, Access-Control-Allow-Origin așteptat)
+    ("fisier_local", "null", "null"),
+    ("origine_configurata", "http://localhost:8000", "http://localhost:8000"),
+    ("alt_site", "https://example.com", None),
+    ("fara_origine", None, None),
+]
+
+
+@pytest.fixture
+def live_server():
+    server = LiveReportServer(("127.0.0.1", 0), allowed_origins=["http://localhost:8000/"])
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.parametrize("origin, expected", [case[1:] for case in ORIGIN_CASES],
+                         ids=[case[0] for case in ORIGIN_CASES])
+def test_cors_origin(live_server, origin, expected):
+    request = urllib.request.Request(f"http://127.0.0.1:{live_server.server_address[1]}/libraries")
+    if origin is not None:
+        request.add_header("Origin", origin)
+    with urllib.request.urlopen(request) as response:
+        assert response.headers.get("Access-Control-Allow-Origin") == expected
+        assert response.headers.get("Vary") == "Origin"
@@ -0,0 +1,90 @@
+"""Teste pentru rezolvarea platformio.ini (`PlatformIOConfig`)."""
+import os
+
+import pytest
+
+from analiza_bibliotecilor_Arduino_PlatformIO import PlatformIOConfig
+
+
+LIB_DEPS_CASES = [
+    # (id, fișiere {nume: conținut}, mediu, lib_deps așteptate)
+    ("simplu", {"platformio.ini": "[env:a]\nlib_deps = A, B\n"}, "a", ["A", "B"]),
+    ("multilinie", {"platformio.ini": "[env:a]\nlib_deps =\n  A ; comentariu\n  # dezactivat\n  B@1.0\n"},
+     "a", ["A", "B@1.0"]),
+    ("env_comun", {"platformio.ini": "[env]\nlib_deps = Common\n[env:a]\nboard = x\n"}, "a", ["Common"]),
+    ("extends", {"platformio.ini": "[base]\nlib_deps = A\n[env:a]\nextends = base\n"}, "a", ["A"]),
+    ("extends_lant", {"platformio.ini": (
+        "[common]\nlib_deps = C\n[base]\nextends = common\n[env:a]\nextends = base\n"
+    )}, "a", ["C"]),
+    ("extends_inainte_de_env", {"platformio.ini": (
+        "[env]\nlib_deps = Common\n[base]\nlib_deps = Base\n[env:a]\nextends = base\n"
+    )}, "a", ["Base"]),
+    ("extends_ciclu", {"platformio.ini": (
+        "[x]\nextends = y\nlib_deps = X\n[y]\nextends = x\n[env:a]\nextends = y\n"
+    )}, "a", ["X"]),
+    ("extends_env_parinte", {"platformio.ini": (
+        "[env:base]\nlib_deps = B\n[env:a]\nextends = env:base\n"
+    )}, "a", ["B"]),
+    ("interpolare", {"platformio.ini": (
+        "[common]\nlibs = A\n  B\n[env:a]\nlib_deps = ${common.libs}\n  C\n"
+    )}, "a", ["A", "B", "C"]),
+    ("interpolare_mostenita", {"platformio.ini": (
+        "[env]\nlib_deps = ${this.extra}\n[env:a]\nextra = E\n"
+    )}, "a", ["E"]),
+    ("this_env", {"platformio.ini": "[env:esp32]\nlib_deps = Lib-${this.__env__}\n"}, "esp32", ["Lib-esp32"]),
+    ("sysenv", {"platformio.ini": "[env:a]\nlib_deps = ${sysenv.MY_LIB}, ${sysenv.MISSING}X\n"},
+     "a", ["FromEnv", "X"]),
+    ("extra_configs", {
+        "platformio.ini": "[platformio]\nextra_configs = extra/*.ini\n[env:a]\nlib_deps = A\n",
+        "extra/override.ini": "[env:a]\nlib_deps = Override\n",
+    }, "a", ["Override"]),
+    ("extra_configs_imbricat", {
+        "platformio.ini": "[platformio]\nextra_configs = one.ini\n[env:a]\nlib_deps = A\n",
+        "one.ini": "[platformio]\nextra_configs = two.ini\n[env:a]\nlib_deps = One\n",
+        "two.ini": "[env:a]\nlib_deps = Two\n",
+    }, "a", ["Two"]),
+    ("extra_configs_ciclu", {
+        "platformio.ini": "[platformio]\nextra_configs = *.ini\n[env:a]\nlib_deps = A\n",
+        "override.ini": "[platformio]\nextra_configs = platformio.ini\n[env:a]\nlib_deps = Override\n",
+    }, "a", ["Override"]),
+]
+
+CYCLE_CASES = [
+    ("interpolare_ciclu", "[env:a]\nlib_deps = ${env:a.other}\nother = ${env:a.lib_deps}\n"),
+    ("this_ciclu", "[env:a]\nlib_deps = ${this.lib_deps}\n"),
+    ("ciclu_intre_sectiuni", "[x]\nv = ${y.v}\n[y]\nv = ${x.v}\n[env:a]\nlib_deps = ${x.v}\n"),
+]
+
+
+def write_project(root, files):
+    for name, content in files.items():
+        path = os.path.join(root, *name.split("/"))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
+    return os.path.join(root, "platformio.ini")
+
+
+@pytest.mark.parametrize("files, environment, expected",
+                         [case[1:] for case in LIB_DEPS_CASES], ids=[case[0] for case in LIB_DEPS_CASES])
+def test_lib_deps(tmp_path, files, environment, expected):
+    config = PlatformIOConfig(write_project(str(tmp_path), files), environ={"MY_LIB": "FromEnv"})
+    assert config.lib_deps(environment) == expected
+
+
+@pytest.mark.parametrize("content", [case[1] for case in CYCLE_CASES], ids=[case[0] for case in CYCLE_CASES])
+def test_interpolation_cycles_are_reported(tmp_path, content):
+    config = PlatformIOConfig(write_project(str(tmp_path), {"platformio.ini": content}))
+    with pytest.raises(ValueError):
+        config.lib_deps("a")
+
+
+def test_extra_configs_are_listed_once(tmp_path):
+    ini_path = write_project(str(tmp_path), {
+        "platformio.ini": "[platformio]\nextra_configs = *.ini\n[env:a]\nlib_deps = A\n",
+        "b.ini": "[platformio]\nextra_configs = a.ini\n",
+        "a.ini": "[env:b]\nlib_deps = B\n",
+    })
+    config = PlatformIOConfig(ini_path)
+    assert [os.path.basename(path) for path in config.extra_configs] == ["a.ini", "b.ini"]
+    assert config.environments() == ["a", "b"]
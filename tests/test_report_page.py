@@ -0,0 +1,175 @@
+"""Teste pentru citirea rezultatelor în pagina raportului (raport_tehnic.js), rulate cu Node.js."""
+import csv
+import json
+import os
+import re
+import shutil
+import subprocess
+
+import pytest
+
+from analiza_bibliotecilor_Arduino_PlatformIO import CsvWriter, LibraryRecord, PathTable, ReportBundle
+
+PAGE_SCRIPT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "raport_tehnic.js")
+
+# Încarcă funcțiile de nivel superior ale paginii (și constantele care nu folosesc DOM-ul)
+# și aplică funcția cerută argumentelor primite în JSON; mulțimile sunt întoarse ca liste sortate
+NODE_RUNNER = r"""
+const fs = require('fs');
+// Depozitul poate avea fișiere cu CRLF; expresiile de mai jos presupun LF
+const source = fs.readFileSync(process.argv[1], 'utf8').replace(/\r\n/g, '\n');
+const name = process.argv[2];
+const constants = source.match(/^const \w+ = (?!document).*;$/gm) || [];
+const functions = source.match(/\n(?:async )?function \w+\([\s\S]*?\n}\n/g) || [];
+const fn = new Function(constants.join('\n') + functions.join('') + '\nreturn ' + name + ';')();
+const args = JSON.parse(fs.readFileSync(0, 'utf8'));
+const result = fn(...args);
+process.stdout.write(JSON.stringify(result, (key, value) => (
+    value instanceof Set ? [...value].sort((a, b) => a - b) : value
+)));
+"""
+
+pytestmark = pytest.mark.skipif(shutil.which("node") is None, reason="Node.js nu este instalat")
+
+
+def call_page_function(name, *args):
+    completed = subprocess.run(
+        ["node", "-e", NODE_RUNNER, PAGE_SCRIPT, name],
+        input=json.dumps(args), capture_output=True, text=True, check=True,
+    )
+    return json.loads(completed.stdout)
+
+
+def test_csv_with_multiple_environments(tmp_path):
+    paths = PathTable()
+    record = LibraryRecord(
+        name="ArduinoJson", version="^6.21.0", description='JSON, "rapid"\nși compact',
+        source="platformio_ini", environments={"esp32", "esp8266", "d1_mini"},
+        file_ids={paths.intern("src/a.cpp"), paths.intern("src/b, c.cpp")},
+    )
+    other = LibraryRecord(name="OneWire", source="code", environments={"esp32"})
+    output_file = str(tmp_path / "libraries.csv")
+    CsvWriter(output_file).write([("ArduinoJson", record), ("OneWire", other)], paths)
+    
+    with open(output_file, "r", encoding="utf-8", newline="") as f:
+        text = f.read()
+    expected = list(csv.reader(text.splitlines(keepends=True)))
+    records = call_page_function("parseCSVRecords", text)
+    assert records == expected
+    header = records[0]
+    row = dict(zip(header, records[1]))
+    assert all(len(fields) == len(header) for fields in records)
+    assert row["environments"] == "d1_mini, esp32, esp8266"
+    assert row["files_found_in"] == "src/a.cpp, src/b, c.cpp"
+    assert row["description"] == 'JSON, "rapid"\nși compact'
+
+
+PARITY_RECORDS = [
+    # (nume, câmpuri); același nume și același repo (în altă formă) sunt aceeași bibliotecă
+    ("ArduinoJson", {"github_url": "https://github.com/bblanchon/ArduinoJson", "author": "Benoit",
+                     "environments": {"esp32"}, "files": ["src/a.cpp"]}),
+    ("arduinojson", {"github_url": "git@github.com:bblanchon/ArduinoJson.git", "version": "^6.21.0",
+                     "environments": {"esp8266"}, "files": ["src/b.cpp"]}),
+    ("ArduinoJson", {"version": "7.0.0", "files": ["lib/c.h"]}),
+    ("OneWire", {"source": "code", "files": ["src/a.cpp"]}),
+    ("Adafruit GFX", {"github_url": "https://github.com/adafruit/Adafruit-GFX-Library", "author": "Ștefan"}),
+    ("Adafruit GFX", {"github_url": "https://github.com/fork/Adafruit-GFX-Library", "author": "Sandu"}),
+    ("Ăsta_Lib", {"description": "Bibliotecă de test", "homepage": "https://example.com/asta"}),
+    ("abc", {"author": "zed", "source": "library_json", "environments": {"d1_mini"}}),
+    ("Zeta", {"author": "Álvaro", "source": "platformio_ini"}),
+]
+
+SEARCH_TERMS = ["arduino", "json 6.21", "esp8266", "stefan", "ștefan", "asta_lib", "example", "d1", "nimic",
+                "gfx fork"]
+
+
+def test_csv_and_bundle_show_the_same_libraries(tmp_path):
+    """Pagina aplică datelor CSV aceleași reguli ca pachetul: deduplicare, sortare și căutare."""
+    paths = PathTable()
+    records = []
+    for name, fields in PARITY_RECORDS:
+        fields = dict(fields)
+        file_ids = {paths.intern(path) for path in fields.pop("files", [])}
+        records.append((name, LibraryRecord(name=name, file_ids=file_ids, **fields)))
+    output_file = str(tmp_path / "libraries.csv")
+    CsvWriter(output_file).write(records, paths)
+    bundle = ReportBundle()
+    for name, record in records:
+        bundle.add(name, record, paths)
+    data = bundle.to_dict()
+    
+    with open(output_file, "r", encoding="utf-8", newline="") as f:
+        header, *rows = csv.reader(f)
+    libraries = call_page_function("dedupeLibraries", [dict(zip(header, row)) for row in rows])
+    assert len(libraries) == data["stats"]["unique"] == 8
+    
+    bundle_names = [record[0] for record in data["records"]]
+    for sort_key in ReportBundle.SORT_KEYS:
+        page_order = call_page_function("buildSortOrder", libraries, sort_key)
+        assert [libraries[i]["name"] for i in page_order] == \
+            [bundle_names[i] for i in data["sort"][sort_key]], sort_key
+    
+    page_index = call_page_function("buildSearchIndex", libraries)
+    assert page_index["tokens"] == data["search"]["tokens"]
+    for term in SEARCH_TERMS:
+        page_matches = call_page_function("searchTokenIndex", page_index, term.lower())
+        bundle_matches = call_page_function("searchTokenIndex", data["search"], term.lower())
+        assert sorted(libraries[i]["name"] for i in page_matches) == \
+            sorted(bundle_names[i] for i in bundle_matches), term
+
+
+def test_page_search_fields_match_bundle():
+    with open(PAGE_SCRIPT, "r", encoding="utf-8") as f:
+        source = f.read()
+    match = re.search(r"^const SEARCH_FIELDS = \[(.*)\];$", source, re.M)
+    assert tuple(re.findall(r"'(\w+)'", match.group(1))) == ReportBundle.SEARCH_FIELDS
+
+
+SEARCH_CASES = [
+    # (id, termen căutat, bibliotecile găsite); cuvintele care încep cu termenul au prioritate
+    ("prefix", "one", ["OneWire"]),
+    ("prefix_inainte_de_subsir", "wire", ["Wire", "WireKit"]),
+    ("subsir_fara_prefix", "ire", ["OneWire", "Wire", "WireKit"]),
+    ("mai_multe_cuvinte", "wire kit", ["WireKit"]),
+    ("mai_multe_campuri", "one maxim", ["OneWire"]),
+    ("cuvant_dupa_ultimul", "zz", []),
+    ("doar_semne", "--", None),
+]
+
+
+@pytest.mark.parametrize("term, expected", [case[1:] for case in SEARCH_CASES],
+                         ids=[case[0] for case in SEARCH_CASES])
+def test_search_prefix_with_substring_fallback(term, expected):
+    libraries = [
+        {"name": "OneWire", "author": "Maxim"},
+        {"name": "Wire"},
+        {"name": "WireKit", "description": "Kit"},
+    ]
+    index = call_page_function("buildSearchIndex", libraries)
+    matches = call_page_function("searchTokenIndex", index, term)
+    if expected is None:
+        assert matches is None
+    else:
+        assert [libraries[i]["name"] for i in matches] == expected
+
+
+STATUS_CASES = [
+    # (id, versiune, ultima versiune, starea afișată)
+    ("caret_la_zi", "^6.21.0", "6.21.5", "current"),
+    ("caret_in_urma", "^6.21.0", "7.0.0", "outdated"),
+    ("tilde_in_urma", "~1.2", "1.3.0", "outdated"),
+    ("interval_la_zi", ">=1.0,<2", "1.5", "current"),
+    ("prefix_v", "v2.0", "2.0.0", "current"),
+    ("data_numerica", "20230101", "20230102", "outdated"),
+    ("hash_identic", "abc1234", "abc1234", "current"),
+    ("hash_diferit", "abc1234", "1.0.0", "outdated"),
+    ("fara_ultima", "1.0.0", "", "unknown"),
+    ("fara_versiune", "", "1.0.0", "unknown"),
+]
+
+
+@pytest.mark.parametrize("version, latest, expected", [case[1:] for case in STATUS_CASES],
+                         ids=[case[0] for case in STATUS_CASES])
+def test_version_status_matches_page(version, latest, expected):
+    assert ReportBundle.version_status(version, latest) == expected
+    assert call_page_function("computeVersionStatus", version, latest) == expected
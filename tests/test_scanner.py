@@ -0,0 +1,57 @@
+"""Teste pentru scanerul de surse (`scan_source_bytes`)."""
+import pytest
+
+from analiza_bibliotecilor_Arduino_PlatformIO import scan_source_bytes
+
+
+INCLUDE_CASES = [
+    # (sursă, include-uri așteptate)
+    (b'#include <a.h>\n#include "b/c.h"\n', ["a.h", "b/c.h"]),
+    (b'  #  include <a.h>\n', ["a.h"]),
+    (b'#if 0\n#include <a.h>\n#endif\n#include <b.h>\n', ["b.h"]),
+    (b'#if 0\n#include <a.h>\n#else\n#include <b.h>\n#endif\n', ["b.h"]),
+    (b'#if 1\n#include <a.h>\n#else\n#include <b.h>\n#endif\n', ["a.h"]),
+    (b'#if 0\n#include <a.h>\n#elif defined(X)\n#include <b.h>\n#endif\n', ["b.h"]),
+    (b'#if false\n#include <a.h>\n#endif\n', []),
+    # Blocurile imbricate într-un `#if 0` rămân inactive, inclusiv ramurile lor `#else`
+    (b'#if 0\n#ifdef X\n#include <a.h>\n#else\n#include <b.h>\n#endif\n#include <c.h>\n#endif\n#include <d.h>\n',
+     ["d.h"]),
+    (b'#ifdef X\n#if 0\n#include <a.h>\n#endif\n#include <b.h>\n#else\n#include <c.h>\n#endif\n',
+     ["b.h", "c.h"]),
+    (b'#if 0 // dezactivat\n#include <a.h>\n#endif\n#include <b.h>\n', ["b.h"]),
+    # Directivele din comentarii și șiruri nu contează
+    (b'// #include <a.h>\n#include <b.h>\n', ["b.h"]),
+    (b'/* #include <a.h>\n#include <b.h> */\n#include <c.h>\n', ["c.h"]),
+    (b'const char *s = "#include <a.h>";\n#include <b.h>\n', ["b.h"]),
+    (b'const char *s = "/* \\" //";\n#include <a.h>\n', ["a.h"]),
+    (b"char c = '\"';\n#include <a.h>\n", ["a.h"]),
+    (b'x = 1; #include <a.h>\n', []),
+    # Un comentariu deschis pe linia unei directive ascunde liniile următoare
+    (b'#include <a.h> /* start\n#include <b.h>\n*/\n#include <c.h>\n', ["a.h", "c.h"]),
+    (b'#include "x/y.h" // comentariu\n', ["x/y.h"]),
+    (b'/* neinchis\n#include <a.h>\n', []),
+]
+
+
+@pytest.mark.parametrize("source, expected", INCLUDE_CASES)
+def test_includes(source, expected):
+    assert scan_source_bytes(source)["includes"] == expected
+
+
+METADATA_CASES = [
+    # (sursă, câmp, valoare așteptată)
+    (b'#define FOO_VERSION "1.2.3"\n', "versions", [("FOO_VERSION", "1.2.3")]),
+    (b'#define VERSION_MAJOR 4 /* x */\n', "versions", [("VERSION_MAJOR", "4")]),
+    (b'#if 0\n#define FOO_VERSION "1.0"\n#endif\n', "versions", []),
+    (b'#define LIB_URL "https://github.com/o/r" // link\n', "github", "o/r"),
+    (b'// vezi github.com/owner/repo\n', "github", "owner/repo"),
+    (b'#if 0\n// github.com/a/b\n#endif\n', "github", ""),
+    (b'/**\n * Biblioteca de test\n * @author Ana Pop\n */\n', "description", "Biblioteca de test"),
+    (b'/**\n * Biblioteca de test\n * @author Ana Pop\n */\n', "author", "Ana Pop"),
+    (b'// @author Ion\n', "author", "Ion"),
+]
+
+
+@pytest.mark.parametrize("source, key, expected", METADATA_CASES)
+def test_metadata(source, key, expected):
+    assert scan_source_bytes(source)[key] == expected